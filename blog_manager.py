@@ -9,141 +9,264 @@ import os
 import sys
 import subprocess
 import re
+import time
 import argparse
+import functools
 from datetime import datetime
 from pathlib import Path
 from color_utils import print_error, print_success, print_warning, print_info, print_progress, colored_print, MessageType
 from rich.console import Console
 from rich.panel import Panel
 from rich.text import Text
-from rich.align import Align
-from rich.columns import Columns
-from rich.tree import Tree
-from rich.table import Table
-from rich.progress import Progress, SpinnerColumn, TextColumn, BarColumn, TimeElapsedColumn
-from rich.rule import Rule
-from rich.status import Status
-from rich.layout import Layout
 from rich import box
-import psutil
 import platform
 
+# 进程生命周期内不变，启动时取一次（platform.machine在部分平台会fork子进程）
+_PLATFORM_SYSTEM = platform.system()
+_PLATFORM_MACHINE = platform.machine()
+_PLATFORM_INFO = f"{_PLATFORM_SYSTEM} {_PLATFORM_MACHINE}"
+_PYTHON_VERSION = platform.python_version()
+
+# 重量级Rich子模块（Progress/Table/Tree等）和psutil按需在方法内导入，
+# 让 `new` 等不渲染UI的子命令省掉这部分启动开销
+
+
+# 扩展名分类表 - 每个文件一次splitext+一次哈希查找，
+# 替代逐扩展名的 `any(ext in filepath)` 子串扫描
+_EXT_GROUP = {
+    '.py': 'code', '.js': 'code', '.ts': 'code', '.java': 'code',
+    '.cpp': 'code', '.c': 'code', '.go': 'code', '.rs': 'code',
+    '.yml': 'config', '.yaml': 'config', '.json': 'config',
+    '.toml': 'config', '.ini': 'config',
+    '.css': 'style', '.scss': 'style', '.less': 'style',
+    '.html': 'style', '.jsx': 'style', '.tsx': 'style', '.vue': 'style',
+}
+
+_SUMMARY_EXT_LABEL = {
+    '.yml': '配置文件', '.yaml': '配置文件',
+    '.js': '主题文件', '.css': '主题文件', '.html': '主题文件',
+}
+
+_TABLE_EXT_TYPE = {
+    '.yml': "⚙️ Config", '.yaml': "⚙️ Config",
+    '.js': "🎨 Theme", '.css': "🎨 Theme", '.html': "🎨 Theme",
+    '.py': "💻 Code", '.ts': "💻 Code", '.jsx': "💻 Code",
+    '.jpg': "🖼️ Image", '.png': "🖼️ Image", '.gif': "🖼️ Image", '.webp': "🖼️ Image",
+}
+
+# 博客文章路径前缀 - git输出的是仓库相对路径，前缀判断即可，
+# startswith在多数非文章路径上比全串子串扫描更早短路
+_POSTS_PREFIX = 'source/_posts/'
+
+# 标题/标签/分类的中英文映射 - 模块加载时构建一次，避免每次翻译重建
+_TITLE_MAPPINGS = {
+    '详解': 'Explained',
+    '指南': 'Guide',
+    '教程': 'Tutorial',
+    '入门': 'Getting Started',
+    '实战': 'Practice',
+    '深入': 'Deep Dive',
+    '优化': 'Optimization',
+    '最佳实践': 'Best Practices',
+    '装饰器': 'Decorators',
+    '写文章': 'Writing Articles'
+}
+
+# 合并成一个选择分支正则，一次扫描完成全部词替换（长词优先防止前缀截断）
+_TITLE_SUB_RE = re.compile('|'.join(map(re.escape, sorted(_TITLE_MAPPINGS, key=len, reverse=True))))
+
+_TAG_TRANSLATIONS = {
+    '装饰器': 'Decorators',
+    '后端开发': 'Backend Development',
+    '技术分享': 'Tech Sharing',
+    '博客': 'Blog',
+    '前端开发': 'Frontend Development',
+    '数据库': 'Database',
+    '算法': 'Algorithm'
+}
+
+_CATEGORY_TRANSLATIONS = {
+    'Python编程': 'Python Programming',
+    '技术分享': 'Tech Sharing',
+    '个人经历': 'Personal Experience',
+    '前端技术': 'Frontend Tech',
+    '后端技术': 'Backend Tech'
+}
+
+# front-matter标题正则 - 模块加载时编译一次；
+# 其余字段由_parse_front_matter单次逐行扫描提取
+_TITLE_RE = re.compile(r'title:\s*(.+)')
+
+def _parse_front_matter(front_matter: str) -> dict:
+    """单次逐行扫描front-matter，一趟提取全部字段
+
+    标量字段取冒号后内容，tags/categories收集后续的"- xxx"列表行，
+    替代对同一字符串的9次独立正则扫描。
+    """
+    fields = {}
+    list_key = None
+    for line in front_matter.splitlines():
+        stripped = line.strip()
+        if not stripped:
+            continue
+        if list_key is not None and stripped.startswith('-'):
+            fields[list_key].append(stripped[1:].strip())
+            continue
+        list_key = None
+        key, sep, value = line.partition(':')
+        if not sep or line[:1].isspace():
+            continue
+        key = key.strip()
+        value = value.strip()
+        if key in ('tags', 'categories'):
+            if not value:
+                list_key = key
+                fields[key] = []
+        elif value:
+            fields[key] = value
+    return fields
+
+
+# 其余热路径正则同样在模块加载时编译一次
+_UNSAFE_FILENAME_RE = re.compile(r'[^\w\u4e00-\u9fa5-]')
+_DASH_RUN_RE = re.compile(r'-+')
+_URL_RE = re.compile(r'https?://[^\s;]+')
+_HTML_TAG_RE = re.compile(r'<[^>]+>')
+_HEXO_READY_RE = re.compile(r'Hexo is running at (https?://\S+)')
+_CJK_RE = re.compile(r'[\u4e00-\u9fff]')
+
+
+@functools.lru_cache(maxsize=8)
+def _list_zh_posts(posts_dir: str, dir_mtime_ns: int) -> tuple:
+    """列出posts目录下的-zh.md文件及mtime
+
+    按 (目录, 目录mtime) 缓存，批量处理时同一进程内重复匹配
+    不再每次readdir；目录一变mtime跟着变，缓存自动失效。
+    """
+    zh_files = []
+    try:
+        with os.scandir(posts_dir) as entries:
+            for entry in entries:
+                if entry.name.endswith('-zh.md'):
+                    try:
+                        mtime = entry.stat().st_mtime
+                    except OSError:
+                        # 如果无法获取修改时间，使用当前时间
+                        mtime = time.time()
+                    zh_files.append((entry.name, entry.path, mtime))
+    except OSError:
+        return ()
+    return tuple(zh_files)
+
+
+# 模块级共享Console实例 - 避免每次创建时重复探测终端能力
+# highlight=False 跳过Rich对输出内容的自动高亮正则扫描
+_CONSOLE = Console(highlight=False, markup=True)
+
 
 def get_system_info():
     """获取系统信息"""
     try:
+        import psutil
         cpu_percent = psutil.cpu_percent(interval=0.1)
         memory = psutil.virtual_memory()
         return {
-            'platform': platform.system(),
+            'platform': _PLATFORM_SYSTEM,
             'cpu_percent': cpu_percent,
             'memory_percent': memory.percent,
-            'python_version': platform.python_version(),
-            'architecture': platform.machine()
+            'python_version': _PYTHON_VERSION,
+            'architecture': _PLATFORM_MACHINE
         }
     except:
         return None
 
 
-def create_leion_server_header(console: Console):
-    """创建 Leion 博客服务器专业标题"""
-    start_time = datetime.now()
-    
-    # Leion 服务器品牌标题
+def _build_static_header_parts(icon: str, icon_style: str, word2: str, word3: str, tagline: str):
+    """构建标题中不随调用变化的静态 Text 骨架，模块加载时执行一次"""
     header_text = Text()
-    header_text.append("🌐 ", style="bold blue")
+    header_text.append(f"{icon} ", style=icon_style)
     header_text.append("LEION", style="bold white on blue")
     header_text.append(" ", style="")
-    header_text.append("BLOG", style="bold white on green")
+    header_text.append(word2, style="bold white on green")
     header_text.append(" ", style="")
-    header_text.append("SERVER", style="bold white on magenta")
+    header_text.append(word3, style="bold white on magenta")
     header_text.append(" 🚀", style="bold yellow")
-    
-    # 版本和时间信息
-    version_text = Text()
-    version_text.append("v2.0.0", style="dim cyan")
-    version_text.append(" • ", style="dim white")
-    version_text.append(f"Started at {start_time.strftime('%H:%M:%S')}", style="dim cyan")
-    version_text.append(" • ", style="dim white")
-    version_text.append(f"{platform.system()} {platform.machine()}", style="dim cyan")
-    
-    # 版权信息
+
+    # 版本信息前缀 - 时间戳在每次调用时追加
+    version_prefix = Text()
+    version_prefix.append("v2.0.0", style="dim cyan")
+    version_prefix.append(" • ", style="dim white")
+
     copyright_text = Text()
     copyright_text.append("© 2025 Leion Charles - All Rights Reserved", style="dim yellow")
     copyright_text.append(" • ", style="dim white")
-    copyright_text.append("Professional Blog Development Server", style="dim green")
-    
+    copyright_text.append(tagline, style="dim green")
+
+    return header_text, version_prefix, copyright_text
+
+
+# 静态标题骨架 - 每次调用只需要填充时间戳，省掉十几次 Text.append
+_SERVER_HEADER_PARTS = _build_static_header_parts(
+    "🌐", "bold blue", "BLOG", "SERVER", "Professional Blog Development Server")
+_GIT_HEADER_PARTS = _build_static_header_parts(
+    "📡", "bold green", "GIT", "DEPLOYMENT", "Professional Git Deployment System")
+
+
+def _render_leion_header(console: Console, parts, start_time, panel_style: str,
+                         panel_title: str, panel_subtitle: str):
+    """用静态骨架 + 当前时间戳组装并输出标题面板"""
+    from rich.align import Align
+
+    header_text, version_prefix, copyright_text = parts
+
+    version_text = version_prefix.copy()
+    version_text.append(f"Started at {start_time.strftime('%H:%M:%S')}", style="dim cyan")
+    version_text.append(" • ", style="dim white")
+    version_text.append(_PLATFORM_INFO, style="dim cyan")
+
     title_content = Text()
     title_content.append(header_text)
     title_content.append("\n")
     title_content.append(version_text)
     title_content.append("\n")
     title_content.append(copyright_text)
-    
+
     title_panel = Panel(
         Align.center(title_content),
         box=box.DOUBLE_EDGE,
-        style="bright_blue",
+        style=panel_style,
         padding=(1, 3),
-        title="[bold white]🎯 Leion's Professional Blog Development Environment[/bold white]",
-        subtitle="[dim cyan]Local Development Server with Hot Reload[/dim cyan]",
+        title=panel_title,
+        subtitle=panel_subtitle,
         title_align="center"
     )
-    
+
     console.clear()
     console.print(title_panel)
     console.print()
+
+
+def create_leion_server_header(console: Console = None):
+    """创建 Leion 博客服务器专业标题"""
+    console = console or _CONSOLE
+    start_time = datetime.now()
+    _render_leion_header(
+        console, _SERVER_HEADER_PARTS, start_time, "bright_blue",
+        "[bold white]🎯 Leion's Professional Blog Development Environment[/bold white]",
+        "[dim cyan]Local Development Server with Hot Reload[/dim cyan]"
+    )
     return start_time
 
 
-def create_leion_git_header(console: Console):
+def create_leion_git_header(console: Console = None):
     """创建 Leion Git 推送专业标题"""
+    console = console or _CONSOLE
     start_time = datetime.now()
-    
-    # Leion Git 品牌标题
-    header_text = Text()
-    header_text.append("📡 ", style="bold green")
-    header_text.append("LEION", style="bold white on blue")
-    header_text.append(" ", style="")
-    header_text.append("GIT", style="bold white on green")
-    header_text.append(" ", style="")
-    header_text.append("DEPLOYMENT", style="bold white on magenta")
-    header_text.append(" 🚀", style="bold yellow")
-    
-    # 版本和时间信息
-    version_text = Text()
-    version_text.append("v2.0.0", style="dim cyan")
-    version_text.append(" • ", style="dim white")
-    version_text.append(f"Started at {start_time.strftime('%H:%M:%S')}", style="dim cyan")
-    version_text.append(" • ", style="dim white")
-    version_text.append(f"{platform.system()} {platform.machine()}", style="dim cyan")
-    
-    # 版权信息
-    copyright_text = Text()
-    copyright_text.append("© 2025 Leion Charles - All Rights Reserved", style="dim yellow")
-    copyright_text.append(" • ", style="dim white")
-    copyright_text.append("Professional Git Deployment System", style="dim green")
-    
-    title_content = Text()
-    title_content.append(header_text)
-    title_content.append("\n")
-    title_content.append(version_text)
-    title_content.append("\n")
-    title_content.append(copyright_text)
-    
-    title_panel = Panel(
-        Align.center(title_content),
-        box=box.DOUBLE_EDGE,
-        style="bright_green",
-        padding=(1, 3),
-        title="[bold white]🎯 Leion's Professional Git Deployment Suite[/bold white]",
-        subtitle="[dim cyan]Intelligent Commit Analysis & GitHub Integration[/dim cyan]",
-        title_align="center"
+    _render_leion_header(
+        console, _GIT_HEADER_PARTS, start_time, "bright_green",
+        "[bold white]🎯 Leion's Professional Git Deployment Suite[/bold white]",
+        "[dim cyan]Intelligent Commit Analysis & GitHub Integration[/dim cyan]"
     )
-    
-    console.clear()
-    console.print(title_panel)
-    console.print()
     return start_time
 
 
@@ -153,7 +276,9 @@ class BlogManager:
         self.posts_dir = f"{self.blog_dir}/source/_posts"
         self.main_blog_dir = "/Users/leion/Charles/LeionWeb"
         self.ai_helper_script = "/Users/leion/scripts/ai_helper.py"
-        self.console = Console()
+        # 预构建AI脚本argv前缀，回退fork时直接拼接参数
+        self._ai_argv = ("python3", self.ai_helper_script)
+        self.console = _CONSOLE
         
         # 配置文件路径
         self.config_dir = os.path.join(os.path.dirname(__file__), 'config')
@@ -166,12 +291,51 @@ class BlogManager:
             self.client = get_client()
         except ImportError:
             self.client = None
+
+        # GitPython仓库句柄 - 首次使用时延迟构建
+        self._repo = None
+        self._repo_checked = False
+
+        # 文件名字符集缓存（模糊匹配用），posts目录mtime变化时失效
+        self._name_char_cache = {}
+        self._name_cache_mtime = None
+
+        # 提示词模板缓存：路径 -> (mtime, 文本)，mtime变化时自动重新读取
+        self._template_cache = {}
+
+        # 进程内ai_helper回退句柄 - 首次使用时延迟导入
+        self._ai_helper = None
+        self._ai_helper_failed = False
+
+        # 最近一次front-matter解析结果：(原文, front_matter, 正文)
+        self._parsed_post = None
+
+    def _get_repo(self):
+        """获取持久化的GitPython仓库对象，不可用时返回None
+
+        复用一个repo句柄可以省掉每个git操作的 /bin/sh + git 两次fork，
+        commit信息也作为Python字符串直接传入，不再经过shell引号转义。
+        """
+        if not self._repo_checked:
+            self._repo_checked = True
+            try:
+                import git
+                self._repo = git.Repo(self.main_blog_dir)
+            except Exception:
+                self._repo = None
+        return self._repo
     
     def _load_prompt_template(self, config_file: str) -> str:
-        """加载提示词模板文件"""
+        """加载提示词模板文件 - 按(路径, mtime)缓存，批量处理时免去重复磁盘读取"""
         try:
+            mtime = os.path.getmtime(config_file)
+            cached = self._template_cache.get(config_file)
+            if cached is not None and cached[0] == mtime:
+                return cached[1]
             with open(config_file, 'r', encoding='utf-8') as f:
-                return f.read().strip()
+                template = f.read().strip()
+            self._template_cache[config_file] = (mtime, template)
+            return template
         except FileNotFoundError:
             self.console.print(f"[yellow]⚠️ 配置文件未找到: {config_file}[/yellow]")
             return None
@@ -179,39 +343,108 @@ class BlogManager:
             self.console.print(f"[red]❌ 读取配置文件失败: {e}[/red]")
             return None
         
-    def _run_command(self, cmd: str, cwd: str = None) -> tuple[bool, str]:
-        """执行shell命令"""
+    # 保留的命令输出上限 - 失败原因都在尾部，256KB足够诊断，
+    # 避免hexo generate/git push的海量输出整体驻留内存
+    _MAX_COMMAND_OUTPUT = 256 * 1024
+
+    # 待提交文件表格的最大行数，超出部分折叠为一行提示
+    _MAX_TABLE_ROWS = 50
+
+    def _run_command(self, cmd, cwd: str = None) -> tuple[bool, str]:
+        """执行命令，仅保留输出的最后256KB
+
+        cmd为list时直接按argv执行，参数原样传递无需shell转义；
+        str时保持原有shell语义。
+        """
+        from collections import deque
+
         try:
-            result = subprocess.run(
-                cmd, 
-                shell=True, 
+            # stderr直接合并进stdout，内核层面只维护一个管道
+            proc = subprocess.Popen(
+                cmd,
+                shell=isinstance(cmd, str),
                 cwd=cwd or os.getcwd(),
-                capture_output=True, 
-                text=True
+                stdout=subprocess.PIPE,
+                stderr=subprocess.STDOUT,
             )
-            return result.returncode == 0, result.stdout + result.stderr
+            tail = deque()
+            tail_size = 0
+            while True:
+                chunk = proc.stdout.read(4096)
+                if not chunk:
+                    break
+                tail.append(chunk)
+                tail_size += len(chunk)
+                while tail_size > self._MAX_COMMAND_OUTPUT:
+                    tail_size -= len(tail.popleft())
+            proc.wait()
+            output = b''.join(tail).decode('utf-8', errors='replace')
+            return proc.returncode == 0, output
         except Exception as e:
             return False, str(e)
-            
+
+    def _run_command_streaming(self, cmd, cwd: str = None, text: bool = True):
+        """流式执行命令，逐行yield stdout
+
+        大输出（如整仓diff）不再整体读入内存再decode，
+        消费方可以边解析边丢弃，内存占用与diff大小无关。
+        text=False时直接yield bytes行，连UTF-8解码都留给消费方按需做。
+        """
+        try:
+            proc = subprocess.Popen(
+                cmd,
+                shell=isinstance(cmd, str),
+                cwd=cwd or os.getcwd(),
+                stdout=subprocess.PIPE,
+                stderr=subprocess.DEVNULL,
+                text=text,
+                bufsize=1 if text else -1,
+            )
+        except Exception:
+            return
+        try:
+            newline = '\n' if text else b'\n'
+            for line in proc.stdout:
+                yield line.rstrip(newline)
+        finally:
+            proc.stdout.close()
+            proc.wait()
+
+
     def _generate_safe_filename(self, title: str) -> str:
         """生成安全的文件名"""
         # 移除特殊字符，保留中文、英文、数字和连字符
-        safe_name = re.sub(r'[^\w\u4e00-\u9fa5-]', '-', title)
-        safe_name = re.sub(r'-+', '-', safe_name)  # 合并多个连字符
+        safe_name = _UNSAFE_FILENAME_RE.sub('-', title)
+        safe_name = _DASH_RUN_RE.sub('-', safe_name)  # 合并多个连字符
         return safe_name.strip('-')
         
-    def _ensure_unique_filename(self, base_path: str) -> str:
-        """确保文件名唯一"""
-        counter = 1
+    def _ensure_unique_filename(self, base_path: str) -> tuple[str, int]:
+        """确保文件名唯一，原子创建并返回 (路径, 文件描述符)
+
+        先一次listdir把已有文件名收进set，直接跳到空闲候选名，
+        同名文章很多时是1次getdents而非N次探测；最后仍用
+        O_CREAT|O_EXCL 原子预留，并发竞争时继续顺延。
+        """
         path = Path(base_path)
-        original_path = path
-        
-        while path.exists():
-            path = Path(f"{original_path.stem}-{counter}{original_path.suffix}")
-            path = original_path.parent / path.name
+        parent = path.parent
+        stem, suffix = path.stem, path.suffix
+
+        try:
+            existing = set(os.listdir(parent))
+        except OSError:
+            existing = set()
+
+        counter = 1
+        while True:
+            if path.name not in existing:
+                try:
+                    fd = os.open(str(path), os.O_CREAT | os.O_EXCL | os.O_WRONLY, 0o644)
+                    return str(path), fd
+                except FileExistsError:
+                    # listdir之后有并发创建，顺延到下一个候选
+                    pass
+            path = parent / f"{stem}-{counter}{suffix}"
             counter += 1
-            
-        return str(path)
         
     def new_article(self, title: str) -> bool:
         """创建新博客文章"""
@@ -225,80 +458,170 @@ class BlogManager:
             print_error(f"博客目录不存在: {self.blog_dir}")
             return False
 
-        print_info("切换到博客目录...")
-        original_dir = os.getcwd()
+        # 调用AI生成文章结构 - AI往返是多秒级瓶颈，
+        # 目录准备和文件名预留放到后台线程与其重叠执行
+        print_progress("正在调用AI生成文章结构...")
+
+        def _generate_article():
+            # 进程内AIHelper只冷启动一次；导入失败才fork外部脚本
+            helper = self._get_ai_helper()
+            if helper is not None:
+                content = helper.generate_blog_article(title) or ""
+                return bool(content), content
+            return self._run_command(
+                [*self._ai_argv, 'generate', title]
+            )
 
-        try:
-            os.chdir(self.blog_dir)
+        from concurrent.futures import ThreadPoolExecutor
+        with ThreadPoolExecutor(max_workers=1) as pool:
+            ai_future = pool.submit(_generate_article)
 
-            # 调用AI生成文章结构
-            print_progress("正在调用AI生成文章结构...")
-            success, ai_content = self._run_command(
-                f'python3 "{self.ai_helper_script}" generate "{title}"'
-            )
-            
-            if success and ai_content.strip():
-                # 生成安全的文件名
-                safe_filename = self._generate_safe_filename(title)
-                article_file = f"{self.posts_dir}/{safe_filename}.md"
-                article_file = self._ensure_unique_filename(article_file)
-                
-                # 写入AI生成的内容
-                try:
-                    with open(article_file, 'w', encoding='utf-8') as f:
-                        f.write(ai_content)
+            # 生成安全的文件名并原子预留
+            os.makedirs(self.posts_dir, exist_ok=True)
+            safe_filename = self._generate_safe_filename(title)
+            article_file, article_fd = self._ensure_unique_filename(
+                f"{self.posts_dir}/{safe_filename}.md")
 
-                    print_success(f"文章创建成功: {os.path.basename(article_file)}")
-                    print_info(f"文件路径: {article_file}")
+            success, ai_content = ai_future.result()
 
-                    # 用Typora打开文件
-                    print_progress("正在用 Typora 打开文章...")
-                    success, _ = self._run_command(f'open -a "Typora" "{article_file}"')
+        if success and ai_content.strip():
+            # 写入AI生成的内容 - 复用原子创建返回的fd，避免二次open
+            try:
+                with os.fdopen(article_fd, 'w', encoding='utf-8') as f:
+                    f.write(ai_content)
 
-                    if success:
-                        print_success("Typora 已打开，开始您的创作之旅！")
-                        print_info("文章已包含完整结构和AI建议的大纲")
-                    else:
-                        print_warning("Typora 打开失败，请手动打开文件")
+                print_success(f"文章创建成功: {os.path.basename(article_file)}")
+                print_info(f"文件路径: {article_file}")
 
-                    return True
+                # 用Typora打开文件
+                print_progress("正在用 Typora 打开文章...")
+                success, _ = self._run_command(['open', '-a', 'Typora', article_file])
 
-                except Exception as e:
-                    print_error(f"写入文件失败: {e}")
-                    return False
+                if success:
+                    print_success("Typora 已打开，开始您的创作之旅！")
+                    print_info("文章已包含完整结构和AI建议的大纲")
+                else:
+                    print_warning("Typora 打开失败，请手动打开文件")
+
+                return True
+
+            except Exception as e:
+                print_error(f"写入文件失败: {e}")
+                return False
                     
-            else:
-                print_warning("AI生成失败，使用传统方式创建文章")
-                success, output = self._run_command(f'hexo new "{title}"')
+        else:
+            # AI失败时释放预留的空文件，避免留下垃圾
+            try:
+                os.close(article_fd)
+                os.unlink(article_file)
+            except OSError:
+                pass
 
-                if success:
-                    print_success("文章创建成功（使用默认模板）")
+            print_warning("AI生成失败，使用传统方式创建文章")
+            success, output = self._run_command(['hexo', 'new', title], cwd=self.blog_dir)
 
-                    # 查找刚创建的文件
-                    success, output = self._run_command(f'find "{self.posts_dir}" -name "*{title}*.md" -type f -newermt "1 minute ago"')
-                    if success and output.strip():
-                        article_file = output.strip().split('\n')[0]
-                        self._run_command(f'open -a "Typora" "{article_file}"')
+            if success:
+                print_success("文章创建成功（使用默认模板）")
 
-                    return True
-                else:
-                    print_error(f"创建文章失败: {output}")
-                    return False
+                # 查找刚创建的文件 - 直接扫描目录，避免fork find进程
+                article_file = self._find_latest_article(title)
+                if article_file:
+                    self._run_command(['open', '-a', 'Typora', article_file])
+
+                return True
+            else:
+                print_error(f"创建文章失败: {output}")
+                return False
 
-        finally:
-            os.chdir(original_dir)
-            print_info("已返回原目录")
             
+    def _find_latest_article(self, title: str) -> str:
+        """在posts目录中查找标题匹配的最新.md文件"""
+        try:
+            candidates = [
+                entry for entry in os.scandir(self.posts_dir)
+                if entry.is_file() and entry.name.endswith('.md') and title in entry.name
+            ]
+        except OSError:
+            return None
+
+        if not candidates:
+            return None
+
+        return max(candidates, key=lambda entry: entry.stat().st_mtime).path
+
+    # commit信息缓存：同一份变更重试push时不再重复走AI往返
+    _COMMIT_CACHE_FILE = os.path.expanduser("~/.cache/leion/commit_msg_cache.json")
+    _COMMIT_CACHE_TTL = 86400  # 秒
+
+    def _commit_cache_key(self) -> str:
+        """以 git diff HEAD --raw 输出哈希作键
+
+        --raw 只列出路径和前后blob SHA（每文件一行），相同暂存状态
+        输出必然相同，足以唯一标识这份diff且开销远小于读全量diff。
+        """
+        success, raw_output = self._run_command(['git', 'diff', 'HEAD', '--raw'], cwd=self.main_blog_dir)
+        if not success or not raw_output.strip():
+            return None
+        import hashlib
+        return hashlib.sha256(raw_output.encode('utf-8')).hexdigest()
+
+    def _load_cached_commit_message(self, cache_key: str) -> str:
+        """读取未过期的缓存commit信息，未命中返回None"""
+        import json
+        try:
+            with open(self._COMMIT_CACHE_FILE, 'r', encoding='utf-8') as f:
+                cache = json.load(f)
+            entry = cache.get(cache_key)
+            if entry and time.time() - entry['ts'] < self._COMMIT_CACHE_TTL:
+                return entry['msg']
+        except Exception:
+            pass
+        return None
+
+    def _store_cached_commit_message(self, cache_key: str, commit_msg: str) -> None:
+        """写回commit信息缓存，顺带清理过期条目；失败不影响主流程"""
+        import json
+        try:
+            try:
+                with open(self._COMMIT_CACHE_FILE, 'r', encoding='utf-8') as f:
+                    cache = json.load(f)
+            except Exception:
+                cache = {}
+            now = time.time()
+            cache = {k: v for k, v in cache.items()
+                     if now - v.get('ts', 0) < self._COMMIT_CACHE_TTL}
+            cache[cache_key] = {'msg': commit_msg, 'ts': now}
+            os.makedirs(os.path.dirname(self._COMMIT_CACHE_FILE), exist_ok=True)
+            with open(self._COMMIT_CACHE_FILE, 'w', encoding='utf-8') as f:
+                json.dump(cache, f, ensure_ascii=False)
+        except Exception:
+            pass
+
     def _generate_commit_message(self, changes_summary: str) -> str:
         """使用AI生成有意义的commit信息"""
         try:
-            # 清理摘要内容，避免命令行解析问题
+            # 同一暂存状态重试时直接命中缓存，省掉AI往返
+            cache_key = self._commit_cache_key()
+            if cache_key:
+                cached_msg = self._load_cached_commit_message(cache_key)
+                if cached_msg:
+                    if self.console:
+                        self.console.print("[dim cyan]🗂 命中commit信息缓存[/dim cyan]")
+                    return cached_msg
+
+            # 压缩摘要内容（截断+去URL），argv传参无需再做shell转义
             cleaned_summary = self._clean_summary_for_command(changes_summary)
 
-            # 调用AI助手生成commit信息
-            success, ai_commit = self._run_command(
-                f'python3 "{self.ai_helper_script}" commit "{cleaned_summary}"'
-            )
+            # 调用AI助手生成commit信息 - 优先进程内复用的AIHelper，
+            # 免去每次push一遍解释器冷启动
+            helper = self._get_ai_helper()
+            if helper is not None:
+                ai_commit = helper.generate_commit_message(cleaned_summary) or ""
+                success = bool(ai_commit)
+            else:
+                success, ai_commit = self._run_command(
+                    [*self._ai_argv, 'commit', cleaned_summary]
+                )
 
             if success and ai_commit.strip():
                 # 清理AI返回的内容，只保留commit信息
@@ -313,13 +636,19 @@ class BlogManager:
                     self.console.print(f"[dim]🔍 信息长度: {len(commit_msg)}[/dim]")
 
                 # 放宽长度限制，确保AI生成的信息能被使用
+                final_msg = None
                 if len(commit_msg) > 5 and len(commit_msg) < 200:
-                    return commit_msg
+                    final_msg = commit_msg
                 elif commit_msg:  # 如果有内容但长度不符合，截取或补充
                     if len(commit_msg) > 200:
-                        return commit_msg[:197] + "..."
+                        final_msg = commit_msg[:197] + "..."
                     elif len(commit_msg) <= 5:
-                        return f"更新内容: {commit_msg}"
+                        final_msg = f"更新内容: {commit_msg}"
+
+                if final_msg:
+                    if cache_key:
+                        self._store_cached_commit_message(cache_key, final_msg)
+                    return final_msg
 
         except Exception as e:
             if self.console:
@@ -329,16 +658,13 @@ class BlogManager:
         return f"更新博客内容: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}"
 
     def _clean_summary_for_command(self, summary: str) -> str:
-        """清理摘要内容，避免命令行解析问题"""
-        # 替换可能导致问题的字符
-        cleaned = summary.replace('"', "'")  # 双引号替换为单引号
-        cleaned = cleaned.replace('`', "'")  # 反引号替换为单引号
-        cleaned = cleaned.replace('\\', '/')  # 反斜杠替换为正斜杠
+        """压缩摘要内容供AI生成commit信息
 
-        # 移除过长的URL或路径
-        import re
-        cleaned = re.sub(r'https?://[^\s;]+', '[链接]', cleaned)
-        cleaned = re.sub(r'<[^>]+>', '[标签]', cleaned)  # 移除HTML标签
+        参数经argv/进程内调用传递，不再需要shell转义类的字符替换，
+        只保留压缩提示词的部分：去URL/HTML标签并截断长度。
+        """
+        cleaned = _URL_RE.sub('[链接]', summary)
+        cleaned = _HTML_TAG_RE.sub('[标签]', cleaned)  # 移除HTML标签
 
         # 限制长度
         if len(cleaned) > 200:
@@ -346,88 +672,172 @@ class BlogManager:
 
         return cleaned
         
-    def _get_changes_summary(self) -> str:
-        """获取详细的文件更改摘要用于生成commit信息"""
-        return self._get_detailed_changes_summary()
+    def _get_status_entries(self) -> list:
+        """获取工作区状态条目列表 [(status, filepath), ...]
 
-    def _get_detailed_changes_summary(self) -> str:
-        """获取详细的更改分析"""
-        changes_info = []
-
-        # 获取文件状态信息
-        success, status_output = self._run_command("git status --porcelain")
+        使用 --porcelain=v1 -z 单次调用，NUL分隔天然支持带空格/引号的
+        文件名，省掉后续对 `git status --short` 的重复调用。
+        """
+        success, status_output = self._run_command(['git', 'status', '--porcelain=v1', '-z'], cwd=self.main_blog_dir)
         if not success:
-            return self._get_simple_changes_summary()
+            return None
 
-        # 获取详细diff内容
-        success, diff_output = self._run_command("git diff --cached")
-        if not success:
+        entries = []
+        tokens = status_output.split('\0')
+        i = 0
+        while i < len(tokens):
+            token = tokens[i]
+            i += 1
+            if len(token) < 4:
+                continue
+            status = token[:2].strip()
+            filepath = token[3:]
+            entries.append((status, filepath))
+            # 重命名/复制条目后跟一个额外的原路径token
+            if 'R' in status or 'C' in status:
+                i += 1
+
+        return entries
+
+    def _template_commit_message(self, status_entries: list) -> str:
+        """单篇文章提交的模板快路径
+
+        恰好一个 source/_posts/*.md 新增或修改时，模板信息比AI生成
+        更快也更确定；其余情形返回None走AI分析。
+        """
+        if not status_entries or len(status_entries) != 1:
+            return None
+        status, filepath = status_entries[0]
+        if not (filepath.startswith(_POSTS_PREFIX) and filepath.endswith('.md')):
+            return None
+        stem = Path(filepath).stem
+        if status in ('A', '??'):
+            return f"post: add {stem}"
+        if status == 'M':
+            return f"post: update {stem}"
+        return None
+
+    def _get_changes_summary(self, status_entries: list = None) -> str:
+        """获取详细的文件更改摘要用于生成commit信息"""
+        return self._get_detailed_changes_summary(status_entries)
+
+    def _get_detailed_changes_summary(self, status_entries: list = None) -> str:
+        """获取详细的更改分析"""
+        if status_entries is None:
+            status_entries = self._get_status_entries()
+        if status_entries is None:
             return self._get_simple_changes_summary()
 
-        # 获取文件统计信息
-        success, stat_output = self._run_command("git diff --cached --stat")
+        # --stat与--raw两个只读查询互相独立，并发执行让两次
+        # git进程启动+索引扫描的耗时重叠
+        from concurrent.futures import ThreadPoolExecutor
+        with ThreadPoolExecutor(max_workers=2) as ex:
+            stat_future = ex.submit(self._run_command, ['git', 'diff', 'HEAD', '--numstat'], cwd=self.main_blog_dir)
+            shas_future = ex.submit(self._get_staged_blob_shas)
+            success, stat_output = stat_future.result()
+            blob_shas = shas_future.result()
         if not success:
             stat_output = ""
 
+        # 详细diff内容改为流式消费，巨型diff也不会整体驻留内存；
+        # bytes模式跳过全量UTF-8解码，解析只看ASCII标记字节
+        diff_lines = self._run_command_streaming(
+            ['git', 'diff', 'HEAD'], cwd=self.main_blog_dir, text=False)
+
         # 分析每个文件的详细变更
-        file_changes = self._analyze_detailed_changes(status_output, diff_output, stat_output)
+        file_changes = self._analyze_detailed_changes(status_entries, diff_lines, stat_output, blob_shas)
 
         # 生成结构化的变更摘要
         return self._format_changes_summary(file_changes)
-    
-    def _analyze_detailed_changes(self, status_output: str, diff_output: str, stat_output: str) -> list:
-        """详细分析所有文件的变更内容"""
+
+    # 逐行详细分析的文件数上限，之后的文件退回基于状态/统计的通用描述
+    _MAX_DETAILED_FILES = 50
+
+    def _analyze_detailed_changes(self, status_entries: list, diff_lines, stat_output: str,
+                                  blob_shas: dict = None) -> list:
+        """详细分析所有文件的变更内容，diff_lines为可迭代的diff行"""
         changes = []
-        
-        # 解析文件状态
-        file_statuses = {}
-        for line in status_output.strip().split('\n'):
-            if len(line) > 3:
-                status = line[:2].strip()
-                filepath = line[3:].strip().strip('"')
-                file_statuses[filepath] = status
-        
-        # 解析统计信息
+
+        # 文件状态映射
+        file_statuses = {filepath: status for status, filepath in status_entries}
+
+        # 解析统计信息 - numstat输出 "新增\t删除\t路径"，数字精确且
+        # 无需在--stat的截断条形图上count字符
         file_stats = {}
-        for line in stat_output.strip().split('\n'):
-            if '|' in line and ('+' in line or '-' in line):
-                parts = line.split('|')
-                if len(parts) >= 2:
-                    filename = parts[0].strip()
-                    stats_part = parts[1].strip()
-                    # 提取数字统计
-                    import re
-                    numbers = re.findall(r'\d+', stats_part)
-                    additions = stats_part.count('+')
-                    deletions = stats_part.count('-')
-                    file_stats[filename] = {
-                        'additions': additions,
-                        'deletions': deletions,
-                        'changes': int(numbers[0]) if numbers else additions + deletions
-                    }
-        
+        for line in stat_output.splitlines():
+            add_str, _, rest = line.partition('\t')
+            del_str, sep, filename = rest.partition('\t')
+            if not sep or add_str == '-':
+                continue  # 格式异常或二进制文件
+            additions, deletions = int(add_str), int(del_str)
+            file_stats[filename] = {
+                'additions': additions,
+                'deletions': deletions,
+                'changes': additions + deletions
+            }
+
         # 分析每个文件的diff内容
         current_file = None
+        current_diff = None
         file_diffs = {}
-        
-        for line in diff_output.split('\n'):
-            if line.startswith('diff --git'):
+
+        # 每个文件最多保留这么多±行：超过_MAX_ANALYZED_DIFF_LINES的部分
+        # 逐行分析阶段本来就会跳过，只记总数即可
+        line_cap = self._MAX_ANALYZED_DIFF_LINES + 1
+
+        # 按行首字节分派，每行只做一次比较而非4+次startswith；
+        # 行以bytes流入，只有真正保留的少量片段才做UTF-8解码
+        file_count = 0
+        for line in diff_lines:
+            c = line[:1]
+            if c == b'd' and line.startswith(b'diff --git'):
+                # 摘要最终每类只展示≤2条，超出上限的文件给通用描述即可，
+                # 提前退出让解析开销与diff总大小无关
+                if file_count >= self._MAX_DETAILED_FILES:
+                    break
                 # 提取文件路径
-                parts = line.split(' ')
+                parts = line.split(b' ')
                 if len(parts) >= 4:
-                    current_file = parts[3].replace('b/', '').strip()
-                    file_diffs[current_file] = {
+                    file_count += 1
+                    current_file = parts[3].replace(b'b/', b'').strip().decode(
+                        'utf-8', errors='replace')
+                    current_diff = file_diffs[current_file] = {
                         'added_lines': [],
                         'deleted_lines': [],
-                        'context_lines': []
+                        'context_lines': [],
+                        'added_total': 0,
+                        'deleted_total': 0,
                     }
-            elif current_file and line.startswith('+') and not line.startswith('+++'):
-                file_diffs[current_file]['added_lines'].append(line[1:].strip())
-            elif current_file and line.startswith('-') and not line.startswith('---'):
-                file_diffs[current_file]['deleted_lines'].append(line[1:].strip())
-            elif current_file and not line.startswith(('@', '\\', 'index ', 'new file', 'deleted file')):
-                file_diffs[current_file]['context_lines'].append(line.strip())
-        
+            elif not current_file:
+                continue
+            elif c == b'+':
+                if not line.startswith(b'+++'):
+                    current_diff['added_total'] += 1
+                    if current_diff['added_total'] <= line_cap:
+                        current_diff['added_lines'].append(
+                            line[1:].strip().decode('utf-8', errors='replace'))
+            elif c == b'-':
+                if not line.startswith(b'---'):
+                    current_diff['deleted_total'] += 1
+                    if current_diff['deleted_total'] <= line_cap:
+                        current_diff['deleted_lines'].append(
+                            line[1:].strip().decode('utf-8', errors='replace'))
+            elif c not in (b'@', b'\\') and not line.startswith((b'index ', b'new file', b'deleted file')):
+                # 上下文行只用于识别"Binary files"提示，保留少量即可
+                if len(current_diff['context_lines']) < 20:
+                    current_diff['context_lines'].append(
+                        line.strip().decode('utf-8', errors='replace'))
+
+        # 提前break后关闭流式生成器，立刻回收底层git进程
+        close = getattr(diff_lines, 'close', None)
+        if close is not None:
+            close()
+
+        # blob SHA映射 - 同一暂存状态重试时可以直接命中分析缓存
+        # （调用方可能已并发取好，未传入时再查询）
+        if blob_shas is None:
+            blob_shas = self._get_staged_blob_shas()
+
         # 为每个文件生成详细分析
         for filepath in file_statuses.keys():
             change_info = {
@@ -436,17 +846,72 @@ class BlogManager:
                 'status': file_statuses.get(filepath, ''),
                 'stats': file_stats.get(filepath, {'additions': 0, 'deletions': 0, 'changes': 0}),
                 'diff': file_diffs.get(filepath, {'added_lines': [], 'deleted_lines': [], 'context_lines': []}),
-                'analysis': self._analyze_file_changes(filepath, file_diffs.get(filepath, {}))
+                'analysis': self._analyze_file_changes_cached(
+                    filepath, file_diffs.get(filepath, {}), blob_shas.get(filepath))
             }
             changes.append(change_info)
-        
+
         return changes
+
+    def _get_staged_blob_shas(self) -> dict:
+        """解析 git diff HEAD --raw，得到 filepath -> (src_sha, dst_sha)"""
+        blob_shas = {}
+        success, raw_output = self._run_command(['git', 'diff', 'HEAD', '--raw'], cwd=self.main_blog_dir)
+        if not success:
+            return blob_shas
+
+        for line in raw_output.strip().split('\n'):
+            # 格式: :100644 100644 <src_sha> <dst_sha> M\tfilepath
+            if not line.startswith(':'):
+                continue
+            meta, _, filepath = line.partition('\t')
+            parts = meta.split()
+            if len(parts) >= 4 and filepath:
+                blob_shas[filepath.strip()] = (parts[2], parts[3])
+
+        return blob_shas
+
+    def _analyze_file_changes_cached(self, filepath: str, diff_data: dict, shas) -> str:
+        """带持久化缓存的文件变更分析，键为文件路径+前后blob SHA"""
+        if not shas:
+            return self._analyze_file_changes(filepath, diff_data)
+
+        cache_key = f"{filepath}:{shas[0]}:{shas[1]}"
+        try:
+            import shelve
+            cache_dir = os.path.expanduser("~/.cache/leion")
+            os.makedirs(cache_dir, exist_ok=True)
+            with shelve.open(os.path.join(cache_dir, "diff_analysis")) as cache:
+                if cache_key in cache:
+                    return cache[cache_key]
+                analysis = self._analyze_file_changes(filepath, diff_data)
+                cache[cache_key] = analysis
+                return analysis
+        except Exception:
+            # 缓存不可用时退回直接分析
+            return self._analyze_file_changes(filepath, diff_data)
     
+    # 超过该行数的diff跳过逐行正则分析，直接给出量级摘要
+    _MAX_ANALYZED_DIFF_LINES = 2000
+
     def _analyze_file_changes(self, filepath: str, diff_data: dict) -> str:
         """深度分析单个文件的变更内容"""
         added_lines = diff_data.get('added_lines', [])
         deleted_lines = diff_data.get('deleted_lines', [])
-        
+
+        # 二进制文件的diff没有±行，只有 "Binary files ... differ" 提示
+        if not added_lines and not deleted_lines:
+            for line in diff_data.get('context_lines', []):
+                if line.startswith('Binary files'):
+                    return "二进制文件: 内容变更"
+
+        # 超大diff（锁文件、生成文件等）不值得逐行正则分析
+        # 总行数从流式解析的计数器取，±行列表本身有截断上限
+        added_total = diff_data.get('added_total', len(added_lines))
+        deleted_total = diff_data.get('deleted_total', len(deleted_lines))
+        if added_total + deleted_total > self._MAX_ANALYZED_DIFF_LINES:
+            return f"大型文件: +{added_total}/-{deleted_total} 行变更"
+
         # 根据文件类型进行专门分析
         if filepath.endswith('.md'):
             return self._analyze_markdown_changes(filepath, added_lines, deleted_lines)
@@ -468,40 +933,59 @@ class BlogManager:
         analysis = []
         
         # 检查是否是博客文章
-        is_blog_post = 'source/_posts/' in filepath
-        
-        # 分析front-matter变更
+        is_blog_post = filepath.startswith(_POSTS_PREFIX)
+
+        # 单次遍历同时收集front-matter键/章节/链接/图片/代码统计，
+        # 替代逐指标的5个列表推导
+        fm_keys = ('title:', 'slug:', 'tags:', 'categories:', 'date:', 'cover:')
         fm_changes = []
-        for line in added_lines + deleted_lines:
-            if line.startswith(('title:', 'slug:', 'tags:', 'categories:', 'date:', 'cover:')):
+        fm_seen = set()
+        added_headers = []
+        deleted_headers = []
+        added_links = 0
+        added_images = 0
+        added_code = False
+
+        for line in added_lines:
+            if line.startswith(fm_keys):
                 key = line.split(':')[0].strip()
-                if key not in [c.split(':')[0] for c in fm_changes]:
+                if key not in fm_seen:
+                    fm_seen.add(key)
                     fm_changes.append(f"{key}配置")
-        
+            if line.startswith('#'):
+                if len(added_headers) < 2:
+                    added_headers.append(line.strip('#').strip()[:20])
+            if '[' in line and '](' in line:
+                added_links += 1
+            if line.startswith('```') or line.startswith('    '):
+                added_code = True
+            if '![' in line:
+                added_images += 1
+
+        for line in deleted_lines:
+            if line.startswith(fm_keys):
+                key = line.split(':')[0].strip()
+                if key not in fm_seen:
+                    fm_seen.add(key)
+                    fm_changes.append(f"{key}配置")
+            if line.startswith('#') and len(deleted_headers) < 2:
+                deleted_headers.append(line.strip('#').strip()[:20])
+
         if fm_changes:
             analysis.append(f"更新{'/'.join(fm_changes[:3])}")
-        
-        # 分析内容变更
-        added_headers = [line for line in added_lines if line.startswith('#')]
-        deleted_headers = [line for line in deleted_lines if line.startswith('#')]
-        added_links = [line for line in added_lines if '[' in line and '](' in line]
-        added_code = [line for line in added_lines if line.startswith('```') or line.startswith('    ')]
-        added_images = [line for line in added_lines if '![' in line]
-        
+
         if added_headers:
-            headers = [h.strip('#').strip()[:20] for h in added_headers[:2]]
-            analysis.append(f"新增章节「{'/'.join(headers)}」")
-        
+            analysis.append(f"新增章节「{'/'.join(added_headers)}」")
+
         if deleted_headers:
-            headers = [h.strip('#').strip()[:20] for h in deleted_headers[:2]]
-            analysis.append(f"删除章节「{'/'.join(headers)}」")
-        
+            analysis.append(f"删除章节「{'/'.join(deleted_headers)}」")
+
         if added_images:
-            analysis.append(f"添加{len(added_images)}张图片")
-        
+            analysis.append(f"添加{added_images}张图片")
+
         if added_links:
-            analysis.append(f"添加{len(added_links)}个链接")
-        
+            analysis.append(f"添加{added_links}个链接")
+
         if added_code:
             analysis.append("添加代码示例")
         
@@ -538,28 +1022,6 @@ class BlogManager:
             'rs': r'fn\s+(\w+)'
         }
         
-        import re
-        pattern = func_patterns.get(lang, r'function\s+(\w+)')
-        
-        added_functions = []
-        deleted_functions = []
-        
-        for line in added_lines:
-            matches = re.findall(pattern, line)
-            if matches:
-                for match in matches:
-                    func_name = match[0] if isinstance(match, tuple) else match
-                    if func_name and func_name not in ['', 'if', 'for', 'while']:
-                        added_functions.append(func_name)
-        
-        for line in deleted_lines:
-            matches = re.findall(pattern, line)
-            if matches:
-                for match in matches:
-                    func_name = match[0] if isinstance(match, tuple) else match
-                    if func_name and func_name not in ['', 'if', 'for', 'while']:
-                        deleted_functions.append(func_name)
-        
         # 分析导入/包含变更
         import_patterns = {
             'py': r'(import\s+\w+|from\s+\w+\s+import)',
@@ -571,11 +1033,7 @@ class BlogManager:
             'go': r'import\s+',
             'rs': r'use\s+[\w::]+',
         }
-        
-        import_pattern = import_patterns.get(lang, r'import')
-        added_imports = [line for line in added_lines if re.search(import_pattern, line)]
-        deleted_imports = [line for line in deleted_lines if re.search(import_pattern, line)]
-        
+
         # 分析类定义
         class_patterns = {
             'py': r'class\s+(\w+)',
@@ -585,20 +1043,40 @@ class BlogManager:
             'js': r'class\s+(\w+)',
             'rs': r'struct\s+(\w+)|enum\s+(\w+)',
         }
-        
-        class_pattern = class_patterns.get(lang, r'class\s+(\w+)')
-        added_classes = [re.findall(class_pattern, line) for line in added_lines if re.search(class_pattern, line)]
-        deleted_classes = [re.findall(class_pattern, line) for line in deleted_lines if re.search(class_pattern, line)]
-        
+
+        func_re = re.compile(func_patterns.get(lang, r'function\s+(\w+)'))
+        import_re = re.compile(import_patterns.get(lang, r'import'))
+        class_re = re.compile(class_patterns.get(lang, r'class\s+(\w+)'))
+
+        def scan_lines(lines, functions):
+            """单次遍历提取函数名并统计导入/类定义，替代3组独立扫描"""
+            imports = 0
+            has_class = False
+            for line in lines:
+                for match in func_re.findall(line):
+                    func_name = match[0] if isinstance(match, tuple) else match
+                    if func_name and func_name not in ['', 'if', 'for', 'while']:
+                        functions.append(func_name)
+                if import_re.search(line):
+                    imports += 1
+                if not has_class and class_re.search(line):
+                    has_class = True
+            return imports, has_class
+
+        added_functions = []
+        deleted_functions = []
+        added_imports, added_classes = scan_lines(added_lines, added_functions)
+        deleted_imports, deleted_classes = scan_lines(deleted_lines, deleted_functions)
+
         # 生成分析结果
         if added_functions:
             analysis.append(f"新增函数: {'/'.join(added_functions[:3])}")
         if deleted_functions:
             analysis.append(f"删除函数: {'/'.join(deleted_functions[:3])}")
         if added_imports:
-            analysis.append(f"新增{len(added_imports)}个导入")
+            analysis.append(f"新增{added_imports}个导入")
         if deleted_imports:
-            analysis.append(f"删除{len(deleted_imports)}个导入")
+            analysis.append(f"删除{deleted_imports}个导入")
         if added_classes:
             analysis.append(f"新增类定义")
         if deleted_classes:
@@ -632,30 +1110,25 @@ class BlogManager:
         elif filepath.endswith('.ini'):
             config_type = "INI配置"
         
-        # 分析配置项变更
-        added_configs = []
-        deleted_configs = []
-        
-        for line in added_lines:
-            if ':' in line and not line.strip().startswith('#'):
-                key = line.split(':')[0].strip().strip('"\'')
-                if key and len(key) < 30:
-                    added_configs.append(key)
-            elif '=' in line and not line.strip().startswith('#'):
-                key = line.split('=')[0].strip().strip('"\'')
-                if key and len(key) < 30:
-                    added_configs.append(key)
-        
-        for line in deleted_lines:
-            if ':' in line and not line.strip().startswith('#'):
-                key = line.split(':')[0].strip().strip('"\'')
-                if key and len(key) < 30:
-                    deleted_configs.append(key)
-            elif '=' in line and not line.strip().startswith('#'):
-                key = line.split('=')[0].strip().strip('"\'')
+        # 分析配置项变更 - strip每行只做一次，键提取逻辑两个方向共用
+        def extract_config_keys(lines):
+            keys = []
+            for line in lines:
+                if line.strip().startswith('#'):
+                    continue
+                if ':' in line:
+                    key = line.split(':')[0].strip().strip('"\'')
+                elif '=' in line:
+                    key = line.split('=')[0].strip().strip('"\'')
+                else:
+                    continue
                 if key and len(key) < 30:
-                    deleted_configs.append(key)
-        
+                    keys.append(key)
+            return keys
+
+        added_configs = extract_config_keys(added_lines)
+        deleted_configs = extract_config_keys(deleted_lines)
+
         if added_configs:
             analysis.append(f"新增{'/'.join(added_configs[:3])}配置")
         if deleted_configs:
@@ -785,20 +1258,33 @@ class BlogManager:
         style_changes = []
         other_changes = []
         
+        group_lists = {
+            'code': code_changes,
+            'config': config_changes,
+            'style': style_changes,
+        }
+
+        # 超大变更集（如目录重组）抽样即可，摘要最终只展示每类2条
+        if len(file_changes) > 500:
+            import random
+            file_changes = random.sample(file_changes, 50)
+
+        all_buckets = (blog_changes, code_changes, config_changes, style_changes, other_changes)
         for change in file_changes:
             analysis = change['analysis']
             filepath = change['filepath']
-            
-            if 'source/_posts/' in filepath:
-                blog_changes.append(analysis)
-            elif any(ext in filepath for ext in ['.py', '.js', '.ts', '.java', '.cpp', '.c', '.go', '.rs']):
-                code_changes.append(analysis)
-            elif any(ext in filepath for ext in ['.yml', '.yaml', '.json', '.toml', '.ini']):
-                config_changes.append(analysis)
-            elif any(ext in filepath for ext in ['.css', '.scss', '.less', '.html', '.jsx', '.tsx', '.vue']):
-                style_changes.append(analysis)
+
+            if filepath.startswith(_POSTS_PREFIX):
+                bucket = blog_changes
             else:
-                other_changes.append(analysis)
+                ext = os.path.splitext(filepath)[1].lower()
+                bucket = group_lists.get(_EXT_GROUP.get(ext), other_changes)
+
+            # 每类只收集展示所需的2条，全部收满后提前结束
+            if len(bucket) < 2:
+                bucket.append(analysis)
+                if all(len(lst) >= 2 for lst in all_buckets):
+                    break
         
         # 构建摘要
         summary_parts = []
@@ -821,227 +1307,298 @@ class BlogManager:
         
         return result or "文件更新"
 
-    def _get_simple_changes_summary(self) -> str:
+    def _get_simple_changes_summary(self, status_entries: list = None) -> str:
         """简单的文件更改摘要（备用方案）"""
         changes_info = []
 
-        # 获取修改的文件列表
-        success, status_output = self._run_command("git status --porcelain")
-        if success and status_output.strip():
-            lines = status_output.strip().split('\n')
-
-            for line in lines:
-                if len(line) > 3:
-                    status = line[:2].strip()
-                    filepath = line[3:].strip()
-
-                    # 清理文件路径：移除引号
-                    if filepath.startswith('"') and filepath.endswith('"'):
-                        filepath = filepath[1:-1]  # 移除首尾引号
-
-                    # 分类文件类型
-                    if filepath.endswith('.md'):
-                        if 'source/_posts/' in filepath:
-                            changes_info.append(f"博客文章: {os.path.basename(filepath)}")
-                        else:
-                            changes_info.append(f"Markdown文件: {os.path.basename(filepath)}")
-                    elif filepath.endswith(('.yml', '.yaml')):
-                        changes_info.append(f"配置文件: {os.path.basename(filepath)}")
-                    elif filepath.endswith(('.js', '.css', '.html')):
-                        changes_info.append(f"主题文件: {os.path.basename(filepath)}")
-                    else:
-                        changes_info.append(f"文件: {os.path.basename(filepath)}")
+        if status_entries is None:
+            status_entries = self._get_status_entries() or []
+
+        for status, filepath in status_entries:
+            # 最多显示5个文件，收满即停，不再扫描剩余条目
+            if len(changes_info) >= 5:
+                break
+            # 手工切片取basename和后缀，git路径固定用'/'分隔，
+            # 省掉逐条的posixpath函数调用
+            basename = filepath[filepath.rfind('/') + 1:]
+            dot = basename.rfind('.')
+            ext = basename[dot:].lower() if dot >= 0 else ''
+            if ext == '.md':
+                if filepath.startswith(_POSTS_PREFIX):
+                    label = "博客文章"
+                else:
+                    label = "Markdown文件"
+            else:
+                label = _SUMMARY_EXT_LABEL.get(ext, "文件")
+            changes_info.append(f"{label}: {basename}")
 
-        return "; ".join(changes_info[:5])  # 最多显示5个文件
+        return "; ".join(changes_info)
 
 
 
     def push_blog(self) -> bool:
         """推送博客到GitHub"""
+        from rich.table import Table
+        from rich.status import Status
+
         if not os.path.exists(self.main_blog_dir):
             self.console.print(f"[red]❌ 博客目录不存在: {self.main_blog_dir}[/red]")
             return False
 
-        original_dir = os.getcwd()
 
-        try:
-            os.chdir(self.main_blog_dir)
+        # 检查是否是Git仓库
+        if not os.path.exists(os.path.join(self.main_blog_dir, ".git")):
+            self.console.print(f"[red]❌ 不是Git仓库: {self.main_blog_dir}[/red]")
+            return False
+
+        # 检查Git状态 - 一次调用同时服务文件表格和变更摘要
+        status_entries = self._get_status_entries()
+        if status_entries is None:
+            self.console.print("[red]❌ 无法获取Git状态[/red]")
+            return False
+
+        if not status_entries:
+            # 无更改状态面板
+            no_changes_panel = Panel(
+                "[bold white]📊 仓库状态检查[/bold white]\n\n"
+                "[green]✅ 状态:[/green] [bold green]仓库已是最新状态[/bold green]\n"
+                "[blue]🌐 远程:[/blue] [dim]已与 GitHub 同步[/dim]\n"
+                "[yellow]📋 变更:[/yellow] [dim]未检测到待处理的修改[/dim]",
+                title="[bold cyan]✨ 无需提交更改[/bold cyan]",
+                title_align="left",
+                border_style="cyan",
+                box=box.ROUNDED,
+                padding=(1, 2),
+                expand=True
+            )
+            self.console.print(no_changes_panel)
+            return True
+
+        # 显示将要提交的文件 - 专业表格格式
+        if status_entries:
+            files_table = Table(
+                show_header=True,
+                header_style="bold white on blue",
+                box=box.ROUNDED,
+                title="[bold white]📋 待提交文件分析[/bold white]",
+                title_style="bold cyan",
+                border_style="bright_cyan",
+                padding=(0, 1),
+                expand=True
+            )
+            files_table.add_column("状态", style="bold yellow", width=10, justify="center")
+            files_table.add_column("文件路径", style="bold white", min_width=40)
+            files_table.add_column("类型", style="bold green", width=15, justify="center")
+            files_table.add_column("操作", style="bold magenta", width=12, justify="center")
+                
+            # 先用纯Python预分类出所有行，再批量add_row；
+            # 表格行数封顶，避免Rich对上千行做O(行×列)测量布局
+            rows = []
+            for status, filepath in status_entries[:self._MAX_TABLE_ROWS]:
+                # 确定文件类型
+                ext = os.path.splitext(filepath)[1].lower()
+                if ext == '.md':
+                    if filepath.startswith(_POSTS_PREFIX):
+                        file_type = "📝 Blog Post"
+                    else:
+                        file_type = "📄 Markdown"
+                else:
+                    file_type = _TABLE_EXT_TYPE.get(ext, "📁 File")
+
+                # 状态标识和操作
+                if 'M' in status:
+                    status_icon = "🔄 已修改"
+                    action = "更新"
+                elif 'A' in status:
+                    status_icon = "➕ 已添加"
+                    action = "创建"
+                elif 'D' in status:
+                    status_icon = "➖ 已删除"
+                    action = "删除"
+                elif 'R' in status:
+                    status_icon = "🔀 已重命名"
+                    action = "重命名"
+                else:
+                    status_icon = f"❓ {status}"
+                    action = "未知"
+
+                rows.append((status_icon, filepath, file_type, action))
+
+            extra = len(status_entries) - len(rows)
+            if extra > 0:
+                rows.append(("…", f"(还有 {extra} 个文件未展示)", "", ""))
+
+            for row in rows:
+                files_table.add_row(*row)
+
+            self.console.print(files_table)
+            self.console.print()
+
+        # 并行执行：git add（磁盘IO）与AI变更分析（网络IO）互不依赖，
+        # 把add的耗时藏进LLM往返里
+        def _analyze_changes():
+            # 单篇文章的常规提交直接套模板，跳过AI往返
+            template_msg = self._template_commit_message(status_entries)
+            if template_msg is not None:
+                return self._get_simple_changes_summary(status_entries), template_msg
+            changes_summary = self._get_changes_summary(status_entries)
+            return changes_summary, self._generate_commit_message(changes_summary)
+
+        repo = self._get_repo()
+
+        def _stage_all():
+            if repo is not None:
+                try:
+                    repo.git.add(A=True)
+                    return True, ""
+                except Exception as e:
+                    return False, str(e)
+            return self._run_command(['git', 'add', '.'], cwd=self.main_blog_dir)
 
-            # 检查是否是Git仓库
-            if not os.path.exists(".git"):
-                self.console.print("[red]❌ 当前目录不是Git仓库[/red]")
-                return False
+        with Status("[magenta]🤖 正在暂存更改并使用 AI 分析...[/magenta]", console=self.console, spinner="bouncingBar"):
+            from concurrent.futures import ThreadPoolExecutor
+            with ThreadPoolExecutor(max_workers=2) as executor:
+                add_future = executor.submit(_stage_all)
+                summary_future = executor.submit(_analyze_changes)
+                success, _ = add_future.result()
+                changes_summary, commit_msg = summary_future.result()
 
-            # 检查Git状态
-            success, status_output = self._run_command("git status --porcelain")
             if not success:
-                self.console.print("[red]❌ 无法获取Git状态[/red]")
+                self.console.print("[red]❌ 添加文件到暂存区失败[/red]")
                 return False
 
-            if not status_output.strip():
-                # 无更改状态面板
-                no_changes_panel = Panel(
-                    "[bold white]📊 仓库状态检查[/bold white]\n\n"
-                    "[green]✅ 状态:[/green] [bold green]仓库已是最新状态[/bold green]\n"
-                    "[blue]🌐 远程:[/blue] [dim]已与 GitHub 同步[/dim]\n"
-                    "[yellow]📋 变更:[/yellow] [dim]未检测到待处理的修改[/dim]",
-                    title="[bold cyan]✨ 无需提交更改[/bold cyan]",
-                    title_align="left",
-                    border_style="cyan",
-                    box=box.ROUNDED,
-                    padding=(1, 2),
-                    expand=True
-                )
-                self.console.print(no_changes_panel)
-                return True
-
-            # 显示将要提交的文件 - 专业表格格式
-            success, short_status = self._run_command("git status --short")
-            if success and short_status.strip():
-                files_table = Table(
-                    show_header=True,
-                    header_style="bold white on blue",
-                    box=box.ROUNDED,
-                    title="[bold white]📋 待提交文件分析[/bold white]",
-                    title_style="bold cyan",
-                    border_style="bright_cyan",
-                    padding=(0, 1),
-                    expand=True
-                )
-                files_table.add_column("状态", style="bold yellow", width=10, justify="center")
-                files_table.add_column("文件路径", style="bold white", min_width=40)
-                files_table.add_column("类型", style="bold green", width=15, justify="center")
-                files_table.add_column("操作", style="bold magenta", width=12, justify="center")
-                
-                status_lines = short_status.strip().split('\n')
-                for line in status_lines:
-                    if len(line) > 3:
-                        status = line[:2].strip()
-                        filepath = line[3:].strip()
-                        
-                        # 确定文件类型
-                        if filepath.endswith('.md'):
-                            if 'source/_posts/' in filepath:
-                                file_type = "📝 Blog Post"
-                            else:
-                                file_type = "📄 Markdown"
-                        elif filepath.endswith(('.yml', '.yaml')):
-                            file_type = "⚙️ Config"
-                        elif filepath.endswith(('.js', '.css', '.html')):
-                            file_type = "🎨 Theme"
-                        elif filepath.endswith(('.py', '.ts', '.jsx')):
-                            file_type = "💻 Code"
-                        elif filepath.endswith(('.jpg', '.png', '.gif', '.webp')):
-                            file_type = "🖼️ Image"
-                        else:
-                            file_type = "📁 File"
-                        
-                        # 状态标识和操作
-                        if 'M' in status:
-                            status_icon = "🔄 已修改"
-                            action = "更新"
-                        elif 'A' in status:
-                            status_icon = "➕ 已添加"
-                            action = "创建"
-                        elif 'D' in status:
-                            status_icon = "➖ 已删除"
-                            action = "删除"
-                        elif 'R' in status:
-                            status_icon = "🔀 已重命名"
-                            action = "重命名"
-                        else:
-                            status_icon = f"❓ {status}"
-                            action = "未知"
-                        
-                        files_table.add_row(status_icon, filepath, file_type, action)
-                
-                self.console.print(files_table)
-                self.console.print()
-
-            # 添加所有更改 - 带进度指示
-            with Status("[blue]📦 正在暂存所有更改...[/blue]", console=self.console, spinner="dots"):
-                success, _ = self._run_command("git add .")
-                if not success:
-                    self.console.print("[red]❌ 添加文件到暂存区失败[/red]")
-                    return False
+        self.console.print("[green]✓[/green] [bold]所有更改已成功暂存[/bold]")
+        self.console.print()
             
-            self.console.print("[green]✓[/green] [bold]所有更改已成功暂存[/bold]")
-            self.console.print()
+        # AI 分析结果展示面板
+        analysis_panel = Panel(
+            f"[bold white]🔍 AI 分析结果[/bold white]\n\n"
+            f"[cyan]📊 更改摘要:[/cyan]\n[dim white]{changes_summary}[/dim white]\n\n"
+            f"[yellow]💬 生成的提交信息:[/yellow]\n[bold green]{commit_msg}[/bold green]",
+            title="[bold magenta]🤖 智能提交分析[/bold magenta]",
+            title_align="left",
+            border_style="magenta",
+            box=box.ROUNDED,
+            padding=(1, 2),
+            expand=True
+        )
+        self.console.print(analysis_panel)
+        self.console.print()
 
-            # 智能生成提交信息 - 专业分析面板
-            with Status("[magenta]🤖 正在使用 AI 分析更改...[/magenta]", console=self.console, spinner="bouncingBar"):
-                changes_summary = self._get_changes_summary()
-                commit_msg = self._generate_commit_message(changes_summary)
+        # 执行提交 - 带状态指示
+        with Status("[yellow]💾 正在创建提交...[/yellow]", console=self.console, spinner="arc"):
+            if repo is not None:
+                try:
+                    repo.index.commit(commit_msg)
+                    success, commit_output = True, ""
+                except Exception as e:
+                    success, commit_output = False, str(e)
+            else:
+                success, commit_output = self._run_command(['git', 'commit', '-m', commit_msg], cwd=self.main_blog_dir)
+            if not success:
+                self.console.print("[red]❌ 提交失败[/red]")
+                self.console.print(f"[dim red]错误信息: {commit_output}[/dim red]")
+                return False
             
-            # AI 分析结果展示面板
-            analysis_panel = Panel(
-                f"[bold white]🔍 AI 分析结果[/bold white]\n\n"
-                f"[cyan]📊 更改摘要:[/cyan]\n[dim white]{changes_summary}[/dim white]\n\n"
-                f"[yellow]💬 生成的提交信息:[/yellow]\n[bold green]{commit_msg}[/bold green]",
-                title="[bold magenta]🤖 智能提交分析[/bold magenta]",
+        self.console.print("[green]✓[/green] [bold]提交创建成功[/bold]")
+        self.console.print()
+
+        # 推送到远程仓库 - 专业部署状态
+        with Status("[blue]🚀 正在推送到 GitHub 仓库...[/blue]", console=self.console, spinner="bouncingBall"):
+            if repo is not None:
+                try:
+                    repo.remotes.origin.push("main").raise_if_error()
+                    success, push_output = True, ""
+                except Exception as e:
+                    success, push_output = False, str(e)
+            else:
+                success, push_output = self._run_command(['git', 'push', 'origin', 'main'], cwd=self.main_blog_dir)
+
+        if success:
+            # 成功部署结果面板
+            success_panel = Panel(
+                "[bold white]🎉 部署成功完成[/bold white]\n\n"
+                "[green]✅ 状态:[/green] [bold green]所有更改已推送到远程仓库[/bold green]\n"
+                "[blue]🌐 仓库地址:[/blue] [link=https://github.com/charrrrls/LeionWeb]https://github.com/charrrrls/LeionWeb[/link]\n"
+                "[magenta]🏷️  分支:[/magenta] [bold]main[/bold]\n"
+                f"[cyan]💬 提交信息:[/cyan] [dim]{commit_msg}[/dim]",
+                title="[bold green]🚀 部署成功[/bold green]",
                 title_align="left",
-                border_style="magenta",
-                box=box.ROUNDED,
+                border_style="green",
+                box=box.DOUBLE,
                 padding=(1, 2),
                 expand=True
             )
-            self.console.print(analysis_panel)
-            self.console.print()
+            self.console.print(success_panel)
+            return True
+        else:
+            # 失败部署结果面板
+            error_panel = Panel(
+                "[bold white]❌ 部署失败[/bold white]\n\n"
+                "[red]✗ 状态:[/red] [bold red]推送到远程仓库失败[/bold red]\n"
+                "[yellow]🔧 建议:[/yellow] [dim]请检查网络连接和 Git 配置[/dim]\n\n"
+                f"[dim red]错误详情:[/dim red]\n[dim]{push_output}[/dim]",
+                title="[bold red]❌ 部署错误[/bold red]",
+                title_align="left",
+                border_style="red",
+                box=box.DOUBLE,
+                padding=(1, 2),
+                expand=True
+            )
+            self.console.print(error_panel)
+            return False
+                
 
-            # 执行提交 - 带状态指示
-            with Status("[yellow]💾 正在创建提交...[/yellow]", console=self.console, spinner="arc"):
-                success, commit_output = self._run_command(f'git commit -m "{commit_msg}"')
-                if not success:
-                    self.console.print("[red]❌ 提交失败[/red]")
-                    self.console.print(f"[dim red]错误信息: {commit_output}[/dim red]")
-                    return False
-            
-            self.console.print("[green]✓[/green] [bold]提交创建成功[/bold]")
-            self.console.print()
+    def _max_source_mtime(self) -> float:
+        """递归扫描source/求最大mtime - os.scandir纯Python实现，无子进程开销"""
+        newest = 0.0
+        stack = [os.path.join(self.blog_dir, 'source')]
+        while stack:
+            directory = stack.pop()
+            try:
+                with os.scandir(directory) as entries:
+                    for entry in entries:
+                        try:
+                            if entry.is_dir(follow_symlinks=False):
+                                stack.append(entry.path)
+                            else:
+                                mtime = entry.stat(follow_symlinks=False).st_mtime
+                                if mtime > newest:
+                                    newest = mtime
+                        except OSError:
+                            continue
+            except OSError:
+                continue
+        return newest
+
+    def _sources_changed_since_last_clean(self) -> bool:
+        """判断source/自上次成功clean后是否有改动，无戳记文件时视为有改动"""
+        stamp_path = os.path.join(self.blog_dir, '.hexo-clean-stamp')
+        try:
+            with open(stamp_path, 'r', encoding='utf-8') as f:
+                stamp_mtime = float(f.read().strip())
+        except (OSError, ValueError):
+            return True
+        return self._max_source_mtime() > stamp_mtime
 
-            # 推送到远程仓库 - 专业部署状态
-            with Status("[blue]🚀 正在推送到 GitHub 仓库...[/blue]", console=self.console, spinner="bouncingBall"):
-                success, push_output = self._run_command("git push origin main")
+    def _update_clean_stamp(self) -> None:
+        """记录本次clean时source/的最大mtime，供下次跳过冗余的hexo clean"""
+        stamp_path = os.path.join(self.blog_dir, '.hexo-clean-stamp')
+        try:
+            with open(stamp_path, 'w', encoding='utf-8') as f:
+                f.write(str(self._max_source_mtime()))
+        except OSError:
+            pass
 
-            if success:
-                # 成功部署结果面板
-                success_panel = Panel(
-                    "[bold white]🎉 部署成功完成[/bold white]\n\n"
-                    "[green]✅ 状态:[/green] [bold green]所有更改已推送到远程仓库[/bold green]\n"
-                    "[blue]🌐 仓库地址:[/blue] [link=https://github.com/charrrrls/LeionWeb]https://github.com/charrrrls/LeionWeb[/link]\n"
-                    "[magenta]🏷️  分支:[/magenta] [bold]main[/bold]\n"
-                    f"[cyan]💬 提交信息:[/cyan] [dim]{commit_msg}[/dim]",
-                    title="[bold green]🚀 部署成功[/bold green]",
-                    title_align="left",
-                    border_style="green",
-                    box=box.DOUBLE,
-                    padding=(1, 2),
-                    expand=True
-                )
-                self.console.print(success_panel)
-                return True
-            else:
-                # 失败部署结果面板
-                error_panel = Panel(
-                    "[bold white]❌ 部署失败[/bold white]\n\n"
-                    "[red]✗ 状态:[/red] [bold red]推送到远程仓库失败[/bold red]\n"
-                    "[yellow]🔧 建议:[/yellow] [dim]请检查网络连接和 Git 配置[/dim]\n\n"
-                    f"[dim red]错误详情:[/dim red]\n[dim]{push_output}[/dim]",
-                    title="[bold red]❌ 部署错误[/bold red]",
-                    title_align="left",
-                    border_style="red",
-                    box=box.DOUBLE,
-                    padding=(1, 2),
-                    expand=True
-                )
-                self.console.print(error_panel)
-                return False
-                
-        finally:
-            os.chdir(original_dir)
-            
     def serve_blog(self) -> bool:
         """启动博客本地服务器"""
+        from rich.align import Align
+        from rich.columns import Columns
+        from rich.tree import Tree
+        from rich.table import Table
+        from rich.progress import Progress, SpinnerColumn, TextColumn, BarColumn, TimeElapsedColumn
+        from rich.rule import Rule
+
         # 创建专业服务器标题
         start_time = create_leion_server_header(self.console)
         
@@ -1078,8 +1635,6 @@ class BlogManager:
         self.console.print(Rule("[bold blue]🚀 SERVER INITIALIZATION PIPELINE[/bold blue]", style="blue"))
         self.console.print()
 
-        os.chdir(self.blog_dir)
-
         # 清理缓存阶段
         with Progress(
             SpinnerColumn(style="cyan"),
@@ -1089,13 +1644,18 @@ class BlogManager:
             console=self.console,
             transient=True,
         ) as progress:
-            task = progress.add_task("[cyan]🧹 Cleaning cache...[/cyan]", total=None)
-            success, _ = self._run_command("hexo clean")
-            
-            if success:
-                self.console.print("[green]✅[/green] [bold green]Cache cleaned successfully[/bold green]")
+            if self._sources_changed_since_last_clean():
+                task = progress.add_task("[cyan]🧹 Cleaning cache...[/cyan]", total=None)
+                success, _ = self._run_command(['hexo', 'clean'], cwd=self.blog_dir)
+
+                if success:
+                    self._update_clean_stamp()
+                    self.console.print("[green]✅[/green] [bold green]Cache cleaned successfully[/bold green]")
+                else:
+                    self.console.print("[yellow]⚠️[/yellow] [bold yellow]Cache cleanup failed, continuing...[/bold yellow]")
             else:
-                self.console.print("[yellow]⚠️[/yellow] [bold yellow]Cache cleanup failed, continuing...[/bold yellow]")
+                # 源文件无变化，省掉一次Node启动+插件加载
+                self.console.print("[green]✅[/green] [bold green]Cache already fresh, clean skipped[/bold green]")
 
         self.console.print()
         
@@ -1146,13 +1706,41 @@ class BlogManager:
         self.console.print(guide_panel)
         self.console.print()
 
-        # 启动服务器（阻塞运行）
+        # 启动服务器（阻塞运行）- Popen直接exec省掉shell fork，
+        # 按行转发输出，在hexo真正开始监听时给出就绪提示
+        proc = None
         try:
             self.console.print(Rule("[bold magenta]🎬 LAUNCHING HEXO SERVER[/bold magenta]", style="magenta"))
             self.console.print()
-            subprocess.run("hexo server", shell=True, cwd=self.blog_dir)
+            proc = subprocess.Popen(
+                ['hexo', 'server'],
+                cwd=self.blog_dir,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.STDOUT,
+                bufsize=1,
+                text=True,
+            )
+            for line in proc.stdout:
+                line = line.rstrip()
+                if line:
+                    self.console.print(f"[dim]{line}[/dim]")
+                match = _HEXO_READY_RE.search(line)
+                if match:
+                    self.console.print(Panel(
+                        f"[bold green]🌐 服务器已就绪: {match.group(1)}[/bold green]",
+                        border_style="green",
+                        box=box.ROUNDED
+                    ))
+            proc.wait()
             return True
         except KeyboardInterrupt:
+            if proc is not None:
+                import signal
+                try:
+                    proc.send_signal(signal.SIGINT)
+                    proc.wait(timeout=5)
+                except Exception:
+                    proc.kill()
             self.console.print()
             self.console.print(Rule("[bold yellow]🛑 Server Shutdown[/bold yellow]", style="yellow"))
             self.console.print()
@@ -1179,14 +1767,18 @@ class BlogManager:
             return False
 
         print_progress("生成静态博客文件...")
-        os.chdir(self.blog_dir)
 
-        # 清理并生成
-        success, _ = self._run_command("hexo clean")
-        if not success:
-            print_warning("清理缓存失败，继续生成...")
+        # 清理并生成 - 源文件无变化时跳过冗余的hexo clean
+        if self._sources_changed_since_last_clean():
+            success, _ = self._run_command(['hexo', 'clean'], cwd=self.blog_dir)
+            if success:
+                self._update_clean_stamp()
+            else:
+                print_warning("清理缓存失败，继续生成...")
+        else:
+            print_info("源文件无变化，跳过清理缓存")
 
-        success, output = self._run_command("hexo generate")
+        success, output = self._run_command(['hexo', 'generate'], cwd=self.blog_dir)
         if success:
             print_success("博客生成成功！")
             return True
@@ -1199,132 +1791,253 @@ class BlogManager:
         if not os.path.exists(self.posts_dir):
             return None
             
-        # 获取所有-zh.md文件及其修改时间
-        zh_files = []
-        for file in os.listdir(self.posts_dir):
-            if file.endswith('-zh.md'):
-                file_path = os.path.join(self.posts_dir, file)
-                try:
-                    mtime = os.path.getmtime(file_path)
-                    zh_files.append((file, mtime))
-                except OSError:
-                    # 如果无法获取修改时间，使用当前时间
-                    import time
-                    zh_files.append((file, time.time()))
-        
+        # 获取所有-zh.md文件及其修改时间 - 目录扫描按目录mtime缓存，
+        # 批量场景下同进程重复调用直接命中，免去readdir和逐文件stat
+        try:
+            dir_mtime_ns = os.stat(self.posts_dir).st_mtime_ns
+        except OSError:
+            return None
+        zh_files = _list_zh_posts(self.posts_dir, dir_mtime_ns)
+
         if not zh_files:
             return None
             
         # 清理搜索词
         clean_name = partial_name.lower().strip()
-        
-        # 1. 精确匹配（去掉-zh.md后缀）
-        exact_matches = []
-        for file, mtime in zh_files:
+
+        # 1. 精确匹配（去掉-zh.md后缀）- 同名取最新，一次哈希查找代替线性扫描
+        latest_by_name = {}
+        for file, path, mtime in zh_files:
             file_name = file.replace('-zh.md', '').lower()
-            if file_name == clean_name:
-                exact_matches.append((file, mtime))
-        
-        if exact_matches:
-            # 如果有精确匹配，按时间倒排选择最新的
-            exact_matches.sort(key=lambda x: x[1], reverse=True)
-            return os.path.join(self.posts_dir, exact_matches[0][0])
-        
-        # 2. 包含匹配
+            prev = latest_by_name.get(file_name)
+            if prev is None or mtime > prev[1]:
+                latest_by_name[file_name] = (path, mtime)
+
+        exact = latest_by_name.get(clean_name)
+        if exact:
+            return exact[0]
+
+        # 2. 包含匹配 - 查询字符集只构建一次，文件名字符集跨调用缓存
+        query_set = frozenset(clean_name)
+        char_cache = self._get_name_char_cache()
         partial_matches = []
-        for file, mtime in zh_files:
+        for file, path, mtime in zh_files:
             file_name = file.replace('-zh.md', '').lower()
             if clean_name in file_name or file_name in clean_name:
-                similarity = self._calculate_similarity(clean_name, file_name)
-                partial_matches.append((file, mtime, similarity))
+                name_set = char_cache.get(file_name)
+                if name_set is None:
+                    name_set = char_cache[file_name] = frozenset(file_name)
+                similarity = self._calculate_similarity(query_set, name_set)
+                partial_matches.append((file, path, mtime, similarity))
         
         if partial_matches:
             # 先按相似度分组，相似度相同的按时间排序
             # 找出最高相似度
-            max_similarity = max(match[2] for match in partial_matches)
-            best_matches = [match for match in partial_matches if match[2] == max_similarity]
-            
+            max_similarity = max(match[3] for match in partial_matches)
+            best_matches = [match for match in partial_matches if match[3] == max_similarity]
+
             # 如果有多个相同最高相似度的文件，选择最新的
             if len(best_matches) > 1:
-                best_matches.sort(key=lambda x: x[1], reverse=True)  # 按时间倒排
-                selected_file = best_matches[0][0]
-                self.console.print(f"[dim cyan]🔍 发现 {len(best_matches)} 个相似匹配，已选择最新的: {selected_file}[/dim cyan]")
-            else:
-                selected_file = best_matches[0][0]
-            
-            return os.path.join(self.posts_dir, selected_file)
-            
+                best_matches.sort(key=lambda x: x[2], reverse=True)  # 按时间倒排
+                self.console.print(f"[dim cyan]🔍 发现 {len(best_matches)} 个相似匹配，已选择最新的: {best_matches[0][0]}[/dim cyan]")
+
+            return best_matches[0][1]
+
         return None
     
-    def _calculate_similarity(self, str1: str, str2: str) -> float:
-        """计算字符串相似度"""
-        # 简单的相似度计算
-        common_chars = set(str1) & set(str2)
-        total_chars = set(str1) | set(str2)
-        return len(common_chars) / len(total_chars) if total_chars else 0
+    def _read_front_matter_only(self, path: str) -> str:
+        """只读取文件头部的front-matter
+
+        逐行读到第二个---分隔符即停，为展示元信息不必把整篇文章读入内存。
+        """
+        lines = []
+        delimiters = 0
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                for line in f:
+                    if line.strip() == '---':
+                        delimiters += 1
+                        if delimiters == 2:
+                            break
+                        continue
+                    if delimiters == 1:
+                        lines.append(line)
+        except Exception:
+            return ""
+        return ''.join(lines)
+
+    def _get_name_char_cache(self) -> dict:
+        """获取文件名字符集缓存，posts目录mtime变化时整体失效"""
+        try:
+            dir_mtime = os.path.getmtime(self.posts_dir)
+        except OSError:
+            dir_mtime = None
+        if dir_mtime != self._name_cache_mtime:
+            self._name_char_cache = {}
+            self._name_cache_mtime = dir_mtime
+        return self._name_char_cache
+
+    def _calculate_similarity(self, chars1: frozenset, chars2: frozenset) -> float:
+        """计算字符集Jaccard相似度（入参为预构建的frozenset，避免重复建集）"""
+        total = len(chars1 | chars2)
+        return len(chars1 & chars2) / total if total else 0
     
+    @staticmethod
+    def _scan_markdown_stats(text: str) -> dict:
+        """单次遍历统计Markdown文档指标，替代多次全文扫描"""
+        words = 0
+        headers = 0
+        paragraphs = 0
+        code_fences = 0
+        brackets = 0
+        link_markers = 0
+
+        for line in text.splitlines():
+            stripped = line.strip()
+            if stripped.startswith('#'):
+                headers += 1
+            if stripped and not line.startswith('#'):
+                paragraphs += 1
+            words += len(line.split())
+            code_fences += line.count('```')
+            brackets += line.count('[')
+            link_markers += line.count('](')
+
+        return {
+            'chars': len(text),
+            'words': words,
+            'headers': headers,
+            'paragraphs': paragraphs,
+            'code_blocks': code_fences // 2,  # 除以2因为```成对出现
+            'brackets': brackets,
+            'link_markers': link_markers,
+        }
+
     def _analyze_content_changes(self, original: str, optimized: str) -> dict:
         """分析内容变化详情"""
-        original_lines = original.split('\n')
-        optimized_lines = optimized.split('\n')
-        
-        # 基础统计
-        original_chars = len(original)
-        optimized_chars = len(optimized)
-        original_words = len(original.split())
-        optimized_words = len(optimized.split())
-        
+        orig = self._scan_markdown_stats(original)
+        opt = self._scan_markdown_stats(optimized)
+
         # 分析变化
-        char_diff = optimized_chars - original_chars
-        word_diff = optimized_words - original_words
-        char_change_percent = (char_diff / original_chars * 100) if original_chars > 0 else 0
-        
-        # 内容结构分析
-        original_headers = len([line for line in original_lines if line.strip().startswith('#')])
-        optimized_headers = len([line for line in optimized_lines if line.strip().startswith('#')])
-        
-        original_code_blocks = original.count('```')
-        optimized_code_blocks = optimized.count('```')
-        
-        original_links = original.count('[') + original.count('](')
-        optimized_links = optimized.count('[') + optimized.count('](')
-        
-        # 段落分析
-        original_paragraphs = len([line for line in original_lines if line.strip() and not line.startswith('#')])
-        optimized_paragraphs = len([line for line in optimized_lines if line.strip() and not line.startswith('#')])
-        
+        char_diff = opt['chars'] - orig['chars']
+        word_diff = opt['words'] - orig['words']
+        char_change_percent = (char_diff / orig['chars'] * 100) if orig['chars'] > 0 else 0
+
         return {
-            'original_chars': original_chars,
-            'optimized_chars': optimized_chars,
+            'original_chars': orig['chars'],
+            'optimized_chars': opt['chars'],
             'char_diff': char_diff,
             'char_change_percent': char_change_percent,
-            'original_words': original_words,
-            'optimized_words': optimized_words,
+            'original_words': orig['words'],
+            'optimized_words': opt['words'],
             'word_diff': word_diff,
-            'original_headers': original_headers,
-            'optimized_headers': optimized_headers,
-            'header_diff': optimized_headers - original_headers,
-            'original_code_blocks': original_code_blocks // 2,  # 除以2因为```成对出现
-            'optimized_code_blocks': optimized_code_blocks // 2,
-            'original_links': original_links // 2,
-            'optimized_links': optimized_links // 2,
-            'original_paragraphs': original_paragraphs,
-            'optimized_paragraphs': optimized_paragraphs,
-            'paragraph_diff': optimized_paragraphs - original_paragraphs
+            'original_headers': orig['headers'],
+            'optimized_headers': opt['headers'],
+            'header_diff': opt['headers'] - orig['headers'],
+            'original_code_blocks': orig['code_blocks'],
+            'optimized_code_blocks': opt['code_blocks'],
+            'original_links': (orig['brackets'] + orig['link_markers']) // 2,
+            'optimized_links': (opt['brackets'] + opt['link_markers']) // 2,
+            'original_paragraphs': orig['paragraphs'],
+            'optimized_paragraphs': opt['paragraphs'],
+            'paragraph_diff': opt['paragraphs'] - orig['paragraphs']
         }
     
+    @staticmethod
+    def _build_article_prompt(template: str, article_content: str) -> str:
+        """拼接提示词 - 用partition代替format，避免对整篇文章再做一次完整拷贝"""
+        prefix, sep, suffix = template.partition('{article_content}')
+        if not sep:
+            return template
+        return ''.join((prefix, article_content, suffix))
+
+    def _stream_generate(self, prompt: str, status_label: str) -> str:
+        """优先流式调用AI，按块累积并实时显示进度；客户端不支持时回退批量模式"""
+        if hasattr(self.client, 'chat_stream'):
+            try:
+                received = 0
+                with self.console.status(f"[bold cyan]{status_label}...", spinner="dots") as status:
+                    def on_chunk(chunk: str) -> None:
+                        nonlocal received
+                        received += len(chunk)
+                        status.update(f"[bold cyan]{status_label}... 已接收 {received} 字符")
+
+                    result = self.client.chat_stream(
+                        prompt, max_tokens=4000, temperature=0.7, on_chunk=on_chunk
+                    )
+                if result and result.strip():
+                    return result
+            except Exception as e:
+                self.console.print(f"[dim yellow]⚠️ 流式生成失败，回退批量模式: {e}[/dim yellow]")
+        return self.client.generate(prompt, max_tokens=4000, temperature=0.7)
+
+    def _parse_post(self, content: str):
+        """拆分front-matter与正文，格式不合法时返回None
+
+        用index+切片代替split('---', 2)，不构造中间列表；按对象身份
+        缓存最近一次结果，优化→翻译流水线对同一内容只解析一次。
+        """
+        cached = self._parsed_post
+        if cached is not None and cached[0] is content:
+            return cached[1], cached[2]
+
+        try:
+            fm_start = content.index('---') + 3
+            fm_end = content.index('---', fm_start)
+        except ValueError:
+            return None
+
+        front_matter = content[fm_start:fm_end]
+        body = content[fm_end + 3:]
+        self._parsed_post = (content, front_matter, body)
+        return front_matter, body
+
+    def _get_ai_helper(self):
+        """懒加载并复用进程内AIHelper实例
+
+        每次fork python3 ai_helper.py都要冷启动解释器并重建HTTP会话
+        (300-800ms)；进程内实例只初始化一次，后续调用全部走热路径。
+        """
+        if self._ai_helper is None and not self._ai_helper_failed:
+            try:
+                from ai_helper import AIHelper
+                self._ai_helper = AIHelper()
+            except Exception:
+                self._ai_helper_failed = True
+        return self._ai_helper
+
+    def _fallback_generate(self, prompt: str, command: str) -> str:
+        """AI客户端失败后的回退：优先进程内调用ai_helper
+
+        直接import省掉每次回退的解释器启动和shell转义；
+        仅当模块不可导入时（脚本在sys.path之外）才退回外部脚本。
+        """
+        self._get_ai_helper()
+
+        if self._ai_helper is not None:
+            try:
+                return self._ai_helper.call_ai(prompt, max_tokens=4000)
+            except Exception as e:
+                self.console.print(f"[dim red]🔍 进程内回退失败: {e}[/dim red]")
+                return None
+
+        success, output = self._run_command(
+            [*self._ai_argv, command, prompt]
+        )
+        return output if success else None
+
     def _optimize_chinese_article(self, content: str) -> tuple[str, dict]:
         """使用AI优化中文文章，返回优化后的内容和统计信息"""
-        start_time = datetime.now()
+        # perf_counter单次clock_gettime即可计时，无datetime/timedelta分配
+        t0 = time.perf_counter()
         
         try:
             # 提取front-matter和正文
-            parts = content.split('---', 2)
-            if len(parts) < 3:
+            parsed = self._parse_post(content)
+            if parsed is None:
                 return content, {}
-                
-            front_matter = parts[1]
-            article_content = parts[2]
+
+            front_matter, article_content = parsed
             
             # 加载优化提示词模板
             optimize_template = self._load_prompt_template(self.optimizer_config)
@@ -1344,31 +2057,28 @@ class BlogManager:
 请直接返回优化后的文章正文内容。"""
             
             # 生成完整的优化提示词
-            optimize_prompt = optimize_template.format(article_content=article_content)
+            optimize_prompt = self._build_article_prompt(optimize_template, article_content)
 
             optimized_content = None
-            
+
             if self.client:
                 try:
-                    optimized_content = self.client.generate(optimize_prompt, max_tokens=4000, temperature=0.7)
+                    optimized_content = self._stream_generate(optimize_prompt, "AI优化生成中")
                     if not (optimized_content and optimized_content.strip()):
                         optimized_content = None
                 except Exception as e:
                     self.console.print(f"[dim red]🔍 AI客户端优化失败: {e}[/dim red]")
                     optimized_content = None
             
-            # 备用方案：使用ai_helper脚本
+            # 备用方案：进程内调用ai_helper
             if not optimized_content:
-                success, optimized_content = self._run_command(
-                    f'python3 "{self.ai_helper_script}" optimize "{self._clean_summary_for_command(optimize_prompt)}"'
-                )
-                if not (success and optimized_content and optimized_content.strip()):
+                optimized_content = self._fallback_generate(optimize_prompt, "optimize")
+                if not (optimized_content and optimized_content.strip()):
                     optimized_content = None
             
             # 计算处理时间
-            end_time = datetime.now()
-            processing_time = (end_time - start_time).total_seconds()
-            
+            processing_time = time.perf_counter() - t0
+
             if optimized_content:
                 final_content = f"---{front_matter}---\n\n{optimized_content.strip()}"
                 
@@ -1382,33 +2092,34 @@ class BlogManager:
                 return content, {'processing_time': processing_time, 'success': False}
                 
         except Exception as e:
-            end_time = datetime.now()
-            processing_time = (end_time - start_time).total_seconds()
+            processing_time = time.perf_counter() - t0
             self.console.print(f"[dim red]🔍 优化失败: {e}[/dim red]")
             return content, {'processing_time': processing_time, 'success': False, 'error': str(e)}
     
     def _analyze_translation_quality(self, chinese_content: str, english_content: str) -> dict:
         """分析翻译质量统计"""
-        # 基础统计
-        chinese_chars = len(chinese_content)
-        english_chars = len(english_content)
-        chinese_words = len(chinese_content.split())
-        english_words = len(english_content.split())
-        
+        zh = self._scan_markdown_stats(chinese_content)
+        en = self._scan_markdown_stats(english_content)
+
+        chinese_chars = zh['chars']
+        english_chars = en['chars']
+        chinese_words = zh['words']
+        english_words = en['words']
+
         # 结构保持度分析
-        chinese_headers = len([line for line in chinese_content.split('\n') if line.strip().startswith('#')])
-        english_headers = len([line for line in english_content.split('\n') if line.strip().startswith('#')])
-        
-        chinese_code_blocks = chinese_content.count('```') // 2
-        english_code_blocks = english_content.count('```') // 2
-        
-        chinese_links = chinese_content.count('](')
-        english_links = english_content.count('](')
-        
+        chinese_headers = zh['headers']
+        english_headers = en['headers']
+
+        chinese_code_blocks = zh['code_blocks']
+        english_code_blocks = en['code_blocks']
+
+        chinese_links = zh['link_markers']
+        english_links = en['link_markers']
+
         # 段落统计
-        chinese_paragraphs = len([line for line in chinese_content.split('\n') if line.strip() and not line.startswith('#')])
-        english_paragraphs = len([line for line in english_content.split('\n') if line.strip() and not line.startswith('#')])
-        
+        chinese_paragraphs = zh['paragraphs']
+        english_paragraphs = en['paragraphs']
+
         # 计算比率
         char_ratio = english_chars / chinese_chars if chinese_chars > 0 else 0
         word_ratio = english_words / chinese_words if chinese_words > 0 else 0
@@ -1447,30 +2158,46 @@ class BlogManager:
             'structure_preservation': structure_preservation
         }
 
+    # 翻译结果的持久化缓存目录
+    _TRANSLATION_CACHE_DIR = os.path.expanduser("~/.cache/ai-scripts/translations")
+
+    def _load_translation_cache(self, cache_key: str):
+        """按内容哈希读取已缓存的翻译结果，未命中或损坏时返回None"""
+        import json
+        try:
+            cache_file = os.path.join(self._TRANSLATION_CACHE_DIR, f"{cache_key}.json")
+            with open(cache_file, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            return data['translated_content'], data['stats']
+        except Exception:
+            return None
+
+    def _store_translation_cache(self, cache_key: str, translated_content: str, stats: dict) -> None:
+        """持久化翻译结果，缓存写入失败不影响主流程"""
+        import json
+        try:
+            os.makedirs(self._TRANSLATION_CACHE_DIR, exist_ok=True)
+            cache_file = os.path.join(self._TRANSLATION_CACHE_DIR, f"{cache_key}.json")
+            with open(cache_file, 'w', encoding='utf-8') as f:
+                json.dump({'translated_content': translated_content, 'stats': stats},
+                          f, ensure_ascii=False)
+        except Exception:
+            pass
+
     def _translate_to_english(self, content: str, zh_filename: str) -> tuple[str, dict]:
         """翻译中文文章为英文，返回翻译内容和统计信息"""
-        start_time = datetime.now()
+        t0 = time.perf_counter()
         
         try:
             # 提取front-matter和正文
-            parts = content.split('---', 2)
-            if len(parts) < 3:
+            parsed = self._parse_post(content)
+            if parsed is None:
                 return "", {'processing_time': 0, 'success': False, 'error': 'Invalid content format'}
-                
-            front_matter = parts[1]
-            article_content = parts[2]
+
+            front_matter, article_content = parsed
             
-            # 提取原始front-matter中的各个字段
-            import re
-            title_match = re.search(r'title:\s*(.+)', front_matter)
-            slug_match = re.search(r'slug:\s*(.+)', front_matter)
-            author_match = re.search(r'author:\s*(.+)', front_matter)
-            cover_match = re.search(r'cover:\s*(.+)', front_matter)
-            tags_match = re.search(r'tags:\s*\n((?:\s*-\s*.+\n?)*)', front_matter)
-            categories_match = re.search(r'categories:\s*\n((?:\s*-\s*.+\n?)*)', front_matter)
-            password_match = re.search(r'password:\s*(.+)', front_matter)
-            abbrlink_match = re.search(r'abbrlink:\s*(.+)', front_matter)
-            date_match = re.search(r'date:\s*(.+)', front_matter)
+            # 单次逐行扫描提取front-matter全部字段
+            fm = _parse_front_matter(front_matter)
             
             # 加载翻译提示词模板
             translate_template = self._load_prompt_template(self.translator_config)
@@ -1490,126 +2217,124 @@ class BlogManager:
 请直接返回翻译后的英文正文内容。"""
             
             # 生成完整的翻译提示词
-            translate_prompt = translate_template.format(article_content=article_content)
+            translate_prompt = self._build_article_prompt(translate_template, article_content)
+
+            # 内容哈希缓存：未改动的文章重复翻译直接命中磁盘，省掉数秒的LLM往返
+            import hashlib
+            cache_key = hashlib.sha256(
+                (front_matter + '\x00' + translate_prompt).encode('utf-8')
+            ).hexdigest()
+            cached = self._load_translation_cache(cache_key)
+            if cached is not None:
+                self.console.print("[dim cyan]🗂 命中翻译缓存，跳过AI调用[/dim cyan]")
+                return cached
 
             translated_content = None
             final_result = ""
             
             # 生成英文版本的front-matter
             def generate_english_title(chinese_title):
-                # 简单的中英文映射
-                mappings = {
-                    '详解': 'Explained',
-                    '指南': 'Guide', 
-                    '教程': 'Tutorial',
-                    '入门': 'Getting Started',
-                    '实战': 'Practice',
-                    '深入': 'Deep Dive',
-                    '优化': 'Optimization',
-                    '最佳实践': 'Best Practices',
-                    '装饰器': 'Decorators',
-                    '写文章': 'Writing Articles'
-                }
-                
-                english_title = chinese_title
-                for cn, en in mappings.items():
-                    if cn in english_title:
-                        english_title = english_title.replace(cn, en)
-                
-                return english_title
+                # 模块级映射 + 一次正则扫描替换全部常见词
+                return _TITLE_SUB_RE.sub(lambda m: _TITLE_MAPPINGS[m.group()], chinese_title)
             
             def generate_english_slug(chinese_slug):
                 # 保持slug的基本结构，如果已经是英文就不变
-                if chinese_slug and all(ord(c) < 128 for c in chinese_slug.replace('-', '')):
+                # isascii是C级单次扫描，'-'本身是ASCII无需先replace
+                if chinese_slug and chinese_slug.isascii():
                     return chinese_slug
                 else:
                     # 简单转换
                     return chinese_slug.replace('hexo', 'hexo').replace('typora', 'typora')
-            
+
+            # 文章已基本是英文时直接短路，省掉数秒的LLM往返
+            # 正则search首个匹配即返回，纯英文输入近似O(1)；有中文才做一次占比扫描
+            if _CJK_RE.search(article_content) is None or sum(
+                1 for c in article_content if '\u4e00' <= c <= '\u9fff'
+            ) < len(article_content) * 0.02:
+                self.console.print("[dim cyan]🗂 文章已是英文，跳过AI翻译[/dim cyan]")
+                english_title = generate_english_title(fm.get('title', 'Article'))
+                skipped_result = f"---\n{front_matter.strip()}\n---\n\n{article_content.strip()}"
+                return skipped_result, {
+                    'processing_time': time.perf_counter() - t0,
+                    'success': True,
+                    'skipped_translation': True,
+                    'original_title': fm.get('title', 'Article'),
+                    'translated_title': english_title,
+                }
+
             # 使用AI客户端进行翻译
             if self.client:
                 try:
-                    translated_content = self.client.generate(translate_prompt, max_tokens=4000, temperature=0.7)
-                    if translated_content and translated_content.strip():
+                    # 正文翻译交给后台线程，front-matter的标题/标签/分类
+                    # 转换与数秒的LLM往返重叠执行，输入互不相关
+                    from concurrent.futures import ThreadPoolExecutor
+                    with ThreadPoolExecutor(max_workers=1) as pool:
+                        translate_future = pool.submit(
+                            self._stream_generate, translate_prompt, "AI翻译生成中"
+                        )
+
                         # 构建英文版本的front-matter
-                        original_title = title_match.group(1).strip() if title_match else "Article"
+                        original_title = fm.get('title', 'Article')
                         english_title = generate_english_title(original_title)
-                        original_slug = slug_match.group(1).strip() if slug_match else "article"
+                        original_slug = fm.get('slug', 'article')
                         english_slug = generate_english_slug(original_slug)
-                        
+
                         # 翻译标签 - 保持正确的YAML格式
-                        original_tags = tags_match.group(1).strip() if tags_match else ""
+                        original_tags = fm.get('tags') or []
                         if original_tags:
-                            # 处理标签翻译，保持缩进
-                            english_tags_lines = []
-                            for line in original_tags.split('\n'):
-                                if line.strip().startswith('- '):
-                                    tag = line.strip()[2:].strip()
-                                    # 翻译常见标签
-                                    tag_translations = {
-                                        '装饰器': 'Decorators',
-                                        '后端开发': 'Backend Development', 
-                                        '技术分享': 'Tech Sharing',
-                                        '博客': 'Blog',
-                                        '前端开发': 'Frontend Development',
-                                        '数据库': 'Database',
-                                        '算法': 'Algorithm'
-                                    }
-                                    translated_tag = tag_translations.get(tag, tag)
-                                    english_tags_lines.append(f"  - {translated_tag}")
-                            english_tags = '\n'.join(english_tags_lines)
+                            # 翻译常见标签，保持缩进；方法绑定提到循环外省去逐项属性查找
+                            get_tag = _TAG_TRANSLATIONS.get
+                            english_tags = '\n'.join(
+                                f"  - {get_tag(tag, tag)}" for tag in original_tags
+                            )
                         else:
                             english_tags = "  - Tech"
-                        
+
                         # 翻译分类 - 保持正确的YAML格式
-                        original_categories = categories_match.group(1).strip() if categories_match else ""
+                        original_categories = fm.get('categories') or []
                         if original_categories:
-                            # 处理分类翻译，保持缩进
-                            english_categories_lines = []
-                            for line in original_categories.split('\n'):
-                                if line.strip().startswith('- '):
-                                    category = line.strip()[2:].strip()
-                                    # 翻译常见分类
-                                    category_translations = {
-                                        'Python编程': 'Python Programming',
-                                        '技术分享': 'Tech Sharing',
-                                        '个人经历': 'Personal Experience',
-                                        '前端技术': 'Frontend Tech',
-                                        '后端技术': 'Backend Tech'
-                                    }
-                                    translated_category = category_translations.get(category, category)
-                                    english_categories_lines.append(f"  - {translated_category}")
-                            english_categories = '\n'.join(english_categories_lines)
+                            # 翻译常见分类，保持缩进
+                            get_category = _CATEGORY_TRANSLATIONS.get
+                            english_categories = '\n'.join(
+                                f"  - {get_category(category, category)}"
+                                for category in original_categories
+                            )
                         else:
                             english_categories = "  - Tech Sharing"
                         
                         # 构建完整的英文front-matter，确保正确的YAML格式
-                        english_front_matter = f"""title: {english_title}
-slug: {english_slug}
-author: {author_match.group(1).strip() if author_match else 'Leion Charrrrls'}
-cover: {cover_match.group(1).strip() if cover_match else "''"}
-tags:
-{english_tags}
-categories:
-{english_categories}
-password: {password_match.group(1).strip() if password_match else "''"}
-abbrlink: {abbrlink_match.group(1).strip() if abbrlink_match else ''}
-date: {date_match.group(1).strip() if date_match else ''}"""
-                        
+                        # 先收集行再join一次成串，免去多行f-string的逐段拼接
+                        empty_quoted = "''"
+                        english_front_matter = '\n'.join([
+                            f"title: {english_title}",
+                            f"slug: {english_slug}",
+                            f"author: {fm.get('author', 'Leion Charrrrls')}",
+                            f"cover: {fm.get('cover', empty_quoted)}",
+                            "tags:",
+                            english_tags,
+                            "categories:",
+                            english_categories,
+                            f"password: {fm.get('password', empty_quoted)}",
+                            f"abbrlink: {fm.get('abbrlink', '')}",
+                            f"date: {fm.get('date', '')}",
+                        ])
+
+                        # 汇合点：等待正文翻译完成
+                        translated_content = translate_future.result()
+
+                    if translated_content and translated_content.strip():
                         final_result = f"---\n{english_front_matter}\n---\n\n{translated_content.strip()}"
                 except Exception as e:
                     self.console.print(f"[dim red]🔍 AI客户端翻译失败: {e}[/dim red]")
                     translated_content = None
                     
-            # 备用方案：使用ai_helper脚本 
+            # 备用方案：进程内调用ai_helper
             if not final_result:
-                success, translated_content = self._run_command(
-                    f'python3 "{self.ai_helper_script}" translate "{self._clean_summary_for_command(translate_prompt)}"'
-                )
-                
-                if success and translated_content and translated_content.strip():
+                translated_content = self._fallback_generate(translate_prompt, "translate")
+
+                if translated_content and translated_content.strip():
                     # 构建简单的英文front-matter
-                    original_title = title_match.group(1).strip() if title_match else "Article"
+                    original_title = fm.get('title', 'Article')
                     english_title = f"{original_title} (English Version)"
                     
                     # 保持原有的front-matter结构，只修改title
@@ -1617,42 +2342,104 @@ date: {date_match.group(1).strip() if date_match else ''}"""
                     final_result = f"---{english_front_matter}---\n\n{translated_content.strip()}"
             
             # 计算处理时间
-            end_time = datetime.now()
-            processing_time = (end_time - start_time).total_seconds()
-            
+            processing_time = time.perf_counter() - t0
+
             if final_result:
-                # 提取翻译后的正文用于分析
-                final_parts = final_result.split('---', 2)
-                if len(final_parts) >= 3:
-                    translated_article_content = final_parts[2]
-                    
+                # 提取翻译后的正文用于分析 - partition返回三元组，
+                # 比split('---', 2)少一次列表分配
+                _, sep1, rest = final_result.partition('---')
+                final_fm, sep2, translated_article_content = rest.partition('---')
+                if sep1 and sep2:
+
                     # 分析翻译质量
                     analysis = self._analyze_translation_quality(article_content, translated_article_content)
                     analysis['processing_time'] = processing_time
                     analysis['success'] = True
-                    original_title = title_match.group(1).strip() if title_match else "Article"
+                    original_title = fm.get('title', 'Article')
                     analysis['original_title'] = original_title
                     
                     # 提取翻译后的标题
-                    translated_title_match = re.search(r'title:\s*(.+)', final_parts[1])
+                    # memchr级子串预检，缺少该键时连正则引擎都不启动
+                    translated_title_match = (
+                        _TITLE_RE.search(final_fm) if 'title:' in final_fm else None
+                    )
                     analysis['translated_title'] = translated_title_match.group(1).strip() if translated_title_match else f"{original_title} (English)"
                     
+                    self._store_translation_cache(cache_key, final_result, analysis)
                     return final_result, analysis
                 else:
-                    return final_result, {'processing_time': processing_time, 'success': True, 'basic_translation': True}
+                    stats = {'processing_time': processing_time, 'success': True, 'basic_translation': True}
+                    self._store_translation_cache(cache_key, final_result, stats)
+                    return final_result, stats
             else:
                 return "", {'processing_time': processing_time, 'success': False}
                 
         except Exception as e:
-            end_time = datetime.now()
-            processing_time = (end_time - start_time).total_seconds()
+            processing_time = time.perf_counter() - t0
             self.console.print(f"[dim red]🔍 翻译失败: {e}[/dim red]")
             return "", {'processing_time': processing_time, 'success': False, 'error': str(e)}
 
+    def _batch_process(self, paths: list, process_one) -> dict:
+        """asyncio并发跑一批阻塞的AI处理调用，返回 {路径: 统计} 字典
+
+        AI客户端基于requests没有原生async接口，这里用asyncio.to_thread把
+        阻塞调用放进线程池并发执行，墙钟时间从 N×RTT 降为 max(RTT)；
+        Semaphore(8)限流避免触发接口限速。
+        """
+        import asyncio
+
+        async def _run_one(path, semaphore):
+            async with semaphore:
+                try:
+                    return path, await asyncio.to_thread(process_one, path)
+                except Exception as e:
+                    return path, {'success': False, 'error': str(e)}
+
+        async def _run():
+            semaphore = asyncio.Semaphore(8)
+            pairs = await asyncio.gather(*[_run_one(p, semaphore) for p in paths])
+            return dict(pairs)
+
+        return asyncio.run(_run())
+
+    def batch_optimize(self, paths: list) -> dict:
+        """并发优化多篇中文文章，成功的结果就地写回原文件"""
+        def _optimize_one(path):
+            with open(path, 'r', encoding='utf-8') as f:
+                content = f.read()
+            optimized, stats = self._optimize_chinese_article(content)
+            if stats.get('success'):
+                with open(path, 'w', encoding='utf-8') as f:
+                    f.write(optimized)
+            return stats
+
+        return self._batch_process(paths, _optimize_one)
+
+    def batch_translate(self, paths: list) -> dict:
+        """并发翻译多篇中文文章，生成对应的-en.md英文版本"""
+        def _translate_one(path):
+            with open(path, 'r', encoding='utf-8') as f:
+                content = f.read()
+            english, stats = self._translate_to_english(content, os.path.basename(path))
+            if stats.get('success') and english:
+                en_path = path.replace('-zh.md', '-en.md')
+                with open(en_path, 'w', encoding='utf-8') as f:
+                    f.write(english)
+            return stats
+
+        return self._batch_process(paths, _translate_one)
+
     def optimize_blog_article(self, partial_title: str) -> bool:
         """优化中文博客文章"""
+        from rich.align import Align
+        from rich.console import Group
+        from rich.table import Table
+        from rich.progress import Progress, SpinnerColumn, TextColumn, BarColumn, TimeElapsedColumn
+        from rich.rule import Rule
+
         # 创建专业优化标题
         start_time = datetime.now()
+        t0 = time.perf_counter()
         
         # Leion 优化品牌标题
         header_text = Text()
@@ -1670,7 +2457,7 @@ date: {date_match.group(1).strip() if date_match else ''}"""
         version_text.append(" • ", style="dim white")
         version_text.append(f"Started at {start_time.strftime('%H:%M:%S')}", style="dim cyan")
         version_text.append(" • ", style="dim white")
-        version_text.append(f"{platform.system()} {platform.machine()}", style="dim cyan")
+        version_text.append(_PLATFORM_INFO, style="dim cyan")
         
         # 版权信息
         copyright_text = Text()
@@ -1703,7 +2490,8 @@ date: {date_match.group(1).strip() if date_match else ''}"""
             self.console.print("[red]❌ 请提供文章标题关键词[/red]")
             return False
             
-        # 智能文件匹配阶段
+        # 各阶段复用同一个Progress - 每次with进出都要隐藏/恢复光标并重建live渲染，
+        # 共享实例把这些终端状态切换合并为一次
         with Progress(
             SpinnerColumn(style="cyan"),
             TextColumn("[progress.description]{task.description}"),
@@ -1712,36 +2500,31 @@ date: {date_match.group(1).strip() if date_match else ''}"""
             console=self.console,
             transient=True,
         ) as progress:
+            # 智能文件匹配阶段
             task = progress.add_task("[cyan]🔍 智能文件匹配中...[/cyan]", total=None)
             matched_file = self._find_matching_file(partial_title)
-            
-        if not matched_file:
-            self.console.print(f"[red]❌ 未找到匹配的文章文件（搜索词：{partial_title}）[/red]")
-            self.console.print("[yellow]💡 提示：请确保文件名以 '-zh.md' 结尾[/yellow]")
-            return False
-            
-        self.console.print(f"[green]✅[/green] [bold green]找到匹配文件: {os.path.basename(matched_file)}[/bold green]")
-        self.console.print()
-        
-        # 读取原文章内容
-        try:
-            with open(matched_file, 'r', encoding='utf-8') as f:
-                original_content = f.read()
-        except Exception as e:
-            self.console.print(f"[red]❌ 读取文件失败: {e}[/red]")
-            return False
-            
-        # AI优化中文版本
-        with Progress(
-            SpinnerColumn(style="magenta"),
-            TextColumn("[progress.description]{task.description}"),
-            BarColumn(bar_width=None),  
-            TimeElapsedColumn(),
-            console=self.console,
-            transient=True,
-        ) as progress:
+            progress.remove_task(task)
+
+            if not matched_file:
+                self.console.print(f"[red]❌ 未找到匹配的文章文件（搜索词：{partial_title}）[/red]")
+                self.console.print("[yellow]💡 提示：请确保文件名以 '-zh.md' 结尾[/yellow]")
+                return False
+
+            self.console.print(f"[green]✅[/green] [bold green]找到匹配文件: {os.path.basename(matched_file)}[/bold green]")
+            self.console.print()
+
+            # 读取原文章内容
+            try:
+                with open(matched_file, 'r', encoding='utf-8') as f:
+                    original_content = f.read()
+            except Exception as e:
+                self.console.print(f"[red]❌ 读取文件失败: {e}[/red]")
+                return False
+
+            # AI优化中文版本
             task = progress.add_task("[magenta]🤖 AI优化中文内容...[/magenta]", total=None)
             optimized_content, optimize_stats = self._optimize_chinese_article(original_content)
+            progress.remove_task(task)
         
         # 显示中文优化详细统计
         if optimize_stats.get('success'):
@@ -1843,14 +2626,11 @@ date: {date_match.group(1).strip() if date_match else ''}"""
         self.console.print()
             
         # 成功完成展示
-        elapsed = datetime.now() - start_time
-        elapsed_seconds = elapsed.total_seconds()
-        
-        self.console.print()
-        self.console.print(Rule("[bold green]🎉 中文博客优化完成[/bold green]", style="green"))
-        self.console.print()
-        
-        # 综合结果仪表板
+        elapsed_seconds = time.perf_counter() - t0
+
+        # 综合结果仪表板 - 各组件先收集，最后一次print输出，
+        # 减少Rich的逐次测量与write()系统调用
+        result_rule = Rule("[bold green]🎉 中文博客优化完成[/bold green]", style="green")
         result_table = Table(
             show_header=True,
             header_style="bold white on green", 
@@ -1907,9 +2687,6 @@ date: {date_match.group(1).strip() if date_match else ''}"""
             f"平均 {overall_speed:.0f} 字/秒"
         )
         
-        self.console.print(result_table)
-        self.console.print()
-        
         # 详细成果统计面板
         content_summary = []
         
@@ -1934,15 +2711,21 @@ date: {date_match.group(1).strip() if date_match else ''}"""
             padding=(1, 2)
         )
         
-        self.console.print(final_panel)
-        self.console.print()
-        
+        self.console.print(Group("", result_rule, "", result_table, "", final_panel, ""))
+
         return True
 
     def translate_blog_article(self, partial_title: str) -> bool:
         """翻译中文博客文章为英文版本"""
+        from rich.align import Align
+        from rich.console import Group
+        from rich.table import Table
+        from rich.progress import Progress, SpinnerColumn, TextColumn, BarColumn, TimeElapsedColumn
+        from rich.rule import Rule
+
         # 创建专业翻译标题
         start_time = datetime.now()
+        t0 = time.perf_counter()
         
         # Leion 翻译品牌标题
         header_text = Text()
@@ -1960,7 +2743,7 @@ date: {date_match.group(1).strip() if date_match else ''}"""
         version_text.append(" • ", style="dim white")
         version_text.append(f"Started at {start_time.strftime('%H:%M:%S')}", style="dim cyan")
         version_text.append(" • ", style="dim white")
-        version_text.append(f"{platform.system()} {platform.machine()}", style="dim cyan")
+        version_text.append(_PLATFORM_INFO, style="dim cyan")
         
         # 版权信息
         copyright_text = Text()
@@ -1993,7 +2776,7 @@ date: {date_match.group(1).strip() if date_match else ''}"""
             self.console.print("[red]❌ 请提供文章标题关键词[/red]")
             return False
             
-        # 智能文件匹配阶段
+        # 各阶段复用同一个Progress，减少终端live渲染的建立/撤销次数
         with Progress(
             SpinnerColumn(style="cyan"),
             TextColumn("[progress.description]{task.description}"),
@@ -2002,36 +2785,36 @@ date: {date_match.group(1).strip() if date_match else ''}"""
             console=self.console,
             transient=True,
         ) as progress:
+            # 智能文件匹配阶段
             task = progress.add_task("[cyan]🔍 智能文件匹配中...[/cyan]", total=None)
             matched_file = self._find_matching_file(partial_title)
-            
-        if not matched_file:
-            self.console.print(f"[red]❌ 未找到匹配的文章文件（搜索词：{partial_title}）[/red]")
-            self.console.print("[yellow]💡 提示：请确保文件名以 '-zh.md' 结尾[/yellow]")
-            return False
-            
-        self.console.print(f"[green]✅[/green] [bold green]找到匹配文件: {os.path.basename(matched_file)}[/bold green]")
-        self.console.print()
-        
-        # 读取原文章内容
-        try:
-            with open(matched_file, 'r', encoding='utf-8') as f:
-                original_content = f.read()
-        except Exception as e:
-            self.console.print(f"[red]❌ 读取文件失败: {e}[/red]")
-            return False
-        
-        # AI翻译英文版本
-        with Progress(
-            SpinnerColumn(style="blue"),
-            TextColumn("[progress.description]{task.description}"),
-            BarColumn(bar_width=None),
-            TimeElapsedColumn(),
-            console=self.console,
-            transient=True,
-        ) as progress:
+            progress.remove_task(task)
+
+            if not matched_file:
+                self.console.print(f"[red]❌ 未找到匹配的文章文件（搜索词：{partial_title}）[/red]")
+                self.console.print("[yellow]💡 提示：请确保文件名以 '-zh.md' 结尾[/yellow]")
+                return False
+
+            self.console.print(f"[green]✅[/green] [bold green]找到匹配文件: {os.path.basename(matched_file)}[/bold green]")
+
+            # 预览标题只需front-matter，不为展示读入整篇文章
+            fm_preview = _parse_front_matter(self._read_front_matter_only(matched_file))
+            if fm_preview.get('title'):
+                self.console.print(f"[dim cyan]📄 文章标题: {fm_preview['title']}[/dim cyan]")
+            self.console.print()
+
+            # 读取原文章内容
+            try:
+                with open(matched_file, 'r', encoding='utf-8') as f:
+                    original_content = f.read()
+            except Exception as e:
+                self.console.print(f"[red]❌ 读取文件失败: {e}[/red]")
+                return False
+
+            # AI翻译英文版本
             task = progress.add_task("[blue]🌐 AI翻译英文版本...[/blue]", total=None)
             english_content, translate_stats = self._translate_to_english(original_content, os.path.basename(matched_file))
+            progress.remove_task(task)
         
         # 显示翻译详细统计
         if translate_stats.get('success') and english_content:
@@ -2145,14 +2928,11 @@ date: {date_match.group(1).strip() if date_match else ''}"""
                 self.console.print(f"[dim red]错误详情: {translate_stats['error']}[/dim red]")
             return False
             
-        # 成功完成展示
-        elapsed = datetime.now() - start_time
-        elapsed_seconds = elapsed.total_seconds()
-        
-        self.console.print()
-        self.console.print(Rule("[bold blue]🎉 英文翻译完成[/bold blue]", style="blue"))
-        self.console.print()
-        
+        # 成功完成展示 - 分割线与成果面板合并为一次print输出
+        elapsed_seconds = time.perf_counter() - t0
+
+        result_rule = Rule("[bold blue]🎉 英文翻译完成[/bold blue]", style="blue")
+
         # 最终成果面板
         en_filename = os.path.basename(matched_file).replace('-zh.md', '-en.md')
         
@@ -2173,9 +2953,8 @@ date: {date_match.group(1).strip() if date_match else ''}"""
             padding=(1, 2)
         )
         
-        self.console.print(final_panel)
-        self.console.print()
-        
+        self.console.print(Group("", result_rule, "", final_panel, ""))
+
         return True
 
 
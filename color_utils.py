@@ -4,21 +4,28 @@
 提供统一的控制台颜色输出功能，支持多种消息类型和兼容性选项
 """
 
+import functools
 import os
+import re
 import sys
-from enum import Enum
+import time
+from enum import IntEnum
 from typing import Optional, Union
 
 
-class MessageType(Enum):
-    """消息类型枚举"""
-    ERROR = "ERROR"
-    SUCCESS = "SUCCESS"
-    WARNING = "WARNING"
-    INFO = "INFO"
-    NORMAL = "NORMAL"
-    DEBUG = "DEBUG"
-    PROGRESS = "PROGRESS"
+class MessageType(IntEnum):
+    """消息类型枚举（IntEnum：整数哈希/比较，名字即输出标签）"""
+    ERROR = 0
+    SUCCESS = 1
+    WARNING = 2
+    INFO = 3
+    NORMAL = 4
+    DEBUG = 5
+    PROGRESS = 6
+
+
+# 字符串→消息类型映射（预构建字典查找，替代异常驱动的枚举构造）
+_STR_TO_TYPE = {m.name: m for m in MessageType}
 
 
 class ColorCodes:
@@ -136,9 +143,136 @@ class ColorConfig:
         return self.enabled and not self.force_disable
 
 
+# 消息类型→颜色表（按 IntEnum 值索引的元组，免去每条消息一次字典查找）
+_TYPE_COLOR_TABLE = tuple(ColorCodes.TYPE_COLORS[m] for m in MessageType)
+
+
+class TokenKind(IntEnum):
+    """代码高亮token类别（小整数值，配合元组颜色表索引）"""
+    KEYWORD = 0
+    STRING = 1
+    NUMBER = 2
+    COMMENT = 3
+    FUNCTION = 4
+    CLASS = 5
+    BUILTIN = 6
+    VARIABLE = 7
+
+
+# token类别→颜色表（连续元组，按TokenKind整数值索引，替代逐token的字符串键字典查找）
+_TOKEN_COLOR = tuple(ColorCodes.CODE_COLORS[k.name.lower()] for k in TokenKind)
+
+
 # 全局配置实例
 _color_config = ColorConfig()
 
+# 颜色开关快照：热路径直接读模块全局布尔值，省去每次的方法调用和属性访问
+# 由 enable_colors()/disable_colors() 负责刷新
+_COLORS_ON = _color_config.is_enabled()
+
+
+# 预编译的语法高亮正则（模块加载时编译一次，避免每次高亮重新走 re._compile 查找）
+# Python 关键字/内置函数集合：标识符统一由 word 分组匹配，再 O(1) 查集合分类，
+# 避免正则引擎在每个标识符处逐个尝试几十个交替分支
+_PY_KEYWORDS = frozenset((
+    'def', 'class', 'if', 'elif', 'else', 'for', 'while', 'try', 'except',
+    'finally', 'with', 'as', 'import', 'from', 'return', 'yield', 'lambda',
+    'and', 'or', 'not', 'in', 'is', 'None', 'True', 'False', 'pass', 'break',
+    'continue', 'global', 'nonlocal', 'assert', 'del', 'raise', 'async', 'await',
+))
+_PY_BUILTINS = frozenset((
+    'print', 'len', 'str', 'int', 'float', 'list', 'dict', 'set', 'tuple',
+    'range', 'enumerate', 'zip', 'map', 'filter', 'open', 'input', 'type',
+    'isinstance', 'hasattr', 'getattr', 'setattr', 'super', 'staticmethod',
+    'classmethod', 'property',
+))
+
+# Python：单个命名分组交替式，整段代码只扫描一遍
+# 注释/字符串放在最前，保证字符串里的关键字不会被二次着色
+_PY_TOKEN_RE = re.compile(
+    r'(?P<comment>#.*$)'
+    r'|(?P<string>"""[^"]*"""|\'\'\'[^\']*\'\'\'|"[^"]*"|\'[^\']*\')'
+    r'|(?P<number>\b(?:\d+\.?\d*|\.\d+)\b)'
+    r'|(?P<word>\b[A-Za-z_]\w*\b)',
+    re.MULTILINE)
+
+# JavaScript/TypeScript
+_JS_KEYWORDS_RE = re.compile(r'\b(var|let|const|function|class|if|else|for|while|do|switch|case|default|try|catch|finally|throw|return|break|continue|typeof|instanceof|new|this|super|extends|import|export|from|async|await|yield|true|false|null|undefined)\b', re.MULTILINE)
+_JS_STRINGS_RE = re.compile(r'(`[^`]*`|"[^"]*"|\'[^\']*\')', re.MULTILINE)
+_JS_NUMBERS_RE = re.compile(r'\b(\d+\.?\d*|\.\d+)\b')
+_JS_COMMENTS_RE = re.compile(r'(//.*$|/\*[\s\S]*?\*/)', re.MULTILINE)
+_JS_FUNCTIONS_RE = re.compile(r'\b(\w+)(?=\s*\()')
+
+# Bash/Shell
+_BASH_KEYWORDS_RE = re.compile(r'\b(if|then|else|elif|fi|for|while|do|done|case|esac|function|return|break|continue|exit|export|source|alias|unalias|cd|pwd|echo|printf)\b', re.MULTILINE)
+_BASH_STRINGS_RE = re.compile(r'("[^"]*"|\'[^\']*\')', re.MULTILINE)
+_BASH_COMMENTS_RE = re.compile(r'(#.*$)', re.MULTILINE)
+_BASH_VARIABLES_RE = re.compile(r'(\$\w+|\$\{[^}]+\})')
+
+# SQL
+_SQL_KEYWORDS_RE = re.compile(r'\b(SELECT|FROM|WHERE|JOIN|INNER|LEFT|RIGHT|FULL|OUTER|ON|GROUP|BY|HAVING|ORDER|ASC|DESC|INSERT|INTO|VALUES|UPDATE|SET|DELETE|CREATE|TABLE|ALTER|DROP|INDEX|DATABASE|PRIMARY|KEY|FOREIGN|REFERENCES|CONSTRAINT|NULL|NOT|AND|OR|LIKE|IN|EXISTS|BETWEEN|UNION|ALL|DISTINCT|COUNT|SUM|AVG|MAX|MIN)\b', re.MULTILINE | re.IGNORECASE)
+_SQL_STRINGS_RE = re.compile(r'(\'[^\']*\')', re.MULTILINE)
+_SQL_NUMBERS_RE = re.compile(r'\b(\d+\.?\d*|\.\d+)\b')
+_SQL_COMMENTS_RE = re.compile(r'(--.*$|/\*[\s\S]*?\*/)', re.MULTILINE)
+
+# 通用
+_GENERIC_STRINGS_RE = re.compile(r'("[^"]*"|\'[^\']*\'|`[^`]*`)', re.MULTILINE)
+_GENERIC_NUMBERS_RE = re.compile(r'\b(\d+\.?\d*|\.\d+)\b')
+_GENERIC_COMMENTS_RE = re.compile(r'(//.*$|#.*$|/\*[\s\S]*?\*/)', re.MULTILINE)
+
+# 剥离ANSI转义序列（用于计算实际显示宽度）
+_ANSI_STRIP_RE = re.compile(r'\x1b\[[0-9;]*m')
+
+# AI回复高亮的预连接常量（免去每个chunk重建同样的ANSI前缀）
+_AI_HL_PREFIX = ColorCodes.BG_AI_RESPONSE + ColorCodes.TEXT_AI_RESPONSE
+_RESET = ColorCodes.RESET
+# 换行chunk的固定替换：补齐行尾背景、重置、换行后重新开启背景
+_NL_REPLACEMENT = '  ' + _RESET + '\n' + _AI_HL_PREFIX
+
+# 预生成的替换模板（反向引用在 sre 的 C 层展开，免去每个匹配调用一次 lambda）
+_KEYWORD_REPL = ColorCodes.CODE_COLORS['keyword'] + r'\g<0>' + ColorCodes.RESET
+_STRING_REPL = ColorCodes.CODE_COLORS['string'] + r'\g<0>' + ColorCodes.RESET
+_NUMBER_REPL = ColorCodes.CODE_COLORS['number'] + r'\g<0>' + ColorCodes.RESET
+_COMMENT_REPL = ColorCodes.CODE_COLORS['comment'] + r'\g<0>' + ColorCodes.RESET
+_FUNCTION_REPL = ColorCodes.CODE_COLORS['function'] + r'\g<1>' + ColorCodes.RESET
+_CLASS_REPL = ColorCodes.CODE_COLORS['class'] + r'\g<0>' + ColorCodes.RESET
+_BUILTIN_REPL = ColorCodes.CODE_COLORS['builtin'] + r'\g<0>' + ColorCodes.RESET
+_VARIABLE_REPL = ColorCodes.CODE_COLORS['variable'] + r'\g<0>' + ColorCodes.RESET
+
+# 单遍扫描回调用的分组名→token类别映射
+_PY_GROUP_KINDS = {
+    'comment': TokenKind.COMMENT,
+    'string': TokenKind.STRING,
+    'number': TokenKind.NUMBER,
+}
+
+
+def _py_token_repl(m: 're.Match') -> str:
+    """单遍高亮回调：标识符按 关键字→内置→类名→函数调用 顺序分类"""
+    group = m.lastgroup
+    token = m.group(0)
+    if group == 'word':
+        if token in _PY_KEYWORDS:
+            kind = TokenKind.KEYWORD
+        elif token in _PY_BUILTINS:
+            kind = TokenKind.BUILTIN
+        elif 'A' <= token[0] <= 'Z':
+            kind = TokenKind.CLASS
+        else:
+            # 后面紧跟 "(" 的标识符视为函数调用
+            text = m.string
+            j = m.end()
+            n = len(text)
+            while j < n and text[j].isspace():
+                j += 1
+            if j < n and text[j] == '(':
+                kind = TokenKind.FUNCTION
+            else:
+                return token
+    else:
+        kind = _PY_GROUP_KINDS[group]
+    return f"{_TOKEN_COLOR[kind]}{token}{ColorCodes.RESET}"
+
 
 def colored_print(
     message: str,
@@ -159,33 +293,33 @@ def colored_print(
         flush: 是否立即刷新输出缓冲区
         file: 输出文件对象，默认为sys.stdout
     """
-    if file is None:
-        file = sys.stdout
-        
     # 处理字符串类型的msg_type
     if isinstance(msg_type, str):
-        try:
-            msg_type = MessageType(msg_type.upper())
-        except ValueError:
-            msg_type = MessageType.NORMAL
+        msg_type = _STR_TO_TYPE.get(msg_type.upper(), MessageType.NORMAL)
     
     # 构建输出内容
-    if _color_config.is_enabled():
-        color = ColorCodes.TYPE_COLORS.get(msg_type, ColorCodes.WHITE)
+    if _COLORS_ON:
+        color = _TYPE_COLOR_TABLE[msg_type.value]
 
         if prefix is None:
             # 使用默认格式 [类型] 消息内容 - 整个消息都有颜色
-            formatted_message = f"{color}[{msg_type.value}] {message}{ColorCodes.RESET}"
+            formatted_message = f"{color}[{msg_type.name}] {message}{ColorCodes.RESET}"
         else:
             # 使用自定义前缀 - 整个消息都有颜色
             formatted_message = f"{color}{prefix} {message}{ColorCodes.RESET}"
     else:
         # 无颜色模式
         if prefix is None:
-            formatted_message = f"[{msg_type.value}] {message}"
+            formatted_message = f"[{msg_type.name}] {message}"
         else:
             formatted_message = f"{prefix} {message}"
     
+    # 最常见组合（默认stdout、换行结尾、不强制刷新）直接write，跳过print的参数处理
+    if file is None:
+        if end == '\n' and not flush:
+            sys.stdout.write(formatted_message + '\n')
+            return
+        file = sys.stdout
     print(formatted_message, end=end, flush=flush, file=file)
 
 
@@ -221,12 +355,16 @@ def print_progress(message: str, **kwargs) -> None:
 
 def disable_colors() -> None:
     """全局禁用颜色输出"""
+    global _COLORS_ON
     _color_config.disable_colors()
+    _COLORS_ON = _color_config.is_enabled()
 
 
 def enable_colors() -> None:
     """全局启用颜色输出"""
+    global _COLORS_ON
     _color_config.enable_colors()
+    _COLORS_ON = _color_config.is_enabled()
 
 
 def is_colors_enabled() -> bool:
@@ -237,19 +375,25 @@ def is_colors_enabled() -> bool:
 def format_code_block(code: str, language: str = "python") -> str:
     """
     格式化代码块，添加语法高亮和背景
-    
+
     Args:
         code: 要格式化的代码内容
         language: 编程语言，默认为python
-        
+
     Returns:
         格式化后的代码字符串
     """
-    if not _color_config.is_enabled():
+    # 流式渲染会对同一个代码块反复调用，用 LRU 缓存把重复渲染变成字典命中
+    # 颜色开关状态纳入缓存键，避免切换颜色后返回旧结果
+    return _format_code_block_cached(code, language, _color_config.is_enabled())
+
+
+@functools.lru_cache(maxsize=256)
+def _format_code_block_cached(code: str, language: str, enabled: bool) -> str:
+    """format_code_block 的带缓存实现"""
+    if not enabled:
         return code
-        
-    import re
-    
+
     # 代码块背景和边框
     bg_color = ColorCodes.CODE_COLORS['background']
     reset = ColorCodes.RESET
@@ -267,123 +411,73 @@ def format_code_block(code: str, language: str = "python") -> str:
         # 通用高亮
         code = _highlight_generic(code)
     
-    # 添加背景和边框
-    lines = code.split('\n')
-    formatted_lines = []
-    
-    for line in lines:
-        if line.strip():  # 非空行添加背景
-            formatted_line = f"{bg_color} {line.ljust(80)} {reset}"
-        else:  # 空行
-            formatted_line = f"{bg_color}{' ' * 82}{reset}"
-        formatted_lines.append(formatted_line)
-    
-    return '\n'.join(formatted_lines)
+    # 添加背景和边框：单次生成器遍历，补齐宽度按剥离ANSI后的可见长度计算
+    # （高亮后的行带转义序列，直接 ljust 会把补齐算短）
+    empty_row = f"{bg_color}{' ' * 82}{reset}"
+
+    def _visible_len(line: str) -> int:
+        return len(line) if '\x1b' not in line else len(_ANSI_STRIP_RE.sub('', line))
+
+    # line and not line.isspace() 都是C层判断，不像 strip() 那样为判空分配新串
+    return '\n'.join(
+        f"{bg_color} {line}{' ' * max(0, 80 - _visible_len(line))} {reset}"
+        if line and not line.isspace() else empty_row
+        for line in code.split('\n')
+    )
 
 
 def _highlight_python(code: str) -> str:
-    """Python语法高亮"""
-    import re
-    
-    # Python关键字
-    keywords = r'\b(def|class|if|elif|else|for|while|try|except|finally|with|as|import|from|return|yield|lambda|and|or|not|in|is|None|True|False|pass|break|continue|global|nonlocal|assert|del|raise|async|await)\b'
-    
-    # 字符串（支持三引号和单双引号）
-    strings = r'("""[^"]*"""|\'\'\'[^\']*\'\'\'|"[^"]*"|\'[^\']*\')'
-    
-    # 数字
-    numbers = r'\b(\d+\.?\d*|\.\d+)\b'
-    
-    # 注释
-    comments = r'(#.*$)'
-    
-    # 函数调用
-    functions = r'\b(\w+)(?=\s*\()'
-    
-    # 类名（大写开头）
-    classes = r'\b([A-Z]\w*)\b'
-    
-    # 内置函数
-    builtins = r'\b(print|len|str|int|float|list|dict|set|tuple|range|enumerate|zip|map|filter|open|input|type|isinstance|hasattr|getattr|setattr|super|staticmethod|classmethod|property)\b'
-    
-    # 应用高亮
-    code = re.sub(keywords, lambda m: f"{ColorCodes.CODE_COLORS['keyword']}{m.group(0)}{ColorCodes.RESET}", code, flags=re.MULTILINE)
-    code = re.sub(strings, lambda m: f"{ColorCodes.CODE_COLORS['string']}{m.group(0)}{ColorCodes.RESET}", code, flags=re.MULTILINE)
-    code = re.sub(numbers, lambda m: f"{ColorCodes.CODE_COLORS['number']}{m.group(0)}{ColorCodes.RESET}", code)
-    code = re.sub(comments, lambda m: f"{ColorCodes.CODE_COLORS['comment']}{m.group(0)}{ColorCodes.RESET}", code, flags=re.MULTILINE)
-    code = re.sub(builtins, lambda m: f"{ColorCodes.CODE_COLORS['builtin']}{m.group(0)}{ColorCodes.RESET}", code)
-    code = re.sub(functions, lambda m: f"{ColorCodes.CODE_COLORS['function']}{m.group(1)}{ColorCodes.RESET}", code)
-    code = re.sub(classes, lambda m: f"{ColorCodes.CODE_COLORS['class']}{m.group(0)}{ColorCodes.RESET}", code)
-    
-    return code
+    """Python语法高亮（单遍扫描，避免对同一段代码反复重建字符串）"""
+    if not _COLORS_ON:
+        return code
+    return _PY_TOKEN_RE.sub(_py_token_repl, code)
 
 
 def _highlight_javascript(code: str) -> str:
     """JavaScript/TypeScript语法高亮"""
-    import re
-    
-    keywords = r'\b(var|let|const|function|class|if|else|for|while|do|switch|case|default|try|catch|finally|throw|return|break|continue|typeof|instanceof|new|this|super|extends|import|export|from|async|await|yield|true|false|null|undefined)\b'
-    strings = r'(`[^`]*`|"[^"]*"|\'[^\']*\')'
-    numbers = r'\b(\d+\.?\d*|\.\d+)\b'
-    comments = r'(//.*$|/\*[\s\S]*?\*/)'
-    functions = r'\b(\w+)(?=\s*\()'
-    
-    code = re.sub(keywords, lambda m: f"{ColorCodes.CODE_COLORS['keyword']}{m.group(0)}{ColorCodes.RESET}", code, flags=re.MULTILINE)
-    code = re.sub(strings, lambda m: f"{ColorCodes.CODE_COLORS['string']}{m.group(0)}{ColorCodes.RESET}", code, flags=re.MULTILINE)
-    code = re.sub(numbers, lambda m: f"{ColorCodes.CODE_COLORS['number']}{m.group(0)}{ColorCodes.RESET}", code)
-    code = re.sub(comments, lambda m: f"{ColorCodes.CODE_COLORS['comment']}{m.group(0)}{ColorCodes.RESET}", code, flags=re.MULTILINE)
-    code = re.sub(functions, lambda m: f"{ColorCodes.CODE_COLORS['function']}{m.group(1)}{ColorCodes.RESET}", code)
-    
+    if not _COLORS_ON:
+        return code
+    code = _JS_KEYWORDS_RE.sub(_KEYWORD_REPL, code)
+    code = _JS_STRINGS_RE.sub(_STRING_REPL, code)
+    code = _JS_NUMBERS_RE.sub(_NUMBER_REPL, code)
+    code = _JS_COMMENTS_RE.sub(_COMMENT_REPL, code)
+    code = _JS_FUNCTIONS_RE.sub(_FUNCTION_REPL, code)
+
     return code
 
 
 def _highlight_bash(code: str) -> str:
     """Bash/Shell语法高亮"""
-    import re
-    
-    keywords = r'\b(if|then|else|elif|fi|for|while|do|done|case|esac|function|return|break|continue|exit|export|source|alias|unalias|cd|pwd|echo|printf)\b'
-    strings = r'("[^"]*"|\'[^\']*\')'
-    comments = r'(#.*$)'
-    variables = r'(\$\w+|\$\{[^}]+\})'
-    
-    code = re.sub(keywords, lambda m: f"{ColorCodes.CODE_COLORS['keyword']}{m.group(0)}{ColorCodes.RESET}", code, flags=re.MULTILINE)
-    code = re.sub(strings, lambda m: f"{ColorCodes.CODE_COLORS['string']}{m.group(0)}{ColorCodes.RESET}", code, flags=re.MULTILINE)
-    code = re.sub(comments, lambda m: f"{ColorCodes.CODE_COLORS['comment']}{m.group(0)}{ColorCodes.RESET}", code, flags=re.MULTILINE)
-    code = re.sub(variables, lambda m: f"{ColorCodes.CODE_COLORS['variable']}{m.group(0)}{ColorCodes.RESET}", code)
-    
+    if not _COLORS_ON:
+        return code
+    code = _BASH_KEYWORDS_RE.sub(_KEYWORD_REPL, code)
+    code = _BASH_STRINGS_RE.sub(_STRING_REPL, code)
+    code = _BASH_COMMENTS_RE.sub(_COMMENT_REPL, code)
+    code = _BASH_VARIABLES_RE.sub(_VARIABLE_REPL, code)
+
     return code
 
 
 def _highlight_sql(code: str) -> str:
     """SQL语法高亮"""
-    import re
-    
-    keywords = r'\b(SELECT|FROM|WHERE|JOIN|INNER|LEFT|RIGHT|FULL|OUTER|ON|GROUP|BY|HAVING|ORDER|ASC|DESC|INSERT|INTO|VALUES|UPDATE|SET|DELETE|CREATE|TABLE|ALTER|DROP|INDEX|DATABASE|PRIMARY|KEY|FOREIGN|REFERENCES|CONSTRAINT|NULL|NOT|AND|OR|LIKE|IN|EXISTS|BETWEEN|UNION|ALL|DISTINCT|COUNT|SUM|AVG|MAX|MIN)\b'
-    strings = r'(\'[^\']*\')'
-    numbers = r'\b(\d+\.?\d*|\.\d+)\b'
-    comments = r'(--.*$|/\*[\s\S]*?\*/)'
-    
-    code = re.sub(keywords, lambda m: f"{ColorCodes.CODE_COLORS['keyword']}{m.group(0)}{ColorCodes.RESET}", code, flags=re.MULTILINE | re.IGNORECASE)
-    code = re.sub(strings, lambda m: f"{ColorCodes.CODE_COLORS['string']}{m.group(0)}{ColorCodes.RESET}", code, flags=re.MULTILINE)
-    code = re.sub(numbers, lambda m: f"{ColorCodes.CODE_COLORS['number']}{m.group(0)}{ColorCodes.RESET}", code)
-    code = re.sub(comments, lambda m: f"{ColorCodes.CODE_COLORS['comment']}{m.group(0)}{ColorCodes.RESET}", code, flags=re.MULTILINE)
-    
+    if not _COLORS_ON:
+        return code
+    code = _SQL_KEYWORDS_RE.sub(_KEYWORD_REPL, code)
+    code = _SQL_STRINGS_RE.sub(_STRING_REPL, code)
+    code = _SQL_NUMBERS_RE.sub(_NUMBER_REPL, code)
+    code = _SQL_COMMENTS_RE.sub(_COMMENT_REPL, code)
+
     return code
 
 
 def _highlight_generic(code: str) -> str:
     """通用语法高亮"""
-    import re
-    
-    # 简单的通用规则
-    strings = r'("[^"]*"|\'[^\']*\'|`[^`]*`)'
-    numbers = r'\b(\d+\.?\d*|\.\d+)\b'
-    comments = r'(//.*$|#.*$|/\*[\s\S]*?\*/)'
-    
-    code = re.sub(strings, lambda m: f"{ColorCodes.CODE_COLORS['string']}{m.group(0)}{ColorCodes.RESET}", code, flags=re.MULTILINE)
-    code = re.sub(numbers, lambda m: f"{ColorCodes.CODE_COLORS['number']}{m.group(0)}{ColorCodes.RESET}", code)
-    code = re.sub(comments, lambda m: f"{ColorCodes.CODE_COLORS['comment']}{m.group(0)}{ColorCodes.RESET}", code, flags=re.MULTILINE)
-    
+    if not _COLORS_ON:
+        return code
+    code = _GENERIC_STRINGS_RE.sub(_STRING_REPL, code)
+    code = _GENERIC_NUMBERS_RE.sub(_NUMBER_REPL, code)
+    code = _GENERIC_COMMENTS_RE.sub(_COMMENT_REPL, code)
+
     return code
 
 
@@ -402,23 +496,29 @@ def create_highlighted_text(text: str, bg_color: str = None, text_color: str = N
     """
     if not _color_config.is_enabled():
         return text
-        
+
+    # 默认配色的简单模式直接拼接预连接常量，不走f-string
+    if not fill_width and bg_color is None and text_color is None:
+        return _AI_HL_PREFIX + text + _RESET
+
     if bg_color is None:
         bg_color = ColorCodes.BG_AI_RESPONSE
     if text_color is None:
         text_color = ColorCodes.TEXT_AI_RESPONSE
-        
+
     reset = ColorCodes.RESET
-    
+
     if fill_width:
         # 填充模式：确保每行都有完整的背景色
         lines = text.split('\n')
         highlighted_lines = []
         
         for line in lines:
-            # 计算实际显示宽度（排除ANSI代码）
-            clean_line = re.sub(r'\x1b\[[0-9;]*m', '', line)
-            display_width = len(clean_line)
+            # 计算实际显示宽度（排除ANSI代码）；普通文本没有转义序列，直接取长度
+            if '\x1b' not in line:
+                display_width = len(line)
+            else:
+                display_width = len(_ANSI_STRIP_RE.sub('', line))
             
             # 填充到指定宽度
             padding = ' ' * max(0, fill_width - display_width)
@@ -465,36 +565,67 @@ def create_streaming_highlight_chunk(chunk: str, is_first_chunk: bool = False, i
     Returns:
         带高亮效果的chunk
     """
-    if not _color_config.is_enabled():
+    if not _COLORS_ON:
         return chunk
-        
-    bg_color = ColorCodes.BG_AI_RESPONSE
-    text_color = ColorCodes.TEXT_AI_RESPONSE
-    reset = ColorCodes.RESET
-    
-    # 为每个字符添加背景色，确保连续性
+
+    # 为每个字符添加背景色，确保连续性（前缀/重置都是模块级常量）
     if chunk == '\n':
         # 换行符需要特殊处理，确保到行尾都有背景色，然后换行后继续背景
-        return f"{' ' * 2}{reset}\n{bg_color}{text_color}"
-    elif chunk in [' ', '\t']:
+        return _NL_REPLACEMENT
+    elif chunk in (' ', '\t'):
         # 空白字符保持背景色
-        return f"{bg_color}{text_color}{chunk}"
+        return _AI_HL_PREFIX + chunk
     else:
-        # 普通字符，添加背景和文字色
-        if is_first_chunk:
-            # 第一个chunk开始背景色
-            formatted_chunk = f"{bg_color}{text_color}{chunk}"
-        else:
-            # 后续chunk，假设已经在背景色状态中
-            formatted_chunk = chunk
-            
+        # 普通字符：第一个chunk开启背景色，后续假设已在背景色状态中
+        formatted_chunk = _AI_HL_PREFIX + chunk if is_first_chunk else chunk
+
         # 如果是最后一个chunk，添加重置
         if is_last_chunk:
-            formatted_chunk += reset
-            
+            formatted_chunk += _RESET
+
         return formatted_chunk
 
 
+class StreamingHighlighter:
+    """
+    流式高亮输出缓冲器
+
+    逐字符 print(..., flush=True) 每个字符都触发一次 write 系统调用，
+    一次完整回复会产生上万次小写入。这里把高亮后的片段先积攒在内存里，
+    遇到换行、攒够一批或超过刷新间隔时合并成一次写出。
+    """
+
+    def __init__(self, flush_threshold: int = 32, flush_interval: float = 0.016):
+        self._buf = []
+        self._flush_threshold = flush_threshold
+        self._flush_interval = flush_interval
+        self._last_flush = time.monotonic()
+        self._started = False
+
+    def push(self, chunk: str) -> None:
+        """接收一个原始chunk，高亮后写入缓冲区，按需刷新"""
+        self._buf.append(create_streaming_highlight_chunk(chunk, is_first_chunk=not self._started))
+        self._started = True
+        if ('\n' in chunk
+                or len(self._buf) >= self._flush_threshold
+                or time.monotonic() - self._last_flush >= self._flush_interval):
+            self.flush()
+
+    def flush(self) -> None:
+        """把缓冲区内容一次性写到stdout"""
+        if self._buf:
+            sys.stdout.write(''.join(self._buf))
+            self._buf.clear()
+            sys.stdout.flush()
+        self._last_flush = time.monotonic()
+
+    def close(self) -> None:
+        """结束输出：补上颜色重置并清空缓冲区"""
+        if self._started and _COLORS_ON:
+            self._buf.append(ColorCodes.RESET)
+        self.flush()
+
+
 def create_response_border(width: int = 80, style: str = "ai") -> tuple:
     """
     创建AI回复的视觉边界
@@ -506,9 +637,16 @@ def create_response_border(width: int = 80, style: str = "ai") -> tuple:
     Returns:
         (顶部边界, 底部边界) 元组
     """
-    if not _color_config.is_enabled():
+    # 终端宽度基本不变，边界字符串用小缓存复用
+    return _create_response_border_cached(width, style, _color_config.is_enabled())
+
+
+@functools.lru_cache(maxsize=16)
+def _create_response_border_cached(width: int, style: str, enabled: bool) -> tuple:
+    """create_response_border 的带缓存实现"""
+    if not enabled:
         return ("", "")
-        
+
     if style == "ai":
         # AI回复样式：使用荧光笔背景色
         bg = ColorCodes.BG_AI_RESPONSE
@@ -544,56 +682,110 @@ def detect_and_format_code(text: str) -> str:
     """
     检测文本中的代码块并格式化
     支持Markdown风格的代码块：```language 和 ```
-    
+
     Args:
         text: 包含可能代码块的文本
-        
+
     Returns:
         格式化后的文本
     """
-    if not _color_config.is_enabled():
+    # 同一段回复在流式增长过程中会被反复格式化，缓存重复输入
+    return _detect_and_format_code_cached(text, _color_config.is_enabled())
+
+
+@functools.lru_cache(maxsize=256)
+def _detect_and_format_code_cached(text: str, enabled: bool) -> str:
+    """detect_and_format_code 的带缓存实现"""
+    if not enabled:
         return text
-        
-    import re
-    
-    # 匹配代码块模式：```language 代码内容 ```
-    code_block_pattern = r'```(\w*)\n?(.*?)\n?```'
-    
-    def replace_code_block(match):
-        language = match.group(1) or 'generic'
-        code_content = match.group(2)
-        
-        if not code_content.strip():
-            return match.group(0)  # 空代码块不处理
-            
-        # 格式化代码块
-        formatted_code = format_code_block(code_content, language)
-        
-        # 添加代码块标识和边框
-        header = f"{ColorCodes.GRAY}┌─ {language.upper() if language != 'generic' else 'CODE'} ─{'─' * (73 - len(language))}┐{ColorCodes.RESET}"
-        footer = f"{ColorCodes.GRAY}└{'─' * 80}┘{ColorCodes.RESET}"
-        
-        return f"\n{header}\n{formatted_code}\n{footer}\n"
-    
-    # 替换所有代码块
-    formatted_text = re.sub(code_block_pattern, replace_code_block, text, flags=re.DOTALL)
-    
-    # 处理行内代码（用反引号包围的代码）
-    inline_code_pattern = r'`([^`]+)`'
-    
-    def replace_inline_code(match):
-        code = match.group(1)
-        return f"{ColorCodes.CODE_COLORS['background']} {ColorCodes.CYAN}{code}{ColorCodes.RESET}{ColorCodes.CODE_COLORS['background']} {ColorCodes.RESET}"
-    
-    formatted_text = re.sub(inline_code_pattern, replace_inline_code, formatted_text)
-    
-    return formatted_text
+
+    # 没有反引号就不可能有代码块/行内代码，直接返回
+    if '`' not in text:
+        return text
+
+    return _scan_markdown_code(text)
+
+
+def _format_fenced_block(language: str, code_content: str) -> str:
+    """格式化一个围栏代码块，带语言标识边框"""
+    formatted_code = format_code_block(code_content, language)
+    header = f"{ColorCodes.GRAY}┌─ {language.upper() if language != 'generic' else 'CODE'} ─{'─' * (73 - len(language))}┐{ColorCodes.RESET}"
+    footer = f"{ColorCodes.GRAY}└{'─' * 80}┘{ColorCodes.RESET}"
+    return f"\n{header}\n{formatted_code}\n{footer}\n"
+
+
+def _scan_markdown_code(text: str) -> str:
+    """
+    手写扫描器：单次遍历定位 ```围栏块``` 与 `行内代码`
+
+    用 str.find 在 C 层定位反引号，避免 DOTALL 非贪婪正则在
+    畸形输入（引号/反引号不配对的AI输出）上的回溯风险。
+    """
+    out = []
+    pos = 0
+    n = len(text)
+    while True:
+        tick = text.find('`', pos)
+        if tick == -1:
+            out.append(text[pos:])
+            break
+        if text.startswith('```', tick):
+            # 围栏代码块：找闭合围栏
+            close = text.find('```', tick + 3)
+            if close == -1:
+                out.append(text[pos:])
+                break
+            seg = text[tick + 3:close]
+            # 语言标签：紧跟围栏的连续单词字符
+            i = 0
+            seg_len = len(seg)
+            while i < seg_len and (seg[i].isalnum() or seg[i] == '_'):
+                i += 1
+            language = seg[:i] or 'generic'
+            code_content = seg[i:]
+            if code_content.startswith('\n'):
+                code_content = code_content[1:]
+            if code_content.endswith('\n'):
+                code_content = code_content[:-1]
+            out.append(text[pos:tick])
+            if code_content.strip():
+                out.append(_format_fenced_block(language, code_content))
+            else:
+                out.append(text[tick:close + 3])  # 空代码块不处理
+            pos = close + 3
+        else:
+            # 行内代码：找配对的单个反引号
+            close = text.find('`', tick + 1)
+            if close == -1:
+                out.append(text[pos:])
+                break
+            code = text[tick + 1:close]
+            if code:
+                out.append(text[pos:tick])
+                out.append(f"{ColorCodes.CODE_COLORS['background']} {ColorCodes.CYAN}{code}{ColorCodes.RESET}{ColorCodes.CODE_COLORS['background']} {ColorCodes.RESET}")
+                pos = close + 1
+            else:
+                # 连续两个反引号，原样保留第一个继续扫描
+                out.append(text[pos:tick + 1])
+                pos = tick + 1
+    return ''.join(out)
+
+
+@functools.lru_cache(maxsize=8)
+def _separator_line(char: str, width: int) -> str:
+    """按 (字符, 宽度) 缓存的分隔线字符串"""
+    return char * width
+
+
+def print_separator(char: str = '-', width: int = 50) -> None:
+    """输出一条分隔线（字符串缓存复用，直接写stdout）"""
+    sys.stdout.write(_separator_line(char, width) + '\n')
 
 
 def demo() -> None:
     """演示所有颜色类型"""
     print("颜色输出演示:")
-    print("-" * 50)
+    print_separator()
     
     print_error("这是错误信息")
     print_success("这是成功信息")
@@ -603,11 +795,11 @@ def demo() -> None:
     print_debug("这是调试信息")
     print_progress("这是进度状态")
     
-    print("-" * 50)
+    print_separator()
     print("自定义前缀示例:")
     colored_print("自定义前缀消息", MessageType.INFO, prefix="[自定义]")
     
-    print("-" * 50)
+    print_separator()
     print(f"颜色支持状态: {'启用' if is_colors_enabled() else '禁用'}")
 
 
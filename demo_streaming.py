@@ -13,10 +13,14 @@ sys.path.insert(0, '/Users/leion/scripts')
 
 from color_utils import print_info, print_success, print_warning, colored_print, MessageType
 
+# 预计算的分隔线（避免每处重复构造相同字符串）
+_SEP60 = "=" * 60
+_DASH30 = "-" * 30
+
 def demo_streaming_vs_batch():
     """演示流式输出 vs 批量输出"""
     print_info("🎭 流式输出 vs 批量输出演示")
-    colored_print("=" * 60, MessageType.NORMAL)
+    colored_print(_SEP60, MessageType.NORMAL)
     
     print_info("\n📋 演示内容:")
     demos = [
@@ -30,12 +34,12 @@ def demo_streaming_vs_batch():
     for demo in demos:
         colored_print(f"  {demo}", MessageType.INFO)
     
-    colored_print("\n" + "=" * 60, MessageType.NORMAL)
+    colored_print("\n" + _SEP60, MessageType.NORMAL)
 
 def show_config_scenarios():
     """展示配置场景"""
     print_info("\n1️⃣ 配置场景展示")
-    print_info("-" * 30)
+    print_info(_DASH30)
     
     try:
         from ai_config import get_config
@@ -68,7 +72,7 @@ def show_config_scenarios():
 def demo_streaming_output():
     """演示流式输出"""
     print_info("\n2️⃣ 流式输出效果演示")
-    print_info("-" * 30)
+    print_info(_DASH30)
     
     print_info("💡 特点：AI回复逐字符实时显示，类似ChatGPT打字效果")
     print_info("🚀 命令：kimi \"请简单介绍一下流式输出的优势\"")
@@ -92,7 +96,7 @@ def demo_streaming_output():
 def demo_batch_output():
     """演示批量输出"""
     print_info("\n3️⃣ 批量输出效果演示")
-    print_info("-" * 30)
+    print_info(_DASH30)
     
     print_info("💡 特点：等待完整响应后一次性显示，适合自动化脚本")
     print_info("🚀 命令：kimi --batch \"请简单介绍一下批量输出的优势\"")
@@ -117,29 +121,33 @@ def demo_batch_output():
 def demo_commit_generation():
     """演示commit信息生成"""
     print_info("\n4️⃣ Commit信息生成演示")
-    print_info("-" * 30)
+    print_info(_DASH30)
     
     print_info("💡 特点：自动使用批量模式，确保稳定的自动化流程")
     print_info("🚀 命令：python3 ai_helper.py commit \"测试摘要\"")
     print_info("⏱️  即将演示commit信息生成...")
-    
+
     input("按回车键开始commit信息生成演示...")
-    
+
     try:
-        result = subprocess.run([
-            'python3', '/Users/leion/scripts/ai_helper.py', 
-            'commit', 
-            '博客文章: 流式输出功能.md (+100行, -5行) - 新增流式API调用, 添加实时输出效果, 优化用户体验'
-        ], capture_output=True, text=True, timeout=60)
-        
-        if result.returncode == 0:
-            commit_msg = result.stdout.strip()
+        # 直接在本进程调用AIHelper，省掉一次python3冷启动和IPC往返
+        from concurrent.futures import ThreadPoolExecutor
+        from ai_helper import AIHelper
+
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            future = executor.submit(
+                AIHelper().generate_commit_message,
+                '博客文章: 流式输出功能.md (+100行, -5行) - 新增流式API调用, 添加实时输出效果, 优化用户体验'
+            )
+            commit_msg = future.result(timeout=60)
+
+        if commit_msg:
             print_success("✅ Commit信息生成成功")
-            colored_print(f"生成的commit信息: {commit_msg}", MessageType.SUCCESS)
+            colored_print(f"生成的commit信息: {commit_msg.strip()}", MessageType.SUCCESS)
         else:
             print_warning("Commit信息生成失败")
-            
-    except subprocess.TimeoutExpired:
+
+    except TimeoutError:
         print_warning("演示超时")
     except Exception as e:
         print_warning(f"演示失败: {e}")
@@ -147,7 +155,7 @@ def demo_commit_generation():
 def show_usage_recommendations():
     """显示使用建议"""
     print_info("\n5️⃣ 使用建议")
-    print_info("-" * 30)
+    print_info(_DASH30)
     
     recommendations = [
         {
@@ -203,7 +211,7 @@ def main():
     show_usage_recommendations()
     
     # 总结
-    colored_print("\n" + "=" * 60, MessageType.NORMAL)
+    colored_print("\n" + _SEP60, MessageType.NORMAL)
     print_success("🎉 流式功能演示完成！")
     
     print_info("\n💡 核心优势:")
@@ -217,7 +225,7 @@ def main():
     for advantage in advantages:
         colored_print(f"  {advantage}", MessageType.SUCCESS)
     
-    colored_print("\n" + "=" * 60, MessageType.NORMAL)
+    colored_print("\n" + _SEP60, MessageType.NORMAL)
 
 if __name__ == "__main__":
     main()
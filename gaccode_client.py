@@ -1,13 +1,27 @@
+import functools
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+
+import numpy as np
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from rich.console import Console
 from rich.panel import Panel
 from rich.text import Text
 from datetime import datetime, timedelta, timezone
-from typing import List, Tuple, Dict
+from typing import List
 
 console = Console()
 s = requests.Session()
 s.headers.update({"User-Agent": "simple-client/0.3", "Accept": "application/json", "Content-Type": "application/json"})
+# 复用 keep-alive 连接 + 对临时网关错误自动重试
+s.mount("https://", HTTPAdapter(
+    pool_connections=4,
+    pool_maxsize=16,
+    max_retries=Retry(total=2, backoff_factor=0.2, status_forcelist=[502, 503, 504]),
+))
 
 def login() -> None:
     """执行登录并设置 Authorization 头。"""
@@ -35,11 +49,10 @@ def login() -> None:
 
 def fetch_balance():
     """获取余额与上限。"""
-    with console.status("[bold cyan]获取余额中...", spinner="dots"):
-        r = s.get("https://gaccode.com/api/credits/balance", timeout=5)
-        if r.status_code == 200:
-            data = r.json() or {}
-            return data.get("balance"), data.get("creditCap")
+    r = s.get("https://gaccode.com/api/credits/balance", timeout=5)
+    if r.status_code == 200:
+        data = r.json() or {}
+        return data.get("balance"), data.get("creditCap")
     return None, None
 
 
@@ -53,29 +66,52 @@ def fetch_history(hours: int = 24, limit: int = 200) -> List[dict]:
         "startTime": start_dt.isoformat(timespec="milliseconds").replace("+00:00", "Z"),
         "endTime": end_dt.isoformat(timespec="milliseconds").replace("+00:00", "Z"),
     }
-    with console.status("[bold magenta]获取积分历史中...", spinner="dots"):
-        r = s.get("https://gaccode.com/api/credits/history", params=params, timeout=10)
-        if r.status_code == 200:
-            try:
-                payload = r.json()
-                # 兼容 API 返回直接是数组或对象里含 history
-                if isinstance(payload, list):
-                    return payload
-                if isinstance(payload, dict):
-                    if isinstance(payload.get("history"), list):
-                        return payload["history"]
-                    # 有时可能用 data 字段
-                    if isinstance(payload.get("data"), list):
-                        return payload["data"]
-                    # 检查其他可能的字段
-                    for key in payload:
-                        if isinstance(payload[key], list):
-                            return payload[key]
-            except Exception:
-                pass
+    r = s.get("https://gaccode.com/api/credits/history", params=params, timeout=10)
+    if r.status_code == 200:
+        try:
+            payload = r.json()
+            # 兼容 API 返回直接是数组或对象里含 history
+            if isinstance(payload, list):
+                return payload
+            if isinstance(payload, dict):
+                if isinstance(payload.get("history"), list):
+                    return payload["history"]
+                # 有时可能用 data 字段
+                if isinstance(payload.get("data"), list):
+                    return payload["data"]
+                # 检查其他可能的字段
+                for key in payload:
+                    if isinstance(payload[key], list):
+                        return payload[key]
+        except Exception:
+            pass
     return []
 
 
+# 装有 ciso8601 时用其 C 实现解析；否则回退 stdlib fromisoformat
+try:
+    from ciso8601 import parse_datetime as _iso_parse
+    _ISO_ACCEPTS_Z = True  # ciso8601 原生支持 'Z' 后缀
+except ImportError:
+    _iso_parse = datetime.fromisoformat
+    # Python 3.11+ 的 fromisoformat 原生接受 'Z' 后缀，老版本才需要重拼字符串
+    _ISO_ACCEPTS_Z = sys.version_info >= (3, 11)
+
+
+@functools.lru_cache(maxsize=4096)
+def _parse_iso_timestamp(tstr: str) -> datetime | None:
+    """解析 ISO 格式时间串（带缓存：同一批历史里重复时间戳很常见）。"""
+    if not _ISO_ACCEPTS_Z and tstr.endswith("Z"):
+        tstr = tstr[:-1] + "+00:00"
+    try:
+        dt = _iso_parse(tstr)
+    except ValueError:
+        return None
+    if dt.tzinfo is None:
+        dt = dt.replace(tzinfo=timezone.utc)
+    return dt
+
+
 def parse_timestamp(item: dict) -> datetime | None:
     ts = None
     for key in ("createdAt", "timestamp", "time", "date"):
@@ -89,161 +125,160 @@ def parse_timestamp(item: dict) -> datetime | None:
             if ts > 1e12:
                 return datetime.fromtimestamp(ts / 1000, tz=timezone.utc)
             return datetime.fromtimestamp(ts, tz=timezone.utc)
-        tstr = str(ts)
-        if tstr.endswith("Z"):
-            tstr = tstr[:-1] + "+00:00"
-        dt = datetime.fromisoformat(tstr)
-        if dt.tzinfo is None:
-            dt = dt.replace(tzinfo=timezone.utc)
-        return dt
+        return _parse_iso_timestamp(str(ts))
     except Exception:
         return None
 
 
-def bucket_usage_refill(history: List[dict], interval_minutes: int = 10) -> Dict[str, List[float]]:
+@functools.lru_cache(maxsize=512)
+def _fmt_hm(epoch_min: int) -> str:
+    """把整分钟 epoch 格式化为本地 HH:MM（缓存避免重复 astimezone/strftime）。"""
+    return datetime.fromtimestamp(epoch_min * 60, tz=timezone.utc).astimezone().strftime("%H:%M")
+
+
+@dataclass
+class Buckets:
+    """按时间桶聚合后的积分变动（SoA：各列为连续 ndarray）。"""
+    bucket_epoch: np.ndarray  # int64，每桶起始时刻的 epoch 秒
+    usage: np.ndarray         # float64，消耗（>0）
+    refill: np.ndarray        # float64，补充（>0）
+    net: np.ndarray           # float64，净变化（±）
+    interval_minutes: int
+
+
+def bucket_usage_refill(history: List[dict], interval_minutes: int = 10) -> Buckets:
     """按 interval_minutes 桶化，返回 usage(消耗>0), refill(补充>0), net(净变化 可能为±)。"""
-    
+
     end_dt = datetime.now(timezone.utc)
     start_dt = end_dt - timedelta(hours=24)
     # 对齐起点到整 interval
-    interval = timedelta(minutes=interval_minutes)
     aligned_start = start_dt - timedelta(minutes=start_dt.minute % interval_minutes, seconds=start_dt.second, microseconds=start_dt.microsecond)
-    # 生成桶
-    buckets: List[datetime] = []
-    cur = aligned_start
-    while cur <= end_dt:
-        buckets.append(cur)
-        cur += interval
-    usage = [0.0] * len(buckets)
-    refill = [0.0] * len(buckets)
-    net = [0.0] * len(buckets)
-
-    def find_index(dt: datetime) -> int | None:
-        if dt < aligned_start or dt > end_dt:
-            return None
-        delta = dt - aligned_start
-        idx = int(delta.total_seconds() // (interval_minutes * 60))
-        if 0 <= idx < len(buckets):
-            return idx
-        return None
+    # 生成桶（epoch 秒的等差数列，替代逐个累加的 datetime 列表）
+    interval_sec = interval_minutes * 60
+    start_ts = aligned_start.timestamp()
+    end_ts = end_dt.timestamp()
+    n = int((end_ts - start_ts) // interval_sec) + 1
+    bucket_epoch = np.int64(start_ts) + np.arange(n, dtype=np.int64) * interval_sec
 
+    # 先一次性解析出 (秒偏移, 金额)，再交给 NumPy 向量化分桶
+    offsets: List[float] = []
+    amounts: List[float] = []
     for item in history:
         dt = parse_timestamp(item)
         if dt is None:
             continue
-        idx = find_index(dt)
-        if idx is None:
+        ts = dt.timestamp()
+        if ts < start_ts or ts > end_ts:
             continue
-        amt = item.get("amount")
         try:
-            amt = float(amt)
+            amt = float(item.get("amount"))
         except Exception:
             continue
-        if amt < 0:  # usage
-            usage[idx] += -amt
-        elif amt > 0:  # refill
-            refill[idx] += amt
-        net[idx] += amt
-
-    return {
-        "buckets": buckets,
-        "usage": usage,
-        "refill": refill,
-        "net": net,
-        "interval_minutes": interval_minutes,
-    }
+        offsets.append(ts - start_ts)
+        amounts.append(amt)
+
+    usage = np.zeros(n)
+    refill = np.zeros(n)
+    net = np.zeros(n)
+    if offsets:
+        idx = (np.fromiter(offsets, dtype=np.float64) // interval_sec).astype(np.intp)
+        amts = np.fromiter(amounts, dtype=np.float64)
+        valid = idx < n
+        idx = idx[valid]
+        amts = amts[valid]
+        # bincount 带权重即按桶求和，一次遍历替代逐条 Python 累加
+        net = np.bincount(idx, weights=amts, minlength=n)
+        usage = np.bincount(idx, weights=np.where(amts < 0, -amts, 0.0), minlength=n)
+        refill = np.bincount(idx, weights=np.where(amts > 0, amts, 0.0), minlength=n)
+
+    return Buckets(
+        bucket_epoch=bucket_epoch,
+        usage=usage,
+        refill=refill,
+        net=net,
+        interval_minutes=interval_minutes,
+    )
+
 
+# 跨渲染复用的画布缓冲：宽度按降采样上限预留，避免每帧重新分配
+_CANVAS = np.zeros((12, 200), dtype=np.uint8)
 
-def render_usage_refill_chart(bucket_data: Dict[str, List[float]]):
-    buckets: List[datetime] = bucket_data["buckets"]
-    usage: List[float] = bucket_data["usage"]
-    refill: List[float] = bucket_data["refill"]
-    net: List[float] = bucket_data["net"]
-    if not buckets:
+# 画布单元格编码 → Rich 标记的查表（bytes 常量，整行只拼一个 bytearray）
+_CELL_MARKUP_B = (
+    b" ",                         # 0 空白
+    "[dim]─[/dim]".encode(),      # 1 基线
+    "[red]▌[/red]".encode(),      # 2 usage
+    "[green]▐[/green]".encode(),  # 3 refill
+)
+
+
+def render_usage_refill_chart(bucket_data: Buckets):
+    bucket_epoch = bucket_data.bucket_epoch
+    usage = bucket_data.usage
+    refill = bucket_data.refill
+    net = bucket_data.net
+    n = len(bucket_epoch)
+    if n == 0:
         console.print("[yellow]无积分活动记录。[/yellow]")
         return
-    
-      
+
     # 降采样显示，确保在终端宽度内美观显示
-    n = len(buckets)
     display_width = min(80, console.width - 10)  # 留出边距
     if n > display_width:
-        # 等间隔采样
+        # 等间隔分段，reduceat 对每段 [indices[i], indices[i+1]) 求和，
+        # 一次 C 调用完成聚合（末段自动延伸到数组末尾）
         step = n / display_width
-        indices = [int(i * step) for i in range(display_width)]
-        # 对于采样，我们需要聚合数据而不是只取单个点
-        sampled_buckets = [buckets[i] for i in indices]
-        sampled_usage = []
-        sampled_refill = []
-        sampled_net = []
-        
-        for i in range(display_width):
-            start_idx = indices[i]
-            end_idx = indices[i+1] if i+1 < len(indices) else n
-            # 聚合这个范围内的数据
-            sampled_usage.append(sum(usage[start_idx:end_idx]))
-            sampled_refill.append(sum(refill[start_idx:end_idx]))
-            sampled_net.append(sum(net[start_idx:end_idx]))
-        
-        buckets = sampled_buckets
-        usage = sampled_usage
-        refill = sampled_refill  
-        net = sampled_net
-        n = len(buckets)
-      
+        indices = (np.arange(display_width) * step).astype(np.intp)
+        usage = np.add.reduceat(usage, indices)
+        refill = np.add.reduceat(refill, indices)
+        net = np.add.reduceat(net, indices)
+        bucket_epoch = bucket_epoch[indices]
+        n = display_width
+
     height = 12
     mid = height // 2
-    canvas = [[" " for _ in range(n)] for _ in range(height)]
-    max_usage = max(usage) if any(u > 0 for u in usage) else 1
-    max_refill = max(refill) if any(r > 0 for r in refill) else 1
-    
-    # 绘制零基线
-    for x in range(n):
-        canvas[mid][x] = "─"
-
-    # 绘制 usage (向下红色) 与 refill (向上绿色)
-    for x in range(n):
-        uh = int((usage[x] / max_usage) * (mid - 1)) if usage[x] > 0 else 0
-        rh = int((refill[x] / max_refill) * (mid - 1)) if refill[x] > 0 else 0
-        
-        # usage: from mid+1 downward
-        for y in range(mid + 1, min(height, mid + 1 + uh)):
-            canvas[y][x] = "▌"
-        # refill: from mid-1 upward  
-        for y in range(mid - 1, max(-1, mid - 1 - rh), -1):
-            canvas[y][x] = "▐"
-
-    # 创建图表内容
+    max_usage = usage.max() if (usage > 0).any() else 1
+    max_refill = refill.max() if (refill > 0).any() else 1
+
+    # 向量化填充画布：按列算出柱高后用布尔掩码一次性写入
+    # 单元格编码：0 空白 / 1 基线 / 2 usage / 3 refill
+    uh = np.where(usage > 0, (usage / max_usage * (mid - 1)).astype(np.intp), 0)
+    rh = np.where(refill > 0, (refill / max_refill * (mid - 1)).astype(np.intp), 0)
+    rows = np.arange(height)[:, None]
+    if height <= _CANVAS.shape[0] and n <= _CANVAS.shape[1]:
+        canvas = _CANVAS[:height, :n]
+        canvas.fill(0)
+    else:
+        canvas = np.zeros((height, n), dtype=np.uint8)
+    canvas[mid, :] = 1
+    canvas[(rows > mid) & (rows <= mid + uh)] = 2   # usage: 基线向下
+    canvas[(rows < mid) & (rows >= mid - rh)] = 3   # refill: 基线向上
+
+    # 创建图表内容：在 bytes 上逐格查表（迭代 bytes 得到原生 int，
+    # 避免逐格取 ndarray 标量和上千个中间 str 对象）
+    raw = canvas.tobytes()
     chart_lines = []
     for y in range(height):
-        line_parts = []
-        for x in range(n):
-            ch = canvas[y][x]
-            if ch == "▌":  # usage
-                line_parts.append("[red]▌[/red]")
-            elif ch == "▐":  # refill
-                line_parts.append("[green]▐[/green]")
-            elif ch == "─":
-                line_parts.append("[dim]─[/dim]")
-            else:
-                line_parts.append(ch)
-        chart_lines.append("".join(line_parts))
+        buf = bytearray()
+        for code in raw[y * n:(y + 1) * n]:
+            buf += _CELL_MARKUP_B[code]
+        chart_lines.append(buf.decode("utf-8"))
 
     # 时间轴
     time_axis = ""
     if n > 0:
-        start_time = buckets[0].astimezone().strftime('%H:%M')
-        end_time = buckets[-1].astimezone().strftime('%H:%M')
-        mid_time = buckets[n//2].astimezone().strftime('%H:%M')
+        start_time = _fmt_hm(int(bucket_epoch[0]) // 60)
+        end_time = _fmt_hm(int(bucket_epoch[-1]) // 60)
+        mid_time = _fmt_hm(int(bucket_epoch[n//2]) // 60)
         
         # 创建对齐的时间轴
         time_axis = start_time + " " * (n//2 - len(start_time)//2 - len(mid_time)//2) + mid_time
         time_axis += " " * (n - len(time_axis) - len(end_time)) + end_time
   
     # 统计信息
-    total_usage = sum(usage)
-    total_refill = sum(refill)
-    net_sum = sum(net)
+    total_usage = float(usage.sum())
+    total_refill = float(refill.sum())
+    net_sum = float(net.sum())
     
     # 组装图表面板
     chart_content = "\n".join(chart_lines)
@@ -259,11 +294,6 @@ def render_usage_refill_chart(bucket_data: Dict[str, List[float]]):
     ))
 
 
-def ascii_plot(*args, **kwargs):
-    """占位：旧函数保留名避免潜在引用"""
-    pass
-
-
 def render_balance_panel(balance, credit_cap):
     if balance is None or credit_cap is None or credit_cap == 0:
         console.print("[red]无法获取余额信息。[/red]")
@@ -284,10 +314,16 @@ def render_balance_panel(balance, credit_cap):
 
 def main():
     login()
-    history = fetch_history(24)
+    # 历史与余额是两个独立 GET，在 keep-alive 连接池上并发以重叠 RTT
+    # （spinner 收拢到这里：rich 同一时刻只允许一个 Live 状态）
+    with console.status("[bold magenta]获取积分数据中...", spinner="dots"):
+        with ThreadPoolExecutor(max_workers=2) as ex:
+            f_hist = ex.submit(fetch_history, 24)
+            f_bal = ex.submit(fetch_balance)
+            history = f_hist.result()
+            balance, credit_cap = f_bal.result()
     bucketed = bucket_usage_refill(history, interval_minutes=10)
     render_usage_refill_chart(bucketed)
-    balance, credit_cap = fetch_balance()
     render_balance_panel(balance, credit_cap)
 
 
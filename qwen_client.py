@@ -28,9 +28,26 @@ class QwenClient:
         
         self._session = requests.Session()
         self._setup_session()
+
+        # 请求体的静态骨架只构建一次，每次调用仅替换可变字段
+        self._req_skeleton = {
+            "model": self.model_name,
+            "input": None,
+            "parameters": None,
+        }
     
     def _setup_session(self):
-        """设置会话headers"""
+        """设置会话headers与连接池"""
+        from requests.adapters import HTTPAdapter
+        from urllib3.util.retry import Retry
+
+        # 复用 keep-alive 连接 + 对临时网关错误自动重试
+        self._session.mount("https://", HTTPAdapter(
+            pool_connections=4,
+            pool_maxsize=16,
+            max_retries=Retry(total=2, backoff_factor=0.2, status_forcelist=[502, 503, 504]),
+        ))
+
         self._session.headers.update({
             "Authorization": f"Bearer {self.api_key}",
             "Content-Type": "application/json",
@@ -47,24 +64,18 @@ class QwenClient:
                            stream: bool = False,
                            **kwargs) -> Dict[str, Any]:
         """构建千问API请求数据"""
-        data = {
-            "model": self.model_name,
-            "input": {
-                "messages": [
-                    {
-                        "role": "user", 
-                        "content": prompt
-                    }
-                ]
-            },
-            "parameters": {
-                "max_tokens": max_tokens,
-                "temperature": temperature,
-                "incremental_output": stream,  # 千问的流式参数
-                **kwargs
-            }
+        parameters = {
+            "max_tokens": max_tokens,
+            "temperature": temperature,
+            "incremental_output": stream,  # 千问的流式参数
         }
-        
+        if kwargs:  # 空 kwargs 是常态，跳过无谓的 splat 合并
+            parameters.update(kwargs)
+
+        data = self._req_skeleton.copy()
+        data["input"] = {"messages": [{"role": "user", "content": prompt}]}
+        data["parameters"] = parameters
+
         return data
     
     def _make_request(self, data: Dict[str, Any]) -> requests.Response:
@@ -115,24 +126,24 @@ class QwenClient:
             raise Exception(error_msg)
         
         try:
+            # 直接在 bytes 上处理 SSE 行，json.loads 接受 bytes，
+            # 省掉每个 chunk 先 decode 成 str 的中间对象
             for line in response.iter_lines():
-                if line:
-                    line_str = line.decode('utf-8')
-                    if line_str.startswith('data:'):
-                        data_str = line_str[5:].strip()  # 移除 'data:' 前缀
-                        
-                        if data_str == '[DONE]':
-                            break
-                        
-                        try:
-                            chunk_data = json.loads(data_str)
-                            if 'output' in chunk_data and 'text' in chunk_data['output']:
-                                content = chunk_data['output']['text']
-                                if content:
-                                    yield content
-                        except json.JSONDecodeError:
-                            continue  # 跳过无效的JSON行
-                            
+                if line and line.startswith(b'data:'):
+                    data_bytes = line[5:].strip()  # 移除 'data:' 前缀
+
+                    if data_bytes == b'[DONE]':
+                        break
+
+                    try:
+                        chunk_data = json.loads(data_bytes)
+                        if 'output' in chunk_data and 'text' in chunk_data['output']:
+                            content = chunk_data['output']['text']
+                            if content:
+                                yield content
+                    except json.JSONDecodeError:
+                        continue  # 跳过无效的JSON行
+
         except Exception as e:
             raise Exception(f"千问流式响应解析失败: {e}")
     
@@ -150,11 +161,8 @@ class QwenClient:
             response = self._make_request(data)
             
             if stream:
-                # 流式模式：收集所有内容
-                full_content = ""
-                for chunk in self._parse_stream_response(response):
-                    full_content += chunk
-                content = full_content
+                # 流式模式：收集所有内容（append+join 避免逐块字符串拼接的二次方开销）
+                content = "".join(self._parse_stream_response(response))
             else:
                 # 批量模式：解析完整响应
                 content = self._parse_response(response)
@@ -179,14 +187,14 @@ class QwenClient:
             data = self._build_request_data(prompt, max_tokens, temperature, True, **kwargs)
             response = self._make_request(data)
             
-            full_content = ""
+            parts = []
             for chunk in self._parse_stream_response(response):
-                full_content += chunk
+                parts.append(chunk)
                 if on_chunk:
                     on_chunk(chunk)
-            
+
             print_success("千问流式API调用成功")
-            return full_content
+            return "".join(parts)
             
         except Exception as e:
             print_error(f"千问流式API调用失败: {e}")
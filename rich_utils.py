@@ -5,20 +5,34 @@ Rich输出工具模块 - by 阮阮
 """
 
 from rich.console import Console
-from rich.markdown import Markdown
-from rich.syntax import Syntax
 from rich.panel import Panel
 from rich.text import Text
-from rich.table import Table
-from rich.columns import Columns
-from rich.progress import Progress, SpinnerColumn, TextColumn
-from rich.live import Live
-from rich.align import Align
-from rich.padding import Padding
-from rich.rule import Rule
-import time
 import re
 
+# 重量级 Rich 子模块（markdown/syntax/live/rule）按需在方法内导入，
+# 缩短只打印一两行提示的短命脚本的启动时间
+
+# Markdown语法检测：7 个模式合并成一个交替式，模块加载时编译一次，
+# 检测时只对文本做一趟扫描
+_MD_RE = re.compile(
+    "|".join(
+        f"(?:{p})"
+        for p in (
+            r'```\w*\n.*?\n```',  # 代码块
+            r'`[^`]+`',           # 行内代码
+            r'^\s*#{1,6}\s+',     # 标题
+            r'^\s*[-*+]\s+',      # 列表
+            r'\*\*[^*]+\*\*',     # 粗体
+            r'\*[^*]+\*',         # 斜体
+            r'^\s*\d+\.\s+',      # 有序列表
+        )
+    ),
+    re.MULTILINE | re.DOTALL,
+)
+
+# 所有 Markdown 模式都至少依赖其中一个字符；先做 C 级单趟扫描再进正则
+_MD_TRIGGERS = frozenset('`#*-+0123456789')
+
 
 class RichOutput:
     """Rich输出管理器"""
@@ -69,6 +83,7 @@ class RichOutput:
         # 检测内容中是否包含Markdown
         if self._contains_markdown(content):
             # 使用Markdown渲染
+            from rich.markdown import Markdown
             markdown_content = Markdown(content, code_theme="monokai")
             panel_content = markdown_content
         else:
@@ -91,22 +106,26 @@ class RichOutput:
     
     def stream_ai_response(self, content_chunks, title: str = "AI 回复"):
         """流式显示AI回复"""
+        from rich.live import Live
+
         # 创建实时更新的面板
         full_content = ""
-        
-        with Live(console=self.console, refresh_per_second=10) as live:
+
+        # 刷新率与渲染解耦：上游 chunk 到达节奏本身就有停顿，无需人为 sleep
+        with Live(console=self.console, refresh_per_second=24) as live:
             for chunk in content_chunks:
                 full_content += chunk
                 panel = self.create_ai_panel(full_content + "[dim]▊[/]", title)  # 添加光标效果
                 live.update(panel)
-                time.sleep(0.02)  # 模拟流式效果
-            
+
             # 最终版本，移除光标
             final_panel = self.create_ai_panel(full_content, title)
             live.update(final_panel)
     
     def display_code_block(self, code: str, language: str = "python", title: str = None):
         """显示代码块"""
+        from rich.syntax import Syntax
+
         syntax = Syntax(
             code, 
             language, 
@@ -129,6 +148,8 @@ class RichOutput:
     
     def display_markdown(self, markdown_text: str):
         """显示Markdown内容"""
+        from rich.markdown import Markdown
+
         md = Markdown(markdown_text, code_theme="monokai")
         self.console.print(md)
     
@@ -156,6 +177,8 @@ class RichOutput:
     
     def display_separator(self, title: str = None):
         """显示分隔符"""
+        from rich.rule import Rule
+
         if title:
             rule = Rule(title, style="bright_blue")
         else:
@@ -164,52 +187,65 @@ class RichOutput:
     
     def _contains_markdown(self, text: str) -> bool:
         """检测文本是否包含Markdown语法"""
-        markdown_patterns = [
-            r'```\w*\n.*?\n```',  # 代码块
-            r'`[^`]+`',           # 行内代码
-            r'^\s*#{1,6}\s+',     # 标题
-            r'^\s*[-*+]\s+',      # 列表
-            r'\*\*[^*]+\*\*',     # 粗体
-            r'\*[^*]+\*',         # 斜体
-            r'^\s*\d+\.\s+',      # 有序列表
-        ]
-        
-        for pattern in markdown_patterns:
-            if re.search(pattern, text, re.MULTILINE | re.DOTALL):
-                return True
-        return False
+        if len(text) < 10:
+            # 太短的文本按纯文本处理，省掉整趟正则扫描
+            return False
+        if _MD_TRIGGERS.isdisjoint(text):
+            # 纯散文回复一个触发字符都没有，直接短路
+            return False
+        return _MD_RE.search(text) is not None
     
     def create_streaming_callback(self, title: str = "AI 回复"):
         """创建流式输出回调函数 - 简化版本，避免重复显示"""
+        import time
+
         content = ""
         live = None
         initialized = False
-        
+        last_render = 0.0
+        min_interval = 1 / 12  # Live 更新节流到 ~12Hz，避免每个 chunk 都整面重排
+
+        def _streaming_panel(text: Text) -> Panel:
+            # 流式期间只渲染纯 Text，Markdown 解析推迟到 finish() 做一次
+            return Panel(
+                text,
+                title=f"[bold bright_blue]{title}[/]",
+                title_align="left",
+                border_style=self.ai_border_style,
+                padding=(1, 2),
+                expand=False
+            )
+
         def callback(chunk: str):
-            nonlocal content, live, initialized
+            nonlocal content, live, initialized, last_render
             content += chunk
-            
+
             # 只在首次调用时初始化Live
             if not initialized:
+                from rich.live import Live
+
                 # 清空一行为Live准备空间
                 self.console.print()
                 live = Live(
-                    self.create_ai_panel("[dim]正在分析...[/]", title),
+                    _streaming_panel(Text("正在分析...", style="dim")),
                     console=self.console,
                     refresh_per_second=5,  # 降低刷新率避免闪烁
                     transient=True
                 )
                 live.start()
                 initialized = True
-            
-            # 更新Live显示内容
-            if live:
+
+            # 更新Live显示内容（按时间窗合并多个 chunk 的更新）
+            now = time.monotonic()
+            if live and now - last_render >= min_interval:
                 try:
-                    panel = self.create_ai_panel(content + "[dim]▊[/]", title)
-                    live.update(panel)
+                    text = Text(content, style="white")
+                    text.append("▊", style="dim")
+                    live.update(_streaming_panel(text))
+                    last_render = now
                 except:
                     pass  # 忽略更新错误，避免崩溃
-        
+
         def finish():
             nonlocal content, live, initialized
             # 清理Live显示
@@ -306,8 +342,9 @@ def create_streaming_callback(title: str = "AI 回复"):
 # 向后兼容的空函数
 def colored_print(message: str, msg_type=None, **kwargs):
     """向后兼容函数"""
-    if msg_type and hasattr(msg_type, 'value'):
-        msg_type = msg_type.value.lower()
+    if msg_type is not None and not isinstance(msg_type, str):
+        # color_utils.MessageType 是 IntEnum，标签取 name；兜底取 value
+        msg_type = getattr(msg_type, 'name', str(getattr(msg_type, 'value', msg_type))).lower()
     
     if msg_type == 'error':
         print_error(message)
@@ -0,0 +1,176 @@
+#!/usr/bin/env python3
+"""
+智能助手模块 - by 阮阮
+基于向量库的本地知识库助手：文档入库、检索
+"""
+
+import codecs
+import mmap
+import os
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Optional
+
+from color_utils import print_error, print_info, print_success, print_warning
+from vector_manager import Document, get_vector_manager
+
+# 目录批量入库时认作文本的扩展名
+_TEXT_EXTS = {".md", ".txt", ".py", ".json", ".html", ".rst"}
+
+# 超过该大小的文件走 mmap + 增量解码，避免一次性读入两份缓冲
+_LARGE_FILE_BYTES = 1024 * 1024
+_MMAP_CHUNK = 1024 * 1024
+
+
+def _read_text(path: str) -> str:
+    """读取 UTF-8 文本文件；大文件用 mmap 分片增量解码"""
+    if os.path.getsize(path) <= _LARGE_FILE_BYTES:
+        with open(path, "r", encoding="utf-8") as f:
+            return f.read()
+
+    decoder = codecs.getincrementaldecoder("utf-8")()
+    parts = []
+    with open(path, "rb") as f:
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            for offset in range(0, len(mm), _MMAP_CHUNK):
+                # 增量解码器自己处理被切开的多字节字符
+                parts.append(decoder.decode(mm[offset:offset + _MMAP_CHUNK]))
+    parts.append(decoder.decode(b"", True))
+    return "".join(parts)
+
+
+class SmartAssistant:
+    """智能助手：封装向量库的常用操作"""
+
+    def __init__(self):
+        self.vector_manager = get_vector_manager()
+
+    def add_document_from_file(self, file_path: str) -> Optional[str]:
+        """把单个文本文件入库"""
+        try:
+            content = _read_text(file_path)
+        except Exception as e:
+            print_error(f"读取文件失败: {e}")
+            return None
+
+        title = os.path.basename(file_path)
+        doc_id = self.vector_manager.add_document(title, content, {"source": file_path})
+        if doc_id:
+            print_success(f"已入库: {title}")
+        return doc_id
+
+    def add_documents_from_dir(self, dir_path: str) -> List[str]:
+        """遍历目录批量入库：一次嵌入调用 + 单事务写入"""
+        items = []
+        for root, _dirs, files in os.walk(dir_path):
+            for name in files:
+                if os.path.splitext(name)[1].lower() not in _TEXT_EXTS:
+                    continue
+                path = os.path.join(root, name)
+                try:
+                    content = _read_text(path)
+                except Exception as e:
+                    print_warning(f"跳过 {path}: {e}")
+                    continue
+                items.append((name, content, {"source": path}))
+
+        if not items:
+            print_warning("目录下没有可入库的文本文件")
+            return []
+
+        ids = self.vector_manager.add_documents(items)
+        ok = [doc_id for doc_id in ids if doc_id]
+        print_success(f"批量入库完成: {len(ok)}/{len(items)} 篇")
+        return ok
+
+    @staticmethod
+    def _fuse_results(dense: List[Document], sparse: List[Document],
+                      top_k: int, k: int = 60) -> List[Document]:
+        """Reciprocal Rank Fusion：score = Σ 1/(k + rank)，按ID去重"""
+        scores = {}
+        docs = {}
+        for ranked in (dense, sparse):
+            for rank, doc in enumerate(ranked):
+                docs[doc.id] = doc
+                scores[doc.id] = scores.get(doc.id, 0.0) + 1.0 / (k + rank + 1)
+        order = sorted(scores, key=scores.get, reverse=True)[:top_k]
+        return [docs[doc_id] for doc_id in order]
+
+    def query_with_context(self, question: str, top_k: int = 3) -> Optional[str]:
+        """结合本地文档回答问题：稠密+关键词双路并发召回，RRF融合后交给大模型"""
+        with ThreadPoolExecutor(max_workers=2) as ex:
+            f_dense = ex.submit(self.vector_manager.search_similar, question, top_k * 2)
+            f_sparse = ex.submit(self.vector_manager.text_search, question, top_k * 2)
+            dense = [doc for doc, _score in f_dense.result()]
+            sparse = f_sparse.result()
+
+        docs = self._fuse_results(dense, sparse, top_k)
+        if not docs:
+            print_warning("没有找到相关文档")
+            return None
+
+        context_text = "\n\n".join(
+            f"文档{i + 1}: {doc.title}\n{doc.content}" for i, doc in enumerate(docs)
+        )
+        prompt = f"""基于以下上下文文档回答问题：
+
+上下文文档：
+{context_text}
+
+问题：{question}
+
+请基于上述文档内容回答问题，如果文档中没有相关信息，请说明。"""
+
+        try:
+            from ai_client import get_client
+            return get_client().chat_with_scenario(prompt, scenario="vector_query")
+        except Exception as e:
+            print_error(f"AI调用失败: {e}")
+            return None
+
+    def search_documents(self, keyword: str, limit: int = 10) -> List[Document]:
+        """关键词检索"""
+        return self.vector_manager.text_search(keyword, limit)
+
+    def list_documents(self, limit: int = 50) -> List[Document]:
+        """列出最近文档"""
+        return self.vector_manager.list_documents(limit)
+
+
+def main():
+    """命令行入口"""
+    if len(sys.argv) < 2:
+        print_info("用法:")
+        print_info("  python3 smart_assistant.py add <文件路径>")
+        print_info("  python3 smart_assistant.py --add-dir <目录路径>")
+        print_info("  python3 smart_assistant.py query <问题>")
+        print_info("  python3 smart_assistant.py search <关键词>")
+        print_info("  python3 smart_assistant.py list")
+        return
+
+    assistant = SmartAssistant()
+    command = sys.argv[1]
+
+    if command == "add" and len(sys.argv) > 2:
+        assistant.add_document_from_file(sys.argv[2])
+    elif command == "--add-dir" and len(sys.argv) > 2:
+        assistant.add_documents_from_dir(sys.argv[2])
+    elif command == "query" and len(sys.argv) > 2:
+        answer = assistant.query_with_context(sys.argv[2])
+        if answer:
+            print_info(answer)
+    elif command == "search" and len(sys.argv) > 2:
+        docs = assistant.search_documents(sys.argv[2])
+        if not docs:
+            print_warning("没有匹配的文档")
+        for doc in docs:
+            print_info(f"  {doc.id[:8]}  {doc.title}")
+    elif command == "list":
+        for doc in assistant.list_documents():
+            print_info(f"  {doc.id[:8]}  {doc.updated_at[:19]}  {doc.title}")
+    else:
+        print_error(f"未知命令: {command}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,638 @@
+#!/usr/bin/env python3
+"""
+向量库管理模块 - by 阮阮
+基于SQLite持久化文档，内存中维护归一化向量矩阵做相似度检索
+"""
+
+import functools
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy as np
+import requests
+
+from ai_config import get_config
+from color_utils import print_error, print_warning
+
+# HNSW 近邻索引为可选加速（pip install hnswlib）；缺失时走矩阵暴力扫描
+try:
+    import hnswlib
+except ImportError:
+    hnswlib = None
+
+# 文档量低于该值时 HNSW 的图遍历开销反而高于一次矩阵乘法
+_HNSW_MIN_DOCS = 1000
+
+# 热路径SQL集中定义，避免每次调用重新拼接字符串；
+# NULL AS embedding 占位保持行结构一致，同时跳过BLOB读取
+_DOC_COLUMNS_NO_VEC = "id, title, content, NULL AS embedding, metadata, created_at, updated_at"
+_SQL_INSERT_DOCUMENT = (
+    "INSERT INTO documents (id, title, content, embedding, metadata, created_at, updated_at) "
+    "VALUES (?, ?, ?, ?, ?, ?, ?)"
+)
+_SQL_GET_DOCUMENT = "SELECT * FROM documents WHERE id = ?"
+_SQL_LIST_DOCUMENTS = (
+    f"SELECT {_DOC_COLUMNS_NO_VEC} FROM documents ORDER BY updated_at DESC LIMIT ?"
+)
+_SQL_SEARCH_FTS = (
+    "SELECT d.id, d.title, d.content, NULL AS embedding, d.metadata, d.created_at, d.updated_at "
+    "FROM documents d JOIN documents_fts f ON d.rowid = f.rowid "
+    "WHERE documents_fts MATCH ? ORDER BY bm25(documents_fts) LIMIT ?"
+)
+_SQL_SEARCH_LIKE = (
+    f"SELECT {_DOC_COLUMNS_NO_VEC} FROM documents "
+    "WHERE title LIKE ? OR content LIKE ? ORDER BY updated_at DESC LIMIT ?"
+)
+_SQL_FETCH_BY_IDS = f"SELECT {_DOC_COLUMNS_NO_VEC} FROM documents WHERE id IN ({{}})"
+_SQL_UPDATE_DOCUMENT = (
+    "UPDATE documents SET title = ?, content = ?, embedding = ?, metadata = ?, updated_at = ? "
+    "WHERE id = ?"
+)
+_SQL_DELETE_DOCUMENT = "DELETE FROM documents WHERE id = ?"
+_SQL_CACHE_GET = "SELECT vec FROM embedding_cache WHERE hash = ?"
+_SQL_CACHE_PUT = "INSERT OR REPLACE INTO embedding_cache (hash, vec) VALUES (?, ?)"
+
+
+@dataclass
+class Document:
+    """向量库中的一篇文档"""
+    id: str
+    title: str
+    content: str
+    embedding: Optional[np.ndarray]
+    metadata: Dict[str, Any]
+    created_at: str
+    updated_at: str
+
+
+class VectorManager:
+    """向量库管理器
+
+    文档与向量持久化在 SQLite；检索走内存里的 L2 归一化 float32 矩阵，
+    一次矩阵乘法算出与全部文档的余弦相似度，避免逐行 Python 循环。
+    """
+
+    def __init__(self):
+        self.config = get_config()
+        vector_config = self.config.get("vector_config", {})
+
+        self.db_path = vector_config.get("db_path", "./vector_db")
+        self.embedding_model = vector_config.get("embedding_model", "text-embedding-v1")
+        self.embedding_dim = 384
+        self.chunk_size = vector_config.get("chunk_size", 1000)
+        self.chunk_overlap = vector_config.get("chunk_overlap", 100)
+        self.similarity_threshold = vector_config.get("similarity_threshold", 0.7)
+
+        # 嵌入API的地址和请求头在热路径上不变，构造一次反复复用
+        self._embed_url = self.config.api_url.replace("/chat/completions", "/embeddings")
+        self._embed_headers = {
+            "Authorization": f"Bearer {self.config.api_key}",
+            "Content-Type": "application/json",
+        }
+
+        os.makedirs(self.db_path, exist_ok=True)
+        # check_same_thread=False：混合召回会在线程池里并发读库
+        self.conn = sqlite3.connect(os.path.join(self.db_path, "documents.db"),
+                                    check_same_thread=False)
+        self.conn.row_factory = sqlite3.Row  # 按列名取值，列序调整不再破坏取数代码
+        self._write_lock = threading.Lock()
+        self._apply_pragmas()
+        self._init_database()
+        self._migrate_embeddings()
+
+        # 内存检索结构：_matrix 第 i 行是 _ids[i] 文档单位向量的 int8 量化，
+        # _scales[i] 为该行的反量化系数（int8 比 float32 省 4 倍内存带宽）
+        self._ids: List[str] = []
+        self._matrix = np.empty((0, self.embedding_dim), dtype=np.int8)
+        self._scales = np.empty((0,), dtype=np.float32)
+        self._load_matrix()
+        self._hnsw = None
+        self._rebuild_hnsw()
+
+        # 单条文本路径的进程内LRU，键为内容哈希；磁盘缓存见 embedding_cache 表
+        self._embed_cached = functools.lru_cache(maxsize=4096)(self._embed_one)
+
+    def _apply_pragmas(self) -> None:
+        """连接级性能参数：WAL 允许读写并发，NORMAL 降低 fsync 频率，
+        mmap 读路径省掉页缓存拷贝"""
+        try:
+            for pragma in (
+                "PRAGMA journal_mode=WAL",
+                "PRAGMA synchronous=NORMAL",
+                "PRAGMA temp_store=MEMORY",
+                "PRAGMA mmap_size=268435456",
+                "PRAGMA cache_size=-65536",
+            ):
+                self.conn.execute(pragma)
+        except sqlite3.OperationalError as e:
+            print_warning(f"SQLite pragma 设置失败: {e}")
+
+    def _init_database(self) -> None:
+        """初始化数据库表结构"""
+        self.conn.execute("""
+            CREATE TABLE IF NOT EXISTS documents (
+                id TEXT PRIMARY KEY,
+                title TEXT NOT NULL,
+                content TEXT NOT NULL,
+                embedding BLOB,
+                metadata TEXT,
+                created_at TEXT NOT NULL,
+                updated_at TEXT NOT NULL
+            )
+        """)
+        # 向量磁盘缓存：按内容哈希存 float32 字节串，进程重启后不用重新嵌入
+        self.conn.execute("""
+            CREATE TABLE IF NOT EXISTS embedding_cache (
+                hash TEXT PRIMARY KEY,
+                vec BLOB NOT NULL
+            )
+        """)
+        self.conn.commit()
+
+        # FTS5 全文索引（trigram 分词，中文子串查询可用），触发器随主表同步；
+        # 环境不支持时回退 LIKE 扫描
+        self._fts_enabled = False
+        try:
+            self.conn.executescript("""
+                CREATE VIRTUAL TABLE IF NOT EXISTS documents_fts USING fts5(
+                    title, content, content='documents', content_rowid='rowid',
+                    tokenize='trigram'
+                );
+                CREATE TRIGGER IF NOT EXISTS documents_fts_ai AFTER INSERT ON documents BEGIN
+                    INSERT INTO documents_fts(rowid, title, content)
+                    VALUES (new.rowid, new.title, new.content);
+                END;
+                CREATE TRIGGER IF NOT EXISTS documents_fts_ad AFTER DELETE ON documents BEGIN
+                    INSERT INTO documents_fts(documents_fts, rowid, title, content)
+                    VALUES ('delete', old.rowid, old.title, old.content);
+                END;
+                CREATE TRIGGER IF NOT EXISTS documents_fts_au AFTER UPDATE ON documents BEGIN
+                    INSERT INTO documents_fts(documents_fts, rowid, title, content)
+                    VALUES ('delete', old.rowid, old.title, old.content);
+                    INSERT INTO documents_fts(rowid, title, content)
+                    VALUES (new.rowid, new.title, new.content);
+                END;
+            """)
+            # 触发器建立前已有的行可能缺索引：数量不一致时重建一次
+            n_docs = self.conn.execute("SELECT COUNT(*) FROM documents").fetchone()[0]
+            n_fts = self.conn.execute("SELECT COUNT(*) FROM documents_fts").fetchone()[0]
+            if n_fts != n_docs:
+                self.conn.execute("INSERT INTO documents_fts(documents_fts) VALUES('rebuild')")
+                self.conn.commit()
+            self._fts_enabled = True
+        except sqlite3.OperationalError as e:
+            print_warning(f"FTS5 不可用，关键词检索回退 LIKE 扫描: {e}")
+
+    def _migrate_embeddings(self) -> None:
+        """把历史的JSON文本向量一次性转为 float32 BLOB"""
+        cursor = self.conn.cursor()
+        cursor.execute(
+            "SELECT id, embedding FROM documents "
+            "WHERE embedding IS NOT NULL AND typeof(embedding) = 'text'"
+        )
+        converted = []
+        for doc_id, raw in cursor.fetchall():
+            try:
+                vec = np.asarray(json.loads(raw), dtype=np.float32)
+            except Exception:
+                continue
+            converted.append((sqlite3.Binary(vec.tobytes()), doc_id))
+        if converted:
+            self.conn.executemany("UPDATE documents SET embedding = ? WHERE id = ?", converted)
+            self.conn.commit()
+
+    def _load_matrix(self) -> None:
+        """把全部向量一次性加载为归一化矩阵（只取 id 和 embedding 两列）"""
+        cursor = self.conn.cursor()
+        cursor.execute("SELECT id, embedding FROM documents WHERE embedding IS NOT NULL")
+        ids: List[str] = []
+        vecs: List[np.ndarray] = []
+        for row in cursor.fetchall():
+            try:
+                vec = np.frombuffer(row[1], dtype=np.float32)
+            except Exception:
+                continue
+            if vecs and len(vec) != len(vecs[0]):
+                continue
+            ids.append(row[0])
+            vecs.append(vec)
+
+        self._ids = ids
+        if vecs:
+            matrix = np.asarray(vecs, dtype=np.float32)
+            self.embedding_dim = int(matrix.shape[1])
+            norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+            norms[norms == 0] = 1.0
+            matrix /= norms
+            # 整体量化：逐行 scale = max|v|/127
+            scales = np.abs(matrix).max(axis=1) / 127.0
+            scales[scales == 0] = 1.0
+            self._matrix = np.round(matrix / scales[:, None]).astype(np.int8)
+            self._scales = scales.astype(np.float32)
+        else:
+            self._matrix = np.empty((0, self.embedding_dim), dtype=np.int8)
+            self._scales = np.empty((0,), dtype=np.float32)
+
+    @staticmethod
+    def _generate_id(title: str, content: str) -> str:
+        """根据标题+内容生成文档ID（blake2b 比 md5 快且同内容不同标题不再撞ID）"""
+        h = hashlib.blake2b(digest_size=16)
+        h.update(title.encode("utf-8"))
+        h.update(b"\0")  # 分隔符防止 ("ab","c") 与 ("a","bc") 同ID
+        h.update(content.encode("utf-8"))
+        return h.hexdigest()
+
+    @staticmethod
+    def _text_hash(text: str) -> str:
+        """文本内容哈希（blake2b，缓存键）"""
+        return hashlib.blake2b(text.encode("utf-8"), digest_size=16).hexdigest()
+
+    def _fallback_embedding(self, text: str) -> List[float]:
+        """离线兜底：哈希种子的确定性伪随机向量（仅保证同文同向量）"""
+        rng = np.random.default_rng(abs(hash(text)) % (2 ** 32))
+        return rng.standard_normal(self.embedding_dim).tolist()
+
+    def _embed_remote(self, texts: List[str]) -> Optional[List[List[float]]]:
+        """调用嵌入API，一次请求批量文本；失败返回 None 交给兜底"""
+        try:
+            resp = requests.post(
+                self._embed_url,
+                headers=self._embed_headers,
+                json={"model": self.embedding_model, "input": texts},
+                timeout=self.config.timeout,
+            )
+            if resp.status_code != 200:
+                return None
+            data = resp.json().get("data", [])
+            if len(data) != len(texts):
+                return None
+            data.sort(key=lambda d: d.get("index", 0))  # 接口不保证顺序
+            return [d["embedding"] for d in data]
+        except Exception as e:
+            print_warning(f"嵌入API调用失败，使用离线兜底向量: {e}")
+            return None
+
+    def _embed_batch(self, texts: List[str]) -> List[List[float]]:
+        """批量获取向量：磁盘缓存命中直接返回，未命中合并为一次API调用"""
+        hashes = [self._text_hash(t) for t in texts]
+        cached: Dict[str, List[float]] = {}
+        cursor = self.conn.cursor()
+        for h in set(hashes):
+            cursor.execute(_SQL_CACHE_GET, (h,))
+            row = cursor.fetchone()
+            if row is not None:
+                cached[h] = np.frombuffer(row[0], dtype=np.float32).tolist()
+
+        miss_idx = [i for i, h in enumerate(hashes) if h not in cached]
+        if miss_idx:
+            miss_texts = [texts[i] for i in miss_idx]
+            vecs = self._embed_remote(miss_texts)
+            if vecs is None:
+                vecs = [self._fallback_embedding(t) for t in miss_texts]
+            with self._write_lock:
+                for i, vec in zip(miss_idx, vecs):
+                    h = hashes[i]
+                    # 入库前就归一化：后续余弦相似度退化为纯点积
+                    unit = np.asarray(vec, dtype=np.float32)
+                    unit /= np.linalg.norm(unit) or 1.0
+                    cached[h] = unit.tolist()
+                    self.conn.execute(_SQL_CACHE_PUT, (h, sqlite3.Binary(unit.tobytes())))
+                self.conn.commit()
+
+        return [cached[h] for h in hashes]
+
+    def _embed_one(self, text_hash: str, text: str) -> Tuple[float, ...]:
+        # text_hash 只为参与LRU键；真正的查找/调用都走批量路径
+        return tuple(self._embed_batch([text])[0])
+
+    def _get_embedding(self, text: str) -> List[float]:
+        """获取单条文本向量（内存LRU→磁盘缓存→批量API 三级）"""
+        return list(self._embed_cached(self._text_hash(text), text))
+
+    def _unit_vector(self, embedding: List[float]) -> np.ndarray:
+        """转为 float32 单位向量。新向量在 _embed_batch 已归一化，
+        这里是幂等兜底，兼容升级前缓存里的未归一化旧数据"""
+        vec = np.asarray(embedding, dtype=np.float32)
+        vec /= np.linalg.norm(vec) or 1.0
+        return vec
+
+    @staticmethod
+    def _quantize(vec: np.ndarray) -> Tuple[np.ndarray, np.float32]:
+        """把 float 向量量化为 (int8向量, 反量化系数)"""
+        scale = float(np.abs(vec).max()) / 127.0
+        if scale == 0:
+            scale = 1.0
+        return np.round(vec / scale).astype(np.int8), np.float32(scale)
+
+    def _matrix_append(self, doc_id: str, embedding: List[float]) -> None:
+        unit = self._unit_vector(embedding)
+        if unit.shape[0] != self._matrix.shape[1]:
+            if self._matrix.shape[0] == 0:
+                # 真实嵌入模型的维度与默认值不同时，以首条向量为准
+                self.embedding_dim = int(unit.shape[0])
+                self._matrix = np.empty((0, self.embedding_dim), dtype=np.int8)
+            else:
+                print_warning(f"向量维度不一致（{unit.shape[0]} != {self._matrix.shape[1]}），跳过索引")
+                return
+        q8, scale = self._quantize(unit)
+        self._matrix = np.vstack([self._matrix, q8[None, :]])
+        self._scales = np.append(self._scales, scale)
+        self._ids.append(doc_id)
+        if self._hnsw is not None:
+            try:
+                self._hnsw.add_items(unit[None, :], np.asarray([len(self._ids) - 1]))
+            except Exception:
+                self._rebuild_hnsw()
+        elif len(self._ids) >= _HNSW_MIN_DOCS:
+            self._rebuild_hnsw()
+
+    def _matrix_remove(self, doc_id: str) -> None:
+        try:
+            i = self._ids.index(doc_id)
+        except ValueError:
+            return
+        self._ids.pop(i)
+        self._matrix = np.delete(self._matrix, i, axis=0)
+        self._scales = np.delete(self._scales, i)
+        # 行号整体前移，HNSW 的标签随之失效，直接重建
+        self._rebuild_hnsw()
+
+    def _rebuild_hnsw(self) -> None:
+        """（重）建HNSW索引；文档量小或缺少 hnswlib 时保持 None 走暴力扫描"""
+        self._hnsw = None
+        n = len(self._ids)
+        if hnswlib is None or n < _HNSW_MIN_DOCS:
+            return
+        try:
+            index = hnswlib.Index(space="cosine", dim=self.embedding_dim)
+            index.init_index(max_elements=max(n * 2, 1024), ef_construction=200, M=16)
+            # HNSW 需要浮点向量：从 int8 反量化（近似单位向量）
+            index.add_items(self._matrix.astype(np.float32) * self._scales[:, None], np.arange(n))
+            index.set_ef(64)
+            self._hnsw = index
+        except Exception as e:
+            print_warning(f"HNSW索引构建失败，回退暴力扫描: {e}")
+            self._hnsw = None
+
+    def _chunk_text(self, text: str) -> List[str]:
+        """按字符滑窗切块：窗口 chunk_size，步长 chunk_size - chunk_overlap。
+        线性切片，避免按词重组字符串；overlap >= size 时步长退化为 1 有下限保护"""
+        if len(text) <= self.chunk_size:
+            return [text]
+        step = max(1, self.chunk_size - self.chunk_overlap)
+        chunks = [text[i:i + self.chunk_size] for i in range(0, len(text), step)]
+        return [c for c in chunks if c.strip()]
+
+    def _expand_chunks(self, items: List[Tuple]) -> List[Tuple]:
+        """把超长文档展开成多条分块记录，metadata 带共同的 parent_id"""
+        expanded: List[Tuple] = []
+        for item in items:
+            title, content = item[0], item[1]
+            metadata = dict(item[2]) if len(item) > 2 and item[2] else {}
+            chunks = self._chunk_text(content)
+            if len(chunks) <= 1:
+                expanded.append((title, content, metadata or None))
+                continue
+            parent_id = self._generate_id(title, content)
+            for j, chunk in enumerate(chunks):
+                chunk_meta = dict(metadata)
+                chunk_meta["parent_id"] = parent_id
+                chunk_meta["chunk_index"] = j
+                expanded.append((f"{title} [{j + 1}/{len(chunks)}]", chunk, chunk_meta))
+        return expanded
+
+    def add_documents(self, items: List[Tuple]) -> List[Optional[str]]:
+        """批量添加文档：items 为 (title, content[, metadata]) 元组列表。
+        超长内容先切块，所有文本合并为一次嵌入调用，
+        INSERT 走单事务 executemany（fsync 只发生一次）"""
+        if not items:
+            return []
+        try:
+            items = self._expand_chunks(items)
+            embeddings = self._embed_batch([item[1] for item in items])
+            now = datetime.now().isoformat()
+            ids: List[Optional[str]] = []
+            rows = []
+            pending = []  # (doc_id, embedding)，事务成功后再进内存索引
+            seen = set()
+            for item, embedding in zip(items, embeddings):
+                title, content = item[0], item[1]
+                metadata = item[2] if len(item) > 2 else None
+                doc_id = self._generate_id(title, content)
+                ids.append(doc_id)
+                if doc_id in seen or self.get_document(doc_id) is not None:
+                    continue
+                seen.add(doc_id)
+                rows.append((
+                    doc_id, title, content,
+                    sqlite3.Binary(np.asarray(embedding, dtype=np.float32).tobytes()),
+                    json.dumps(metadata or {}, ensure_ascii=False), now, now,
+                ))
+                pending.append((doc_id, embedding))
+
+            if rows:
+                with self._write_lock:
+                    with self.conn:  # 单事务提交
+                        self.conn.executemany(_SQL_INSERT_DOCUMENT, rows)
+                    for doc_id, embedding in pending:
+                        self._matrix_append(doc_id, embedding)
+            return ids
+        except Exception as e:
+            print_error(f"批量添加文档失败: {e}")
+            return [None] * len(items)
+
+    def add_document(self, title: str, content: str,
+                     metadata: Optional[Dict[str, Any]] = None) -> Optional[str]:
+        """添加单篇文档，返回文档ID"""
+        return self.add_documents([(title, content, metadata)])[0]
+
+    def get_document(self, doc_id: str) -> Optional[Document]:
+        """按ID读取单篇文档"""
+        cursor = self.conn.cursor()
+        cursor.execute(_SQL_GET_DOCUMENT, (doc_id,))
+        row = cursor.fetchone()
+        if row is None:
+            return None
+        return self._row_to_document(row, with_embedding=True)
+
+    def _row_to_document(self, row, *, with_embedding: bool = False) -> Document:
+        """行→Document 的唯一出口；默认不反序列化向量，
+        只有明确要用向量的调用方（get_document）才付这笔解码开销"""
+        return Document(
+            id=row["id"],
+            title=row["title"],
+            content=row["content"],
+            embedding=np.frombuffer(row["embedding"], dtype=np.float32)
+            if with_embedding and row["embedding"] is not None else None,
+            metadata=json.loads(row["metadata"]) if row["metadata"] else {},
+            created_at=row["created_at"],
+            updated_at=row["updated_at"],
+        )
+
+    def update_document(self, doc_id: str, title: Optional[str] = None,
+                        content: Optional[str] = None,
+                        metadata: Optional[Dict[str, Any]] = None) -> bool:
+        """更新文档；内容变化时重新生成向量"""
+        doc = self.get_document(doc_id)
+        if doc is None:
+            return False
+        try:
+            new_title = title if title is not None else doc.title
+            new_content = content if content is not None else doc.content
+            new_metadata = metadata if metadata is not None else doc.metadata
+
+            embedding = doc.embedding
+            if content is not None and content != doc.content:
+                embedding = self._get_embedding(new_content)
+
+            with self._write_lock:
+                self.conn.execute(
+                    _SQL_UPDATE_DOCUMENT,
+                    (new_title, new_content,
+                     sqlite3.Binary(np.asarray(embedding, dtype=np.float32).tobytes())
+                     if embedding is not None else None,
+                     json.dumps(new_metadata, ensure_ascii=False),
+                     datetime.now().isoformat(), doc_id),
+                )
+                self.conn.commit()
+                if embedding is not None:
+                    self._matrix_remove(doc_id)
+                    self._matrix_append(doc_id, embedding)
+            return True
+        except Exception as e:
+            print_error(f"更新文档失败: {e}")
+            return False
+
+    def delete_document(self, doc_id: str) -> bool:
+        """删除文档"""
+        try:
+            with self._write_lock:
+                cursor = self.conn.execute(_SQL_DELETE_DOCUMENT, (doc_id,))
+                self.conn.commit()
+                if cursor.rowcount > 0:
+                    self._matrix_remove(doc_id)
+                    return True
+            return False
+        except Exception as e:
+            print_error(f"删除文档失败: {e}")
+            return False
+
+    def list_documents(self, limit: int = 50) -> List[Document]:
+        """按更新时间倒序列出文档"""
+        cursor = self.conn.cursor()
+        # 列表场景用不到向量，embedding 列以 NULL 占位省去读取与反序列化
+        cursor.execute(_SQL_LIST_DOCUMENTS, (limit,))
+        return [self._row_to_document(row) for row in cursor.fetchall()]
+
+    def text_search(self, keyword: str, limit: int = 10) -> List[Document]:
+        """关键词检索：优先走 FTS5 倒排索引（BM25 排序），否则 LIKE 扫描"""
+        cursor = self.conn.cursor()
+        # trigram 分词最短匹配 3 个字符；更短的关键词只能 LIKE
+        if self._fts_enabled and len(keyword) >= 3:
+            try:
+                quoted = '"' + keyword.replace('"', '""') + '"'  # 按短语匹配，屏蔽 FTS 语法
+                cursor.execute(_SQL_SEARCH_FTS, (quoted, limit))
+                return [self._row_to_document(row) for row in cursor.fetchall()]
+            except sqlite3.OperationalError:
+                pass  # 异常查询串回退 LIKE
+
+        pattern = f"%{keyword}%"
+        cursor.execute(_SQL_SEARCH_LIKE, (pattern, pattern, limit))
+        return [self._row_to_document(row) for row in cursor.fetchall()]
+
+    def search_similar(self, query: str, top_k: int = 5) -> List[Tuple[Document, float]]:
+        """相似度检索：一次矩阵乘法算出对全部文档的余弦分数再取 top_k"""
+        if self._matrix.shape[0] == 0:
+            return []
+        try:
+            q = self._unit_vector(self._get_embedding(query))
+            k = min(top_k, len(self._ids))
+            if self._hnsw is not None:
+                # HNSW：期望对数复杂度的近邻查询（cosine 距离 = 1 - 相似度）
+                labels, dists = self._hnsw.knn_query(q[None, :], k=k)
+                candidates = [(int(i), 1.0 - float(d)) for i, d in zip(labels[0], dists[0])]
+            else:
+                # int8 点积在 int32 上累加，再乘两端的反量化系数还原余弦分数
+                q8, q_scale = self._quantize(q)
+                raw = self._matrix.astype(np.int32) @ q8.astype(np.int32)
+                scores = raw.astype(np.float32) * self._scales * float(q_scale)
+                # argpartition 先 O(n) 选出前 k，再只对这 k 个排序
+                part = np.argpartition(-scores, k - 1)[:k]
+                order = part[np.argsort(-scores[part])]
+                candidates = [(int(i), float(scores[i])) for i in order]
+
+            # 过阈值的候选一次 IN 查询批量取回，替代逐条 get_document
+            keep = [(i, score) for i, score in candidates
+                    if score >= self.similarity_threshold]
+            if not keep:
+                return []
+            cand_ids = [self._ids[i] for i, _ in keep]
+            placeholders = ",".join("?" * len(cand_ids))
+            cursor = self.conn.execute(_SQL_FETCH_BY_IDS.format(placeholders), cand_ids)
+            by_id = {row["id"]: self._row_to_document(row) for row in cursor.fetchall()}
+
+            # 同一 parent 的多个分块只保留相似度最高的一块
+            best: Dict[str, Tuple[Document, float]] = {}
+            for (_i, score), doc_id in zip(keep, cand_ids):
+                doc = by_id.get(doc_id)
+                if doc is None:
+                    continue
+                key = doc.metadata.get("parent_id", doc.id)
+                if key not in best or score > best[key][1]:
+                    best[key] = (doc, score)
+            return sorted(best.values(), key=lambda pair: -pair[1])
+        except Exception as e:
+            print_error(f"相似度检索失败: {e}")
+            return []
+
+    def count_documents(self) -> int:
+        """文档总数"""
+        cursor = self.conn.cursor()
+        cursor.execute("SELECT COUNT(*) FROM documents")
+        return cursor.fetchone()[0]
+
+    def close(self) -> None:
+        """关闭数据库连接"""
+        try:
+            self.conn.close()
+        except Exception:
+            pass
+
+
+# 全局向量库实例
+_global_vector_manager: Optional[VectorManager] = None
+
+
+def get_vector_manager() -> VectorManager:
+    """获取全局向量库实例"""
+    global _global_vector_manager
+    if _global_vector_manager is None:
+        _global_vector_manager = VectorManager()
+    return _global_vector_manager
+
+
+if __name__ == "__main__":
+    # 测试向量库
+    print("测试向量库...")
+    manager = get_vector_manager()
+
+    doc_id = manager.add_document(
+        "流式输出简介",
+        "流式输出让AI回复逐字符实时显示，带来类似ChatGPT的交互体验。",
+        {"source": "demo"},
+    )
+    print(f"文档ID: {doc_id}")
+    print(f"文档总数: {manager.count_documents()}")
+
+    results = manager.search_similar("什么是流式输出", top_k=3)
+    for doc, score in results:
+        print(f"  {score:.3f}  {doc.title}")
+
+    if not results:
+        print_warning("无相似结果（占位向量仅用于联调）")